@@ -1,9 +1,12 @@
 import os
+import sys
 import pandas as pd
 import streamlit as st
-import FinanceDataReader as fdr
 from streamlit_lightweight_charts import renderLightweightCharts
 
+sys.path.append("..")
+from share.store import get_db, reweight, weight_vector
+
 st.set_page_config(layout="wide")
 
 # =========================
@@ -19,18 +22,16 @@ oi_dir = st.sidebar.text_input(
     value=r"C:\Users\Jeon\sesac-miniProject\완료\daily_outputs"
 )
 
-# --- (추가) 가중치=1 OI 파일 매핑: 파일명만 맞추면 됨 ---
-SAMSUNG_OI_FILES = {
-    "조회수(view)":   "samsung_view_1.csv",
-    "게시글(post)":   "samsung_post_1.csv",
-    "댓글(comment)":  "samsung_comment_1.csv",
-    "좋아요(like)":   "samsung_like_1.csv",
-}
-HYNIX_OI_FILES = {
-    "조회수(view)":   "hynix_view_1.csv",
-    "게시글(post)":   "hynix_post_1.csv",
-    "댓글(comment)":  "hynix_comment_1.csv",
-    "좋아요(like)":   "hynix_like_1.csv",
+# --- 종목별 일별 집계(z-score 포함) 파일 하나에서 가중치별 OI 를 바로 계산 ---
+# (예전: samsung_view_1.csv, samsung_post_1.csv ... 가중치마다 파일을 따로 만들었음)
+SAMSUNG_DAILY_FILE = "삼성_일별집계_OI포함_2025-01-14_2026-01-14.csv"
+HYNIX_DAILY_FILE = "하이닉스_일별집계_OI포함_2025-01-14_2026-01-14.csv"
+
+OI_WEIGHTINGS = {
+    "조회수(view)":   "view_1",
+    "게시글(post)":   "post_1",
+    "댓글(comment)":  "comment_1",
+    "좋아요(like)":   "like_1",
 }
 
 OI_COLOR = {
@@ -44,7 +45,7 @@ OI_COLOR = {
 st.sidebar.subheader("삼성 OI 표시(가중치=1)")
 samsung_selected = st.sidebar.multiselect(
     "삼성 차트에 표시할 OI",
-    options=list(SAMSUNG_OI_FILES.keys()),
+    options=list(OI_WEIGHTINGS.keys()),
     default=["조회수(view)"],
     key="samsung_oi_select"
 )  # 멀티셀렉트는 선택 리스트를 반환 [web:464]
@@ -52,16 +53,31 @@ samsung_selected = st.sidebar.multiselect(
 st.sidebar.subheader("하이닉스 OI 표시(가중치=1)")
 hynix_selected = st.sidebar.multiselect(
     "하이닉스 차트에 표시할 OI",
-    options=list(HYNIX_OI_FILES.keys()),
+    options=list(OI_WEIGHTINGS.keys()),
     default=["조회수(view)"],
     key="hynix_oi_select"
 )  # [web:464]
 
+# 임의 가중치 OI 한 줄 추가 (예: view0.25_post0.25_comment0.3_like0.2)
+custom_weighting = st.sidebar.text_input("추가 가중치 OI (선택)", value="")
+if custom_weighting:
+    try:
+        weight_vector(custom_weighting)
+        OI_WEIGHTINGS[custom_weighting] = custom_weighting
+        samsung_selected = samsung_selected + [custom_weighting]
+        hynix_selected = hynix_selected + [custom_weighting]
+    except (KeyError, ValueError):
+        st.sidebar.warning(f"가중치를 해석할 수 없습니다: {custom_weighting}")
+
 # =========================
 # 공통 함수: 캔들/라인 데이터 생성
 # =========================
+@st.cache_data
+def load_price(ticker: str, start_date, end_date):
+    return get_db().ohlcv(ticker, start_date, end_date)
+
 def make_candles(ticker: str, start_date, end_date):
-    df = fdr.DataReader(ticker, str(start_date), str(end_date)).reset_index()
+    df = load_price(ticker, start_date, end_date)
     candles = [
         {
             "time": d.strftime("%Y-%m-%d"),
@@ -74,10 +90,15 @@ def make_candles(ticker: str, start_date, end_date):
     ]
     return candles
 
-def make_oi_line(csv_path: str, start_date, end_date):
-    oi = pd.read_csv(csv_path, encoding="utf-8-sig")
-    oi["날짜"] = pd.to_datetime(oi["날짜"])
-    oi = oi[(oi["날짜"].dt.date >= start_date) & (oi["날짜"].dt.date <= end_date)].sort_values("날짜")
+# 기간 조회는 공용 분석 DB 에서. version(CSV 수정시각)이 캐시 키에 들어가서 CSV 가 바뀌면 다시 조회
+# 같은 종목을 share/visualization.py 가 다른 CSV(../data/samsung_data.csv)로 넣으므로
+# 여기서는 파일 이름을 stock 키로 사용 (CSV 하나 = 키 하나)
+@st.cache_data
+def load_daily(key: str, start_date, end_date, version):
+    return get_db().daily("FmKorea", key, start_date, end_date)
+
+def make_oi_line(daily: pd.DataFrame, weighting: str):
+    oi = reweight(daily, weighting)
 
     line = [{"time": d.strftime("%Y-%m-%d"), "value": float(v)}
             for d, v in zip(oi["날짜"], oi["과열지수_OI"])]
@@ -136,14 +157,19 @@ def render_price_with_oi(title: str, candles, oi_series_list, key: str):
 # =========================
 # 종목별 OI 시리즈 생성
 # =========================
-def build_oi_series(oi_dir, file_map, selected_keys, start_date, end_date):
+def build_oi_series(oi_dir, daily_file, selected_keys, start_date, end_date):
+    csv_path = os.path.join(oi_dir, daily_file)
+    if not os.path.exists(csv_path):
+        st.warning(f"파일 없음: {csv_path}")
+        return []
+    # CSV 가 바뀌었을 때만 DB 로 다시 넣음 (캐시 함수 밖에서 매번 확인)
+    key = os.path.splitext(daily_file)[0]
+    get_db().sync_csv(csv_path, "daily", community="FmKorea", stock=key)
+    daily = load_daily(key, start_date, end_date, os.path.getmtime(csv_path))
+
     out = []
     for name in selected_keys:
-        csv_path = os.path.join(oi_dir, file_map[name])
-        if not os.path.exists(csv_path):
-            st.warning(f"파일 없음: {csv_path}")
-            continue
-        line = make_oi_line(csv_path, start_date, end_date)
+        line = make_oi_line(daily, OI_WEIGHTINGS[name])
         out.append({
             "type": "Line",
             "data": line,
@@ -159,7 +185,7 @@ def build_oi_series(oi_dir, file_map, selected_keys, start_date, end_date):
 # 1) 위: 삼성(005930) + 삼성 OI(토글)
 # =========================
 samsung_candles = make_candles("005930", start, end)
-samsung_oi_series = build_oi_series(oi_dir, SAMSUNG_OI_FILES, samsung_selected, start, end)
+samsung_oi_series = build_oi_series(oi_dir, SAMSUNG_DAILY_FILE, samsung_selected, start, end)
 
 render_price_with_oi(
     title="삼성전자(005930) 캔들 + OI(가중치=1) 토글",
@@ -174,7 +200,7 @@ st.divider()
 # 2) 아래: 하이닉스(000660) + 하이닉스 OI(토글)
 # =========================
 hynix_candles = make_candles("000660", start, end)
-hynix_oi_series = build_oi_series(oi_dir, HYNIX_OI_FILES, hynix_selected, start, end)
+hynix_oi_series = build_oi_series(oi_dir, HYNIX_DAILY_FILE, hynix_selected, start, end)
 
 render_price_with_oi(
     title="SK하이닉스(000660) 캔들 + OI(가중치=1) 토글",
@@ -1,12 +1,15 @@
 import os
+import sys
 import pandas as pd
 import numpy as np
 import streamlit as st
-import FinanceDataReader as fdr
 import plotly.express as px
 from streamlit_lightweight_charts import renderLightweightCharts
 from datetime import timedelta
 
+sys.path.append("..")
+from share.store import get_db
+
 # 페이지 설정
 st.set_page_config(layout="wide", page_title="주식 심리 및 상관관계 분석")
 
@@ -22,19 +25,27 @@ st.markdown("""
 # =========================
 # 2. 데이터 로드 및 정제 함수
 # =========================
+# 공포-탐욕 CSV 는 바뀌었을 때만 공용 분석 DB 로 다시 넣음 (캐시 함수 밖에서 매번 확인)
+# → 캐시 키로 쓸 CSV 수정시각, 파일이 없으면 None
+def sync_fng(fng_path, community, stock):
+    if not os.path.exists(fng_path):
+        return None
+    get_db().sync_csv(fng_path, "fng", community=community, stock=stock)
+    return os.path.getmtime(fng_path)
+
 @st.cache_data
-def get_cleaned_analysis_data(fng_path, ticker, start_date, end_date):
-    if not os.path.exists(fng_path): 
+def get_cleaned_analysis_data(community, stock, ticker, start_date, end_date, version):
+    if version is None:
         return pd.DataFrame()
 
     # 수익률 계산을 위해 시작일보다 14일 앞선 데이터부터 로드
     fetch_start = start_date - timedelta(days=14)
-    df_stock = fdr.DataReader(ticker, str(fetch_start), str(end_date))
-    df_stock = df_stock.reset_index()
+    db = get_db()
+    df_stock = db.ohlcv(ticker, fetch_start, end_date)
     df_stock['Date_Only'] = df_stock['Date'].dt.date
 
-    df_fng = pd.read_csv(fng_path)
-    df_fng["date"] = pd.to_datetime(df_fng["date"]).dt.date
+    df_fng = db.fng(community, stock, fetch_start, end_date)
+    df_fng["date"] = df_fng["date"].dt.date
 
     # [핵심] 영업일 기준 Inner Merge (주말/공휴일 자동 제거)
     merged = pd.merge(
@@ -67,14 +78,14 @@ end = st.sidebar.date_input("종료일", value=pd.to_datetime("2026-01-14").date
 target_stock = st.sidebar.selectbox("분석 종목 선택", ["삼성전자(005930)", "SK하이닉스(000660)"])
 
 if "삼성" in target_stock:
-    ticker, FNG_FILE = "005930", r"./data/samsung_fng.csv"
+    ticker, stock, FNG_FILE = "005930", "삼성전자", r"./data/samsung_fng.csv"
 else:
-    ticker, FNG_FILE = "000660", r"./data/hynix_fng.csv"
+    ticker, stock, FNG_FILE = "000660", "SK하이닉스", r"./data/hynix_fng.csv"
 
 # =========================
 # 4. 데이터 처리 및 메인 화면
 # =========================
-df_final = get_cleaned_analysis_data(FNG_FILE, ticker, start, end)
+df_final = get_cleaned_analysis_data("FmKorea", stock, ticker, start, end, sync_fng(FNG_FILE, "FmKorea", stock))
 
 if not df_final.empty:
     st.title(f"🎯 {target_stock} 심리-데이터 상관관계 분석")
@@ -166,7 +177,7 @@ if not df_final.empty:
     else:
         DC_FILE = r"..\data\hynix_fng_dc.csv"
         
-    df_dc = get_cleaned_analysis_data(DC_FILE, ticker, start, end)
+    df_dc = get_cleaned_analysis_data("DCInside", stock, ticker, start, end, sync_fng(DC_FILE, "DCInside", stock))
     
     if not df_dc.empty:
         corr_dc = df_dc.dropna(subset=['Next_Trading_Day_Return', 'Volume'])
@@ -1,11 +1,14 @@
+import sys
 import streamlit as st
 import pandas as pd
-import yfinance as yf
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from datetime import timedelta
 
+sys.path.append("..")
+from share.store import get_db
+
 st.set_page_config(page_title="커뮤니티-주가 통합 정밀 분석기", layout="wide")
 
 # --- 1. 파일 매칭 로직 (제시해주신 키워드 반영) ---
@@ -39,17 +42,21 @@ def find_matching_file(uploaded_files, comm, comp):
 
 
 # --- 1. 데이터 로드 및 전처리 ---
+# 업로드한 일별집계는 공용 분석 DB 에 넣어 두고 기간 조회, 주가는 DB 의 OHLCV 캐시에서 가져온다.
+# CSV 경로로 동기화되는 데이터와 섞이지 않게 community 키에 "(업로드)" 를 붙임.
+# 업로드 파일 내용이 캐시 키라 같은 파일이면 다시 넣지 않음
 @st.cache_data
-def load_data(file, ticker):
-    b_df = pd.read_csv(file)
-    b_df['날짜'] = pd.to_datetime(b_df['날짜'])
-    
+def load_data(file, community, stock, ticker):
+    db = get_db()
+    community = f"{community}(업로드)"
+    up = pd.read_csv(file)
+    db.upsert("daily", up, community=community, stock=stock)
+    days = pd.to_datetime(up['날짜'], errors='coerce')
+    b_df = db.daily(community, stock, days.min(), days.max())
+
     # 주가 데이터 가져오기
-    s_df = yf.download(ticker, start=b_df['날짜'].min() - timedelta(days=14), 
-                       end=b_df['날짜'].max() + timedelta(days=14), progress=False)
-    if isinstance(s_df.columns, pd.MultiIndex): s_df.columns = s_df.columns.get_level_values(0)
-    s_df = s_df.reset_index().rename(columns={'Date': '날짜'})
-    s_df['날짜'] = pd.to_datetime(s_df['날짜']).dt.tz_localize(None)
+    s_df = db.ohlcv(ticker, b_df['날짜'].min() - timedelta(days=14), b_df['날짜'].max() + timedelta(days=14))
+    s_df = s_df.rename(columns={'Date': '날짜'})
     
     df = pd.merge(b_df, s_df, on='날짜', how='inner')
     
@@ -73,14 +80,16 @@ st.sidebar.header("🔍 분석 필터")
 comm_name = st.sidebar.selectbox("커뮤니티", ["블라인드", "에펨코리아", "디시인사이드"])
 company = st.sidebar.selectbox("대상 기업", ["삼성전자", "SK하이닉스", "현대차"])
 
-ticker_map = {"삼성전자": "005930.KS", "SK하이닉스": "000660.KS", "현대차": "005380.KS"}
+ticker_map = {"삼성전자": "005930", "SK하이닉스": "000660", "현대차": "005380"}
+# 공용 분석 DB 의 community 키
+community_key = {"블라인드": "Blind", "에펨코리아": "FmKorea", "디시인사이드": "DCInside"}
 
 # [핵심] 9개 파일 중 선택된 조건에 맞는 파일을 찾아옵니다.
 uploaded_file = find_matching_file(all_files, comm_name, company)
 
 # --- 이후 모든 로직은 기존과 동일하게 유지 ---
 if uploaded_file:
-    df = load_data(uploaded_file, ticker_map[company])
+    df = load_data(uploaded_file, community_key[comm_name], company, ticker_map[company])
     df_sorted = df.sort_values('날짜')
 
     # --- 섹션 1: 전체 흐름 분석 ---
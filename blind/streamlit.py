@@ -1,9 +1,12 @@
 import os
+import sys
 import pandas as pd
 import streamlit as st
-import FinanceDataReader as fdr
 from streamlit_lightweight_charts import renderLightweightCharts
 
+sys.path.append("..")
+from share.store import get_db
+
 st.set_page_config(page_title="삼성(블라인드) 일별집계 vs 주가/거래량", layout="wide")
 
 # =========================
@@ -51,15 +54,27 @@ normalize_line = st.sidebar.checkbox("선택 지표를 0~100 정규화(패턴 
 
 
 # =========================
-# 2) Data Load (일별집계 CSV)
+# 2) Data Load (일별집계 CSV → 공용 분석 DB)
 # =========================
+# CSV 는 바뀌었을 때만 DB 로 다시 넣고(캐시 함수 밖에서 매번 확인), 기간 조회는 DB 에서.
+# 종목 구분이 없는 파일이라 파일 이름을 stock 키로 사용
+if not os.path.exists(DAILY_PATH):
+    st.warning(f"파일 없음: {DAILY_PATH}")
+    st.stop()
+DAILY_KEY = os.path.splitext(os.path.basename(DAILY_PATH))[0]
+get_db().sync_csv(DAILY_PATH, "daily", community="Blind", stock=DAILY_KEY)
+DAILY_VERSION = os.path.getmtime(DAILY_PATH)
+
+
 @st.cache_data(show_spinner=False)
-def load_daily(path: str) -> pd.DataFrame:
-    # 인코딩 이슈 대비
-    try:
-        df = pd.read_csv(path, encoding="utf-8-sig")
-    except UnicodeDecodeError:
-        df = pd.read_csv(path, encoding="cp949")
+def load_day_range(key: str, version):
+    days = get_db().daily("Blind", key, columns=["날짜"])["날짜"]
+    return days.min().date(), days.max().date()
+
+
+@st.cache_data(show_spinner=False)
+def load_daily(key: str, start, end, version) -> pd.DataFrame:
+    df = get_db().daily("Blind", key, start, end)
 
     # 필수 컬럼 체크 (현재 파일 형태 기준)
     required = {"날짜", "게시글수", "조회수", "댓글수", "좋아요수"}
@@ -86,18 +101,15 @@ def minmax_0_100(s: pd.Series) -> pd.Series:
     return (s - mn) / (mx - mn) * 100
 
 
-daily = load_daily(DAILY_PATH)
-
 # 기간 기본값을 “일별집계 데이터 범위”로
-min_day = daily["날짜"].min().date()
-max_day = daily["날짜"].max().date()
+min_day, max_day = load_day_range(DAILY_KEY, DAILY_VERSION)
 
 start, end = st.sidebar.date_input("기간", value=(min_day, max_day), min_value=min_day, max_value=max_day)
 start_str = pd.Timestamp(start).strftime("%Y-%m-%d")
 end_str = pd.Timestamp(end).strftime("%Y-%m-%d")
 
-# 기간 필터
-daily_f = daily[(daily["날짜"].dt.date >= start) & (daily["날짜"].dt.date <= end)].copy()
+# 기간 조회 (DB 인덱스)
+daily_f = load_daily(DAILY_KEY, start, end, DAILY_VERSION)
 if daily_f.empty:
     st.warning("선택한 기간에 일별집계 데이터가 없습니다. 기간을 다시 선택하세요.")
     st.stop()
@@ -108,10 +120,7 @@ if daily_f.empty:
 # =========================
 @st.cache_data(show_spinner=False)
 def load_price(ticker: str, start_s: str, end_s: str) -> pd.DataFrame:
-    df = fdr.DataReader(ticker, start_s, end_s).reset_index()
-    df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
-    df = df.dropna(subset=["Date"]).sort_values("Date").reset_index(drop=True)
-    return df
+    return get_db().ohlcv(ticker, start_s, end_s)
 
 
 price = load_price(TICKER, start_str, end_str)
@@ -0,0 +1,26 @@
+from .fmkorea import (
+    COLUMNS, HEADERS, crawl_one, normalize_date, normalize_post_date, parse_int,
+    parse_list_page, parse_post_detail, parse_post_detail_html,
+)
+from .aio import crawl_one_async, crawl_one_concurrent
+from .http import build_session
+from .detail import append_jsonl, collect_details, export_pretty_json, load_done_urls
+from .checkpoint import (
+    CrawlState, crawl_incremental, crawl_incremental_blind, crawl_incremental_dc, crawl_incremental_site,
+    incremental_pages,
+)
+from .cache import (
+    ArchiveAdapter, ResponseArchive, attach_archive, replay, replay_blind_list, replay_dc_list,
+    replay_fmkorea_details, replay_fmkorea_list,
+)
+from .extract import get_backend
+from .blind import BlindListCollector, collect_list_http, collect_list_selenium
+from .dc import PageLocator, crawl_date_range
+from .http import SessionPool
+from .sites import POST_COLUMNS, BlindAdapter, DCAdapter, FmKoreaAdapter, SiteAdapter, get_adapter
+from .engine import Crawler
+from .throttle import AutoThrottle, CrawlScheduler, HostThrottle, ThrottledCrawler
+from .dedup import DedupRegistry, dedup_frame
+from .sink import JsonlSink, ParquetSink, RowSink, read_sink
+from .metrics import CrawlMetrics, Histogram
+from .dateindex import JsonlDateIndex
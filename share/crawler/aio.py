@@ -0,0 +1,114 @@
+import asyncio
+from urllib.parse import urlsplit
+
+import aiohttp
+import pandas as pd
+
+from .fmkorea import COLUMNS, HEADERS, parse_list_page
+
+
+# =========================
+# asyncio 기반 동시 페이지 수집
+# =========================
+# crawl_one 과 같은 결과(DataFrame 컬럼/행 순서)를 내지만,
+# 페이지를 최대 concurrency 개까지 동시에 요청한다.
+#
+# - 호스트별 동시 요청 수를 Semaphore 로 제한 (per-host cap)
+# - 결과는 항상 페이지 순서대로 소비 → rows=0 / page_added=0 중단 조건이 순차 버전과 동일
+# - 중단 페이지 이후에 미리 요청해 둔 페이지는 취소하고 버린다 (최대 concurrency-1 페이지 낭비)
+# - sleep_sec: 요청 하나가 끝난 뒤 슬롯을 잡은 채로 쉬는 시간 (호스트당 요청 간격)
+# - archive: ResponseArchive 를 넘기면 받은 원본 HTML 을 그대로 저장 (cache.py)
+class _HostLimiter:
+    def __init__(self, per_host: int):
+        self.per_host = per_host
+        self._sems = {}
+
+    def get(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc
+        if host not in self._sems:
+            self._sems[host] = asyncio.Semaphore(self.per_host)
+        return self._sems[host]
+
+
+async def _fetch_text(session: aiohttp.ClientSession, limiter: _HostLimiter, url: str,
+                      sleep_sec: float, archive=None) -> str:
+    async with limiter.get(url):
+        async with session.get(url) as r:
+            body = await r.read()
+            if archive is not None:
+                archive.put(url, r.status, body, r.headers.get("Content-Type", ""))
+            r.raise_for_status()
+            text = body.decode(r.get_encoding(), errors="replace")
+        if sleep_sec:
+            await asyncio.sleep(sleep_sec)
+    return text
+
+
+async def crawl_one_async(url_base: str, source_name: str, start_page=1, end_page=10,
+                          concurrency=4, sleep_sec=0.0, headers=None, timeout=20,
+                          session: aiohttp.ClientSession = None, archive=None,
+                          verbose=True, backend="bs4") -> pd.DataFrame:
+    own_session = session is None
+    if own_session:
+        session = aiohttp.ClientSession(
+            headers=headers or HEADERS,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+            connector=aiohttp.TCPConnector(limit_per_host=concurrency),
+        )
+
+    limiter = _HostLimiter(concurrency)
+    data = {c: [] for c in COLUMNS}
+    pending = {}  # page -> Task
+    next_page = start_page
+
+    try:
+        for page in range(start_page, end_page + 1):
+            # 현재 페이지부터 concurrency 개 만큼 앞서 요청을 걸어 둔다
+            while next_page <= end_page and len(pending) < concurrency:
+                url = url_base.format(next_page)
+                pending[next_page] = asyncio.create_task(
+                    _fetch_text(session, limiter, url, sleep_sec, archive)
+                )
+                next_page += 1
+
+            html = await pending.pop(page)
+
+            records = parse_list_page(html, source_name, backend=backend)
+            if records is None:
+                if verbose:
+                    print(f"[{source_name}] {page}페이지: rows=0 → 중단")
+                break
+
+            for rec in records:
+                for c in COLUMNS:
+                    data[c].append(rec[c])
+            page_added = len(records)
+
+            if verbose:
+                print(f"[{source_name}] {page}페이지 완료 / 이번 페이지 {page_added}개 / 누적 {len(data['post_url'])}개")
+
+            if page_added == 0:
+                if verbose:
+                    print(f"[{source_name}] {page}페이지: page_added=0 → 중단")
+                break
+    finally:
+        # 중단 이후 페이지는 필요 없으므로 취소
+        for t in pending.values():
+            t.cancel()
+        await asyncio.gather(*pending.values(), return_exceptions=True)
+        if own_session:
+            await session.close()
+
+    return pd.DataFrame(data)
+
+
+# 스크립트(.py)에서 쓰는 동기 래퍼
+# 주피터 노트북에서는 이미 이벤트 루프가 돌고 있으므로
+#   df = await crawl_one_async(url_base, "하이닉스", 401, 500, concurrency=4, sleep_sec=2)
+# 처럼 바로 await 해서 사용
+def crawl_one_concurrent(url_base: str, source_name: str, start_page=1, end_page=10,
+                         concurrency=4, sleep_sec=0.0, **kwargs) -> pd.DataFrame:
+    return asyncio.run(crawl_one_async(
+        url_base, source_name, start_page, end_page,
+        concurrency=concurrency, sleep_sec=sleep_sec, **kwargs
+    ))
@@ -0,0 +1,434 @@
+import argparse
+import json
+import os
+import re
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+import pandas as pd
+import requests
+
+from . import blind, dc
+from .aio import crawl_one_concurrent
+from .dateindex import JsonlDateIndex
+from .detail import collect_details
+from .fmkorea import HEADERS, crawl_one, parse_list_page, parse_post_detail, parse_post_detail_html
+from .engine import Crawler
+from .http import SessionPool, build_session
+from .mockserver import MockSite, serve
+from .sites import BlindAdapter, FmKoreaAdapter
+from .throttle import AutoThrottle, CrawlScheduler, ThrottledCrawler
+
+
+# =========================
+# 벤치마크: 순차 crawl_one vs asyncio 동시 수집
+# =========================
+# 로컬 스텁 서버에 요청하므로 실제 사이트에는 부하가 없다.
+#   python -m share.crawler.bench list --pages 100 --latency 0.05 --concurrency 8
+#   python -m share.crawler.bench detail --posts 200
+#   python -m share.crawler.bench extract [--archive ../data/raw_html]
+#   python -m share.crawler.bench throttle --pages 30
+#   python -m share.crawler.bench dateindex --posts 20000
+#   python -m share.crawler.bench suite --error-rate 0.02 --throttle-rate 0.01 [--out report.json]
+def bench_list(pages=100, rows=20, latency=0.05, concurrency=8):
+    site = MockSite(n_pages=pages, rows_per_page=rows, latency=latency)
+    results = {}
+
+    with serve(site) as base:
+        url_base = base + "/search.php?mid=stock&page={}"
+        # 마지막 페이지 다음(빈 페이지)까지 요청해 rows=0 중단 조건까지 포함
+        end_page = pages + 5
+
+        session = requests.Session()
+        session.headers.update(HEADERS)
+        t0 = time.perf_counter()
+        df_serial = crawl_one(session, url_base, "bench", 1, end_page, sleep_sec=0, verbose=False)
+        t_serial = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        df_async = crawl_one_concurrent(url_base, "bench", 1, end_page,
+                                        concurrency=concurrency, verbose=False)
+        t_async = time.perf_counter() - t0
+
+    pd.testing.assert_frame_equal(df_serial, df_async)
+
+    results["serial"] = pages / t_serial
+    results[f"async(c={concurrency})"] = pages / t_async
+
+    print(f"페이지 {pages}개 / 페이지당 {rows}행 / 서버 지연 {latency * 1000:.0f}ms")
+    for name, pps in results.items():
+        print(f"  {name:<14} {pps:8.1f} pages/sec")
+    print(f"  결과 행 수 {len(df_serial):,} (순차/동시 결과 동일)")
+    return results
+
+
+# =========================
+# 벤치마크: 상세 페이지 순차 수집 vs 스레드 풀 수집
+# =========================
+def bench_detail(posts=200, comments=30, latency=0.05, workers=8):
+    site = MockSite(latency=latency, comments_per_post=comments)
+    results = {}
+
+    with serve(site) as base, tempfile.TemporaryDirectory() as tmp:
+        urls = [f"{base}/{9_000_000_000 - i}" for i in range(posts)]
+
+        session = requests.Session()
+        session.headers.update(HEADERS)
+        t0 = time.perf_counter()
+        serial = [parse_post_detail(session, u) for u in urls]
+        t_serial = time.perf_counter() - t0
+
+        path = os.path.join(tmp, "detail.jsonl")
+        t0 = time.perf_counter()
+        failed = collect_details(urls, path, workers=workers, verbose=False)
+        t_pool = time.perf_counter() - t0
+
+        with open(path, encoding="utf-8") as f:
+            pooled = {o["post_url"]: o for o in map(json.loads, f)}
+
+    assert not failed
+    assert pooled == {o["post_url"]: o for o in serial}
+
+    results["serial"] = posts / t_serial
+    results[f"pool(w={workers})"] = posts / t_pool
+
+    print(f"게시글 {posts}개 / 게시글당 댓글 {comments}개 / 서버 지연 {latency * 1000:.0f}ms")
+    for name, pps in results.items():
+        print(f"  {name:<14} {pps:8.1f} posts/sec")
+    return results
+
+
+# =========================
+# 벤치마크: 추출 백엔드별 rows/sec (+ bs4 와 결과 일치 검사)
+# =========================
+# 픽스처: MockSite 가 만든 HTML, 또는 --archive 로 실제 수집한 원본 HTML (cache.py)
+def _fixtures(pages=100, archive_root=None):
+    if archive_root:
+        from .cache import ResponseArchive
+        ar = ResponseArchive(archive_root)
+
+        def load(like, exclude=()):
+            return [ar.read_body(sha).decode("utf-8", errors="replace")
+                    for url, _, sha in ar.entries(like) if not any(x in url for x in exclude)]
+
+        return {
+            "fmkorea_list": load("%fmkorea.com/search.php%"),
+            "fmkorea_detail": load("%fmkorea.com/%", exclude=("search.php",)),
+            "dc_list": load("%/board/lists/%"),
+            "blind_cards": load("%teamblind.com%"),
+        }
+
+    site = MockSite(n_pages=pages, rows_per_page=20)
+    return {
+        "fmkorea_list": [site.fmkorea_list(p) for p in range(1, pages + 1)],
+        "fmkorea_detail": [site.fmkorea_post(9_000_000_000 - i) for i in range(pages)],
+        "dc_list": [site.dc_list(p) for p in range(1, pages + 1)],
+        "blind_cards": [site.blind_cards(i * 100, 100) for i in range(max(pages // 5, 1))],
+    }
+
+
+_PARSERS = {
+    "fmkorea_list": (lambda h, b: parse_list_page(h, "bench", today="2026-01-14", backend=b),
+                     lambda r: len(r or [])),
+    "fmkorea_detail": (lambda h, b: parse_post_detail_html(h, "u", today="2026-01-14", backend=b),
+                       lambda r: 1 + len(r["comments"])),
+    "dc_list": (lambda h, b: dc.parse_gall_list(h, backend=b), lambda r: len(r or [])),
+    "blind_cards": (lambda h, b: blind.parse_article_cards(h, now=datetime(2026, 1, 14, 23, 59), backend=b),
+                    len),
+}
+
+
+def bench_extract(pages=100, backends=("bs4", "lxml", "selectolax"), archive_root=None):
+    fixtures = _fixtures(pages, archive_root)
+    results = {}
+
+    for kind, htmls in fixtures.items():
+        if not htmls:
+            continue
+        parse, count = _PARSERS[kind]
+        expected = None
+        print(f"[{kind}] 문서 {len(htmls)}개")
+        for b in backends:
+            t0 = time.perf_counter()
+            out = [parse(h, b) for h in htmls]
+            dt = time.perf_counter() - t0
+
+            if expected is None:
+                expected = out
+            elif out != expected:
+                bad = next(i for i, (x, y) in enumerate(zip(out, expected)) if x != y)
+                raise AssertionError(f"[{kind}] {b} 결과가 {backends[0]} 와 다름 (문서 #{bad})")
+
+            n_rows = sum(count(r) for r in out)
+            results[(kind, b)] = n_rows / dt
+            print(f"  {b:<11} {n_rows / dt:10.0f} rows/sec")
+    return results
+
+
+# =========================
+# 벤치마크: Blind 스크롤 수집 - page_source 전체 재파싱 vs 새 카드만 처리
+# =========================
+# 브라우저 대신 스크롤마다 카드가 batch 개씩 늘어나는 가짜 DOM 을 사용
+# keep 을 주면 가상 스크롤처럼 마지막 keep 개 카드만 DOM 에 남김
+# execute_script 는 _NEW_CARDS_JS 와 같게 처음 보는 href 의 카드만 돌려줌
+class _GrowingDom:
+    _HREF = re.compile(r'<div class="tit"><h3><a href="([^"]+)"')
+
+    def __init__(self, site, batch, keep=None):
+        self.site, self.batch, self.keep = site, batch, keep
+        self._cards = []
+        self._next = 0
+        self._seen = set()
+
+    def scroll(self):
+        self._cards.extend(self.site.blind_card(k) for k in range(self._next, self._next + self.batch))
+        self._next += self.batch
+        if self.keep:
+            self._cards = self._cards[-self.keep:]
+
+    @property
+    def page_source(self):
+        return "<html><body><div>" + "".join(self._cards) + "</div></body></html>"
+
+    def execute_script(self, js):
+        out = []
+        for card in self._cards:
+            href = self._HREF.search(card).group(1)
+            if href not in self._seen:
+                self._seen.add(href)
+                out.append(card)
+        return out
+
+
+def bench_blind_scroll(scrolls=60, batch=20):
+    site = MockSite(posts_per_day=40)
+    now = datetime(2026, 1, 14, 23, 59)
+    start_d, end_d = datetime(2024, 1, 1).date(), now.date()
+
+    # 기존 방식: 매 스크롤 page_source 전체 파싱 + seen_urls 비교
+    dom = _GrowingDom(site, batch)
+    seen, old_posts = set(), []
+    t0 = time.perf_counter()
+    for _ in range(scrolls):
+        dom.scroll()
+        for rec in blind.parse_article_cards(dom.page_source, now):
+            if rec["url"] in seen:
+                continue
+            seen.add(rec["url"])
+            old_posts.append(rec)
+    t_old = time.perf_counter() - t0
+
+    dom = _GrowingDom(site, batch)
+    col = blind.BlindListCollector(start_d, end_d, now)
+    t0 = time.perf_counter()
+    for _ in range(scrolls):
+        dom.scroll()
+        col.collect_new(dom)
+    t_new = time.perf_counter() - t0
+
+    assert col.posts == old_posts
+    print(f"스크롤 {scrolls}번 / 스크롤당 카드 {batch}개 / 총 {len(old_posts):,}개")
+    print(f"  page_source 재파싱 {t_old:7.2f}s")
+    print(f"  새 카드만 처리     {t_new:7.2f}s")
+    return t_old, t_new
+
+
+# =========================
+# 벤치마크: 고정 sleep 순차 수집 vs AutoThrottle 스케줄러
+# =========================
+# 서버가 초당 rate_limit 건을 넘으면 429 를 주는 상황에서
+# 검색어 여러 개를 (1) 한도에 맞춘 고정 sleep 으로 하나씩, (2) 스케줄러로 번갈아 수집
+def bench_throttle(pages=30, keywords=("하이닉스", "하닉", "삼성전자", "삼전"), latency=0.05,
+                   rate_limit=20, workers=8):
+    site = MockSite(n_pages=pages, latency=latency, rate_limit=rate_limit)
+    total = pages * len(keywords)
+
+    with serve(site) as base:
+        fm = FmKoreaAdapter(base)
+
+        crawler = Crawler(sleep_sec=1.0 / rate_limit, verbose=False)
+        t0 = time.perf_counter()
+        serial = {("fmkorea", kw): crawler.crawl_list(fm, kw, 1, pages + 1) for kw in keywords}
+        t_serial = time.perf_counter() - t0
+        n429_serial = site.n_throttled
+
+        site.n_throttled = 0
+        throttle = AutoThrottle(start_delay=0.2, max_concurrency=workers)
+        sched = CrawlScheduler(ThrottledCrawler(throttle, verbose=False), workers=workers)
+        for kw in keywords:
+            sched.add(fm, kw, 1, pages + 1)
+        t0 = time.perf_counter()
+        auto, failed = sched.run()
+        t_auto = time.perf_counter() - t0
+        n429_auto = site.n_throttled
+
+    assert not failed and auto == serial
+    print(f"검색어 {len(keywords)}개 x {pages}페이지 / 서버 한도 {rate_limit}건/s / 지연 {latency * 1000:.0f}ms")
+    print(f"  고정 sleep {1.0 / rate_limit:.2f}s   {total / t_serial:8.1f} pages/sec  429 {n429_serial}건")
+    print(f"  AutoThrottle(w={workers}) {total / t_auto:8.1f} pages/sec  429 {n429_auto}건")
+    for host, st in throttle.summary().items():
+        print(f"    {host}: 최종 간격 {st['delay']:.3f}s / 동시 {st['concurrency']} / "
+              f"평균 응답 {st['avg_latency'] * 1000:.0f}ms")
+    return t_serial, t_auto
+
+
+# =========================
+# 벤치마크 모음: 크롤러별 end-to-end pages/sec, posts/sec, 최대 메모리
+# =========================
+# 장애 주입(500/429)을 켠 MockSite 에 실제 크롤러 함수를 그대로 돌린다 (재시도는 build_session 설정).
+# 최대 메모리는 tracemalloc 기준 파이썬 할당량 (측정 오버헤드가 있으므로 비교용)
+def _measure(fn):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    try:
+        out = fn()
+    finally:
+        sec = time.perf_counter() - t0
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return out, sec, peak
+
+
+def bench_suite(pages=50, posts=200, latency=0.02, workers=8, error_rate=0.0, throttle_rate=0.0,
+                out_path=None):
+    site = MockSite(n_pages=pages, latency=latency, error_rate=error_rate,
+                    throttle_rate=throttle_rate, retry_after=0, posts_per_day=40)
+    rows = []
+
+    def record(name, n_pages, n_posts, sec, peak, n_req):
+        rows.append({
+            "case": name, "pages": n_pages, "posts": n_posts, "sec": round(sec, 3),
+            "pages_per_sec": round(n_pages / sec, 1), "posts_per_sec": round(n_posts / sec, 1),
+            "peak_mb": round(peak / 2**20, 2), "requests": n_req,
+        })
+
+    with serve(site) as base, tempfile.TemporaryDirectory() as tmp:
+        # FmKorea 목록: crawl_one (순차)
+        n0 = site.n_requests
+        df, sec, peak = _measure(lambda: crawl_one(
+            build_session(HEADERS), base + "/search.php?mid=stock&page={}", "bench",
+            1, pages + 1, sleep_sec=0, verbose=False))
+        record("fmkorea list", pages, len(df), sec, peak, site.n_requests - n0)
+
+        # FmKorea 상세: collect_details (스레드 풀)
+        urls = [f"{base}/{9_000_000_000 - i}" for i in range(posts)]
+        path = os.path.join(tmp, "detail.jsonl")
+        n0 = site.n_requests
+        failed, sec, peak = _measure(lambda: collect_details(urls, path, workers=workers, verbose=False))
+        assert not failed
+        record("fmkorea detail", posts, posts, sec, peak, site.n_requests - n0)
+
+        # DC: 날짜 이진 탐색 + 범위 수집 (crawl_date_range)
+        today = site.today
+        start_d = today - timedelta(days=pages * site.rows_per_page // site.posts_per_day // 2)
+        loc = dc.PageLocator(build_session(dc.HEADERS), "kospi", max_age_hours=0, sleep_sec=0,
+                             url_fmt=base + "/mgallery/board/lists/?id={gal_id}&page={page}",
+                             verbose=False)
+        n0 = site.n_requests
+        dc_rows, sec, peak = _measure(lambda: dc.crawl_date_range(
+            loc.session, "kospi", start_d, today, locator=loc, sleep_sec=0, verbose=False))
+        n_pages = site.n_requests - n0
+        record("dc list (date range)", n_pages, len(dc_rows), sec, peak, n_pages)
+
+        # Blind 상세: 공통 엔진 crawl_details
+        ba = BlindAdapter(base)
+        crawler = Crawler(SessionPool(pool_size=workers), sleep_sec=0, verbose=False)
+        cards = crawler.crawl_list(ba, "삼성", 1, max(posts // site.rows_per_page, 1))
+        n0 = site.n_requests
+        filled, sec, peak = _measure(lambda: crawler.crawl_details(ba, cards, workers=workers))
+        assert all(p["content"] for p in filled)
+        record("blind detail", len(filled), len(filled), sec, peak, site.n_requests - n0)
+
+    print(f"서버 지연 {latency * 1000:.0f}ms / 500 주입 {error_rate:.0%} ({site.n_errors}건) / "
+          f"429 주입 {throttle_rate:.0%} ({site.n_throttled}건) / 워커 {workers}")
+    print(f"  {'case':<22}{'pages/s':>9}{'posts/s':>9}{'peak MB':>9}{'req':>7}")
+    for r in rows:
+        print(f"  {r['case']:<22}{r['pages_per_sec']:>9.1f}{r['posts_per_sec']:>9.1f}"
+              f"{r['peak_mb']:>9.2f}{r['requests']:>7}")
+    if out_path:
+        with open(out_path, "w", encoding="utf-8") as f:
+            json.dump({"params": {"pages": pages, "posts": posts, "latency": latency,
+                                  "workers": workers, "error_rate": error_rate,
+                                  "throttle_rate": throttle_rate},
+                       "results": rows}, f, ensure_ascii=False, indent=2)
+    return rows
+
+
+# =========================
+# 벤치마크: 하루치 조회 — JSONL 전체 json.loads vs 날짜 인덱스
+# =========================
+def bench_dateindex(posts=20_000, days=120, comments=30):
+    start = datetime(2025, 9, 1)
+    target = (start + timedelta(days=days // 2)).strftime("%Y-%m-%d")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "hot_posts.jsonl")
+        with open(path, "w", encoding="utf-8") as f:
+            for i in range(posts):
+                d = (start + timedelta(days=i * days // posts)).strftime("%Y-%m-%d")
+                f.write(json.dumps({
+                    "post_url": f"https://www.fmkorea.com/{9_000_000_000 - i}",
+                    "title": f"하이닉스 {i} \"date\": \"1999-01-01\"", "date": d,
+                    "views": i, "votes": i % 50, "comment_count": comments,
+                    "content": "본문 " * 40,
+                    "comments": [{"nickname": f"닉{j}", "comment": f"댓글 {j} ㅋㅋㅋ 가즈아", "like": j % 5}
+                                 for j in range(comments)],
+                }, ensure_ascii=False) + "\n")
+        size = os.path.getsize(path)
+
+        # 기존 방식: 전체 파일을 json.loads 하며 날짜 비교
+        t0 = time.perf_counter()
+        with open(path, encoding="utf-8") as f:
+            scan = [p for p in map(json.loads, f) if p.get("date") == target]
+        t_scan = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        idx = JsonlDateIndex(path)
+        t_build = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        hit = JsonlDateIndex(path).read(target)
+        t_read = time.perf_counter() - t0
+
+    assert hit == scan
+    print(f"게시글 {posts:,}개 / {days}일 / 파일 {size / 2**20:.1f}MB / 대상 {target} ({len(hit)}개)")
+    print(f"  전체 json.loads   {t_scan * 1000:8.1f}ms  읽은 양 {size / 2**10:,.0f}KB")
+    print(f"  인덱스 최초 생성  {t_build * 1000:8.1f}ms")
+    print(f"  인덱스로 하루 조회 {t_read * 1000:8.1f}ms  읽은 양 {idx.span_bytes([target]) / 2**10:,.0f}KB")
+    return t_scan, t_read
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("what", nargs="?", default="all", choices=["all", "list", "detail", "extract", "blind", "throttle", "suite", "dateindex"])
+    ap.add_argument("--pages", type=int, default=100)
+    ap.add_argument("--rows", type=int, default=20)
+    ap.add_argument("--posts", type=int, default=200)
+    ap.add_argument("--latency", type=float, default=0.05)
+    ap.add_argument("--concurrency", type=int, default=8)
+    ap.add_argument("--archive", default=None, help="extract: 수집해 둔 원본 HTML 아카이브 경로")
+    ap.add_argument("--error-rate", type=float, default=0.0, help="suite: 500 응답 비율")
+    ap.add_argument("--throttle-rate", type=float, default=0.0, help="suite: 429 응답 비율")
+    ap.add_argument("--out", default=None, help="suite: 결과 JSON 저장 경로")
+    args = ap.parse_args()
+    if args.what in ("all", "list"):
+        bench_list(args.pages, args.rows, args.latency, args.concurrency)
+    if args.what in ("all", "detail"):
+        bench_detail(args.posts, latency=args.latency, workers=args.concurrency)
+    if args.what in ("all", "blind"):
+        bench_blind_scroll()
+    if args.what in ("all", "throttle"):
+        bench_throttle(min(args.pages, 30), latency=args.latency)
+    if args.what in ("all", "dateindex"):
+        bench_dateindex(max(args.posts, 1_000))
+    if args.what in ("all", "suite"):
+        bench_suite(min(args.pages, 50), args.posts, args.latency, args.concurrency,
+                    args.error_rate, args.throttle_rate, args.out)
+    if args.what in ("all", "extract"):
+        bench_extract(args.pages, archive_root=args.archive)
+
+
+if __name__ == "__main__":
+    main()
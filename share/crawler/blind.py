@@ -0,0 +1,312 @@
+import re
+from datetime import datetime, timedelta
+from time import sleep
+
+from bs4 import BeautifulSoup
+
+# =========================
+# 0) 접속 정보 / 컬럼
+# =========================
+BASE_URL = "https://www.teamblind.com"
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)",
+    "Referer": BASE_URL,
+}
+
+COLUMNS = ["title", "date", "views", "likes", "comments", "content", "url"]
+
+
+# =========================
+# 1) 날짜 파싱
+# =========================
+# "5분", "3시간", "어제", "2일", "25.01.14", "2025.01.14", "01.14" → datetime
+# now: 상대 날짜 기준 시각 (기본: 현재)
+def parse_date_kor(text: str, now: datetime = None):
+    text = text.replace("작성시간", "").strip()
+    text = text.strip(" .\n\t")
+
+    now = now or datetime.now()
+    m = re.search(r"\d+", text)
+    num = int(m.group()) if m else None
+
+    if "분" in text and num is not None:
+        return now - timedelta(minutes=num)
+    if "시간" in text and num is not None:
+        return now - timedelta(hours=num)
+    if "어제" in text:
+        return now - timedelta(days=1)
+    if "일" in text and "." not in text and num is not None:
+        return now - timedelta(days=num)
+
+    for fmt in ("%y.%m.%d", "%Y.%m.%d"):
+        try:
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            pass
+
+    if re.fullmatch(r"\d{2}\.\d{2}", text):
+        mth, d = map(int, text.split("."))
+        y = now.year
+        dt = datetime(y, mth, d)
+        if dt.date() > now.date():
+            dt = datetime(y - 1, mth, d)
+        return dt
+
+    return None
+
+
+# =========================
+# 2) 검색 결과 카드(div.article-list-pre) 파싱
+# =========================
+def _text(card, selector):
+    t = card.select_one(selector)
+    return t.get_text() if t else None
+
+
+def pick_num(text) -> str:
+    if text is None:
+        return "0"
+    m = re.search(r"\d+", text)
+    return m.group() if m else "0"
+
+
+# 추출한 문자열들 → 카드 dict (날짜 파싱 실패 시 None)
+# extract.py 의 lxml/selectolax 백엔드도 같은 함수 사용
+def make_card_record(title, href, date_text, pv_text, like_text, cmt_text, now: datetime = None):
+    url = href if href.startswith("http") else (BASE_URL + href)
+
+    dt = parse_date_kor(date_text, now)
+    if not dt:
+        return None
+
+    return {
+        "title": title,
+        "date": dt.date().isoformat(),
+        "views": pick_num(pv_text),
+        "likes": pick_num(like_text),
+        "comments": pick_num(cmt_text),
+        "content": "",
+        "url": url,
+    }
+
+
+# 카드 하나 → dict (제목/날짜 없으면 None)
+def parse_card(card, now: datetime = None):
+    title_tag = card.select_one("div.tit a")
+    date_tag = card.select_one("a.past")
+    if not title_tag or not date_tag:
+        return None
+
+    return make_card_record(
+        title_tag.get_text(strip=True),
+        title_tag.get("href", ""),
+        date_tag.get_text(strip=True),
+        _text(card, "a.pv"),
+        _text(card, "span.like"),
+        _text(card, "a.cmt"),
+        now,
+    )
+
+
+# 검색 결과 HTML(driver.page_source) → 카드 dict 리스트 (화면 순서)
+# backend: "bs4"(기본) / "lxml" / "selectolax" (extract.py)
+def parse_article_cards(html: str, now: datetime = None, backend="bs4") -> list:
+    if backend != "bs4":
+        from .extract import get_backend
+        return get_backend(backend).blind_cards(html, now)
+
+    soup = BeautifulSoup(html, "html.parser")
+    out = []
+    for card in soup.select("div.article-list-pre"):
+        rec = parse_card(card, now)
+        if rec is not None:
+            out.append(rec)
+    return out
+
+
+# =========================
+# 3) 상세 페이지 본문
+# =========================
+def extract_content(html: str) -> str:
+    soup = BeautifulSoup(html, "html.parser")
+    tag = (
+        soup.select_one("p#contentArea.contents-txt")
+        or soup.select_one("p#contentArea")
+        or soup.select_one("div.contents")
+        or soup.select_one("div.article-content")
+        or soup.select_one("div.view-content")
+    )
+    if not tag:
+        return ""
+    text = tag.get_text("\n", strip=True)
+    return re.sub(r"\n{2,}", "\n", text).strip()
+
+
+# =========================
+# 4) 리스트 수집: 새 카드만 처리
+# =========================
+# 기존 노트북은 스크롤할 때마다 driver.page_source 전체를 다시 파싱하고
+# 모든 카드를 seen_urls 와 다시 비교했다 (스크롤 깊이에 대해 O(n^2)).
+# 여기서는 브라우저 안에서 이미 넘겨준 카드의 글 URL(href)을 Set 에 기억해 두고
+# 처음 보는 URL 의 카드 outerHTML 만 받아 파싱한다.
+# DOM 위치(인덱스)가 아니라 URL 로 구분하므로 Blind 가 지나간 카드를 지우거나(가상 스크롤)
+# 다시 그려도 건너뛰거나 두 번 처리하지 않는다. 페이지가 새로 로드돼 Set 이 비면
+# 같은 카드가 다시 오지만 파이썬 쪽 seen_urls 에서 걸러진다.
+_CARD_HREF_JS = """
+const seen = window.__blindSeen || (window.__blindSeen = new Set());
+const href = (card) => {
+    const a = card.querySelector('div.tit a');
+    return a ? a.getAttribute('href') : null;
+};
+"""
+
+_NEW_CARDS_JS = _CARD_HREF_JS + """
+const out = [];
+for (const card of document.querySelectorAll('div.article-list-pre')) {
+    const h = href(card);
+    if (!h || seen.has(h)) continue;
+    seen.add(h);
+    out.push(card.outerHTML);
+}
+return out;
+"""
+
+_HAS_NEW_CARDS_JS = _CARD_HREF_JS + """
+for (const card of document.querySelectorAll('div.article-list-pre')) {
+    const h = href(card);
+    if (h && !seen.has(h)) return true;
+}
+return false;
+"""
+
+_SCROLL_LAST_JS = """
+const cards = document.querySelectorAll('div.article-list-pre');
+if (cards.length) cards[cards.length - 1].scrollIntoView({block: 'end'});
+else window.scrollTo(0, document.body.scrollHeight);
+"""
+
+
+class BlindListCollector:
+    def __init__(self, start_date, end_date, now: datetime = None, backend="bs4"):
+        self.start_date = start_date
+        self.end_date = end_date
+        self.now = now
+        self.backend = backend
+        self.posts = []
+        self.seen_urls = set()
+        self.oldest = None
+        self.n_cards = 0       # 지금까지 브라우저에서 받은 카드 수 (Selenium 모드)
+        self.stop = False      # START_DATE 보다 과거 글이 나오면 True (최신순 전제)
+
+    # 카드가 들어 있는 HTML 조각 → 범위 내 새 글만 posts 에 추가, 추가된 개수 반환
+    def feed(self, html: str) -> int:
+        added = 0
+        for rec in parse_article_cards(html, self.now, backend=self.backend):
+            url = rec["url"]
+            if url in self.seen_urls:
+                continue
+            self.seen_urls.add(url)
+
+            d = datetime.fromisoformat(rec["date"]).date()
+            self.oldest = d if self.oldest is None else min(self.oldest, d)
+
+            if d < self.start_date:
+                self.stop = True
+                break
+            if d > self.end_date:
+                continue
+
+            self.posts.append(rec)
+            added += 1
+        return added
+
+    # Selenium: 아직 받지 않은 URL 의 카드만 가져와 처리
+    def collect_new(self, driver) -> int:
+        htmls = driver.execute_script(_NEW_CARDS_JS)
+        self.n_cards += len(htmls)
+        if not htmls:
+            return 0
+        self.feed("".join(htmls))
+        return len(htmls)
+
+
+# Selenium 스크롤 수집 (필터/정렬은 노트북에서 적용한 뒤 호출)
+def collect_list_selenium(driver, start_date, end_date, max_scroll=400, scroll_pause=1.2,
+                          max_stuck=10, wait_new_timeout=18, now: datetime = None,
+                          backend="bs4") -> list:
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    col = BlindListCollector(start_date, end_date, now, backend=backend)
+    stuck = 0
+
+    for i in range(max_scroll):
+        n_new = col.collect_new(driver)
+        print(f"[스크롤 {i+1}] 새 카드: {n_new} / 누적(범위내): {len(col.posts)} / 최하단 {col.oldest}")
+
+        if col.stop:
+            print(f"✅ {start_date} 이전 도달 → 리스트 수집 종료")
+            break
+        if n_new == 0:
+            stuck += 1
+            if stuck >= max_stuck:
+                print("⚠️ 새 카드가 더 이상 안 늘어남 → 종료")
+                break
+        else:
+            stuck = 0
+
+        # 마지막 카드로 이동 + 새 URL 카드 대기 (WebElement 목록을 받아오지 않고 브라우저 안에서 처리)
+        driver.execute_script(_SCROLL_LAST_JS)
+        sleep(scroll_pause)
+
+        try:
+            WebDriverWait(driver, wait_new_timeout).until(
+                lambda d: d.execute_script(_HAS_NEW_CARDS_JS)
+            )
+        except TimeoutException:
+            pass
+
+    return col.posts
+
+
+# =========================
+# 5) 리스트 수집: Selenium 없이 목록 페이지 직접 요청
+# =========================
+# url_template: "{page}" 자리에 페이지 번호가 들어가는 목록 URL
+#   (카드 HTML 을 돌려주는 목록 엔드포인트. 로컬 테스트는 mockserver 의 /kr/search/...?page=N)
+# 빈 페이지 / 새 카드 없음 / START_DATE 이전 도달 시 종료
+# sink 를 주면 페이지마다 범위 내 새 글을 sink 로 넘기고 비움 → 빈 리스트 반환
+def collect_list_http(session, url_template: str, start_date, end_date, max_pages=1000,
+                      sleep_sec=0.3, now: datetime = None, backend="bs4", verbose=True,
+                      sink=None) -> list:
+    col = BlindListCollector(start_date, end_date, now, backend=backend)
+    total = 0
+
+    for page in range(1, max_pages + 1):
+        r = session.get(url_template.format(page=page), timeout=12)
+        r.raise_for_status()
+
+        n_seen, n_posts = len(col.seen_urls), len(col.posts)
+        col.feed(r.text)
+        n_new = len(col.seen_urls) - n_seen
+        total += len(col.posts) - n_posts
+        if sink is not None:
+            sink.write_many(col.posts)
+            col.posts.clear()
+
+        if verbose:
+            print(f"[{page}페이지] 새 카드: {n_new} / 누적(범위내): {total} / 최하단 {col.oldest}")
+
+        if col.stop:
+            if verbose:
+                print(f"✅ {start_date} 이전 도달 → 리스트 수집 종료")
+            break
+        if n_new == 0:
+            if verbose:
+                print("⚠️ 새 카드 없음 → 종료")
+            break
+        if sleep_sec:
+            sleep(sleep_sec)
+
+    return col.posts
@@ -0,0 +1,249 @@
+import hashlib
+import os
+import sqlite3
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from functools import partial
+from urllib.parse import parse_qs, urlsplit
+
+import zstandard as zstd
+from requests.adapters import HTTPAdapter
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+
+from . import blind, dc
+from .fmkorea import parse_list_page, parse_post_detail_html
+
+
+# =========================
+# 원본 HTML 아카이브 (zstd 압축, 내용 주소 저장)
+# =========================
+# root/
+#   index.sqlite        (url, fetched_at) → sha256, status, content-type
+#   objects/ab/abcd...  본문 bytes 를 zstd 로 압축한 파일 (sha256 이름 → 같은 본문은 1번만 저장)
+#
+# 셀렉터가 깨졌거나 새 필드(예: 인기글 댓글수)가 필요할 때
+# 다시 크롤링하지 않고 replay_* 로 디스크에서 바로 재파싱한다.
+class ResponseArchive:
+    def __init__(self, root: str, level=10):
+        self.root = root
+        self.level = level
+        os.makedirs(os.path.join(root, "objects"), exist_ok=True)
+        self._lock = threading.Lock()
+        self._local = threading.local()  # zstd 압축기는 스레드 간 공유 불가
+        self.conn = sqlite3.connect(os.path.join(root, "index.sqlite"), check_same_thread=False)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS responses (
+                url        TEXT NOT NULL,
+                fetched_at TEXT NOT NULL,
+                status     INTEGER NOT NULL,
+                content_type TEXT,
+                sha256     TEXT NOT NULL,
+                size       INTEGER NOT NULL,
+                PRIMARY KEY (url, fetched_at)
+            );
+        """)
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+    def _cctx(self):
+        if not hasattr(self._local, "c"):
+            self._local.c = zstd.ZstdCompressor(level=self.level)
+            self._local.d = zstd.ZstdDecompressor()
+        return self._local
+
+    def _obj_path(self, sha: str) -> str:
+        return os.path.join(self.root, "objects", sha[:2], sha)
+
+    # 응답 1건 저장
+    def put(self, url: str, status: int, body: bytes, content_type="text/html; charset=utf-8",
+            fetched_at: str = None) -> str:
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        sha = hashlib.sha256(body).hexdigest()
+        path = self._obj_path(sha)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(self._cctx().c.compress(body))
+            os.replace(tmp, path)
+
+        fetched_at = fetched_at or datetime.now().isoformat(timespec="microseconds")
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (url, fetched_at, status, content_type, sha, len(body)),
+            )
+            self.conn.commit()
+        return sha
+
+    def read_body(self, sha: str) -> bytes:
+        with open(self._obj_path(sha), "rb") as f:
+            return self._cctx().d.decompress(f.read())
+
+    # url 의 가장 최근 응답 (없으면 None) → (status, content_type, body)
+    def get(self, url: str):
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT status, content_type, sha256 FROM responses WHERE url=? "
+                "ORDER BY fetched_at DESC LIMIT 1", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        return row[0], row[1], self.read_body(row[2])
+
+    # 저장된 응답 목록 → (url, fetched_at, sha256)
+    # url_like: SQL LIKE 패턴 (예: "%search.php%"), latest=True 면 URL 당 최신 1건만
+    def entries(self, url_like="%", latest=True, status=200):
+        if latest:
+            q = ("SELECT url, MAX(fetched_at), sha256 FROM responses "
+                 "WHERE url LIKE ? AND status=? GROUP BY url ORDER BY url")
+        else:
+            q = ("SELECT url, fetched_at, sha256 FROM responses "
+                 "WHERE url LIKE ? AND status=? ORDER BY url, fetched_at")
+        with self._lock:
+            return self.conn.execute(q, (url_like, status)).fetchall()
+
+
+# =========================
+# requests 세션 밑에 붙이는 어댑터
+# =========================
+# mode="record": 실제로 요청하고 응답을 아카이브에 저장 (Retry 설정은 그대로 동작)
+# mode="replay": 네트워크 없이 아카이브에서만 응답 (없으면 504)
+#
+#   session = build_session()
+#   attach_archive(session, ResponseArchive("../data/raw_html"))
+class ArchiveAdapter(HTTPAdapter):
+    def __init__(self, archive: ResponseArchive, mode="record", **kwargs):
+        super().__init__(**kwargs)
+        self.archive = archive
+        self.mode = mode
+
+    def send(self, request, **kwargs):
+        if self.mode == "replay":
+            return self._replay(request)
+
+        resp = super().send(request, **kwargs)
+        if request.method == "GET":
+            body = resp.content  # 본문을 읽어 둠 (이후 r.text 도 그대로 사용 가능)
+            self.archive.put(request.url, resp.status_code, body,
+                             resp.headers.get("Content-Type", ""))
+        return resp
+
+    def _replay(self, request):
+        hit = self.archive.get(request.url)
+        resp = Response()
+        resp.request = request
+        resp.url = request.url
+        resp.headers = CaseInsensitiveDict()
+        if hit is None:
+            resp.status_code = 504
+            resp.reason = "Not in archive"
+            resp._content = b""
+            return resp
+        status, content_type, body = hit
+        resp.status_code = status
+        resp.headers["Content-Type"] = content_type or "text/html; charset=utf-8"
+        resp.encoding = "utf-8"
+        resp._content = body
+        return resp
+
+
+# 기존 세션의 어댑터 설정(Retry/풀 크기)을 유지한 채 아카이브 어댑터로 교체
+def attach_archive(session, archive: ResponseArchive, mode="record"):
+    for prefix in ("https://", "http://"):
+        old = session.get_adapter(prefix + "x")
+        ad = ArchiveAdapter(
+            archive, mode=mode,
+            max_retries=old.max_retries,
+            pool_connections=getattr(old, "_pool_connections", 10),
+            pool_maxsize=getattr(old, "_pool_maxsize", 10),
+        )
+        session.mount(prefix, ad)
+    return session
+
+
+# =========================
+# Replay: 디스크에서 바로 재파싱
+# =========================
+# 여러 프로세스로 나눠 BeautifulSoup 파싱만 수행 (네트워크 없음)
+# parser(html, url, fetched_at): "17:27" / "3시간" 같은 상대 날짜는 수집 시각 기준으로 해석
+def _parse_entry(root, parser, entry):
+    url, fetched_at, sha = entry
+    archive = _worker_archive(root)
+    html = archive.read_body(sha).decode("utf-8", errors="replace")
+    return url, fetched_at, parser(html, url, fetched_at)
+
+
+_ARCHIVES = {}
+
+
+def _worker_archive(root):
+    if root not in _ARCHIVES:
+        _ARCHIVES[root] = ResponseArchive(root)
+    return _ARCHIVES[root]
+
+
+def replay(archive: ResponseArchive, parser, url_like="%", exclude=(), latest=True,
+           workers=None, chunksize=64):
+    entries = [e for e in archive.entries(url_like, latest=latest)
+               if not any(x in e[0] for x in exclude)]
+    fn = partial(_parse_entry, archive.root, parser)
+    if workers == 1 or len(entries) < chunksize:
+        return [fn(e) for e in entries]
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        return list(ex.map(fn, entries, chunksize=chunksize))
+
+
+# FmKorea 검색 목록: source 는 URL 의 search_keyword 로 복원
+def _fmkorea_list_parser(html, url, fetched_at):
+    q = parse_qs(urlsplit(url).query)
+    source = q.get("search_keyword", [""])[0]
+    return parse_list_page(html, source, today=fetched_at[:10])
+
+
+def _fmkorea_detail_parser(html, url, fetched_at):
+    return parse_post_detail_html(html, url, today=fetched_at[:10])
+
+
+def _dc_list_parser(html, url, fetched_at):
+    return dc.parse_gall_list(html)
+
+
+def _blind_list_parser(html, url, fetched_at):
+    return blind.parse_article_cards(html, now=datetime.fromisoformat(fetched_at))
+
+
+def replay_fmkorea_list(archive, url_like="%fmkorea.com/search.php%", **kwargs) -> list:
+    rows = []
+    for _, _, records in replay(archive, _fmkorea_list_parser, url_like, **kwargs):
+        rows.extend(records or [])
+    return rows
+
+
+# 검색 목록 페이지는 제외하고 상세 페이지만
+def replay_fmkorea_details(archive, url_like="%fmkorea.com/%", **kwargs) -> list:
+    kwargs.setdefault("exclude", ("search.php",))
+    return [post for _, _, post in replay(archive, _fmkorea_detail_parser, url_like, **kwargs)]
+
+
+def replay_dc_list(archive, url_like="%/board/lists/%", **kwargs) -> list:
+    rows = []
+    for _, _, records in replay(archive, _dc_list_parser, url_like, **kwargs):
+        rows.extend(records or [])
+    return rows
+
+
+# Blind 목록은 Selenium page_source 스냅샷을 archive.put 으로 직접 저장해 둔 것을 사용
+def replay_blind_list(archive, url_like="%teamblind.com%", **kwargs) -> list:
+    rows, seen = [], set()
+    for _, _, records in replay(archive, _blind_list_parser, url_like, **kwargs):
+        for r in records:
+            if r["url"] not in seen:
+                seen.add(r["url"])
+                rows.append(r)
+    return rows
@@ -0,0 +1,223 @@
+import sqlite3
+import time
+from datetime import datetime
+
+import pandas as pd
+
+from .engine import Crawler
+from .fmkorea import COLUMNS, parse_list_page
+from .sites import BlindAdapter, DCAdapter
+
+
+# =========================
+# 증분 크롤링 상태 저장소 (SQLite 파일 1개)
+# =========================
+# - seen   : 이미 수집한 게시글 키 (사이트 공통으로 post_url)
+# - cursor : (사이트, 검색어)별 마지막으로 끝낸 페이지 + 완료 여부
+#
+#   state = CrawlState("../data/crawl_state.sqlite")
+#   df_new = crawl_incremental(session, url_base_hynix, "하이닉스", state)
+#
+# 매일 돌리면 1페이지부터 보다가 "이미 본 글만 있는 페이지"에서 멈추고,
+# 중간에 끊긴 실행은 cursor 다음 페이지부터 이어서 수집한다.
+class CrawlState:
+    def __init__(self, path: str):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS seen (
+                site TEXT NOT NULL,
+                key  TEXT NOT NULL,
+                first_seen TEXT NOT NULL,
+                PRIMARY KEY (site, key)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS cursor (
+                site    TEXT NOT NULL,
+                keyword TEXT NOT NULL,
+                page    INTEGER NOT NULL,
+                done    INTEGER NOT NULL DEFAULT 0,
+                updated_at TEXT NOT NULL,
+                PRIMARY KEY (site, keyword)
+            );
+        """)
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ---------- seen index ----------
+    def is_seen(self, site: str, key: str) -> bool:
+        cur = self.conn.execute("SELECT 1 FROM seen WHERE site=? AND key=?", (site, key))
+        return cur.fetchone() is not None
+
+    # keys 중 아직 없는 것만 (입력 순서 유지)
+    def filter_new(self, site: str, keys) -> list:
+        keys = [str(k) for k in keys]
+        known = set()
+        for i in range(0, len(keys), 500):
+            chunk = keys[i:i + 500]
+            q = "SELECT key FROM seen WHERE site=? AND key IN (%s)" % ",".join("?" * len(chunk))
+            known.update(k for (k,) in self.conn.execute(q, [site, *chunk]))
+        return [k for k in keys if k not in known]
+
+    def mark_seen(self, site: str, keys):
+        now = datetime.now().isoformat(timespec="seconds")
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO seen(site, key, first_seen) VALUES (?, ?, ?)",
+            [(site, str(k), now) for k in keys],
+        )
+        self.conn.commit()
+
+    def seen_count(self, site: str = None) -> int:
+        if site is None:
+            return self.conn.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+        return self.conn.execute("SELECT COUNT(*) FROM seen WHERE site=?", (site,)).fetchone()[0]
+
+    # 기존 CSV(1.csv ~ 5.csv 등)로 seen 인덱스 초기화
+    def seed_from_csv(self, site: str, csv_path: str, key_col="post_url"):
+        df = pd.read_csv(csv_path, usecols=[key_col], encoding="utf-8-sig")
+        self.mark_seen(site, df[key_col].dropna().astype(str).unique())
+
+    # ---------- cursor ----------
+    def get_cursor(self, site: str, keyword: str):
+        cur = self.conn.execute(
+            "SELECT page, done, updated_at FROM cursor WHERE site=? AND keyword=?", (site, keyword)
+        )
+        row = cur.fetchone()
+        if row is None:
+            return None
+        return {"page": row[0], "done": bool(row[1]), "updated_at": row[2]}
+
+    def set_cursor(self, site: str, keyword: str, page: int, done=False):
+        now = datetime.now().isoformat(timespec="seconds")
+        self.conn.execute(
+            "INSERT OR REPLACE INTO cursor(site, keyword, page, done, updated_at) VALUES (?, ?, ?, ?, ?)",
+            (site, keyword, page, int(done), now),
+        )
+        self.conn.commit()
+
+
+# =========================
+# 공통 증분 루프
+# =========================
+# fetch_page(page) -> 행(dict) 리스트, 행이 없으면 None
+# key: 행에서 seen 인덱스 키로 쓸 필드 이름
+#
+# 중단 조건
+# - rows=0 (목록 끝) / page_added=0 (파싱된 행 없음)  → 기존과 동일
+# - 페이지의 모든 행이 이미 본 글                      → 증분 중단 (stop_on_known=True)
+#
+# sink(RowSink)를 주면 페이지마다 새 글을 sink 에 쓰고 flush 한 "다음에" seen + cursor 를 커밋한다.
+# 중간에 끊겨도 seen 으로 표시된 글은 이미 파일에 있으므로, 다음 실행은 cursor 다음 페이지부터
+# 이어서 수집하면 된다 (resume). 이때 반환값은 빈 리스트.
+# sink 가 없으면 행은 메모리에만 있으므로 seen + cursor 는 루프가 정상 종료된 뒤 한 번에 커밋한다
+# (중간에 끊기면 아무것도 커밋되지 않고 다음 실행이 처음부터 다시 수집).
+# 정상 종료 시 cursor 를 done 으로 표시 → 다음 실행은 다시 start_page 부터(새 글 확인).
+def incremental_pages(fetch_page, state: CrawlState, site: str, keyword: str,
+                      start_page=1, end_page=10_000, key="post_url", stop_on_known=True,
+                      sleep_sec=0.0, verbose=True, sink=None) -> list:
+    cursor = state.get_cursor(site, keyword)
+    if cursor and not cursor["done"] and cursor["page"] >= start_page:
+        start_page = cursor["page"] + 1
+        if verbose:
+            print(f"[{keyword}] 이전 실행 이어서: {start_page}페이지부터")
+
+    out, pending = [], []
+    pending_keys = set()   # sink 없이 이번 실행에서 본 키 (아직 커밋 전)
+    total = 0
+    last_page = start_page - 1
+    for page in range(start_page, end_page + 1):
+        records = fetch_page(page)
+        if records is None:
+            if verbose:
+                print(f"[{keyword}] {page}페이지: rows=0 → 중단")
+            break
+        if not records:
+            if verbose:
+                print(f"[{keyword}] {page}페이지: page_added=0 → 중단")
+            break
+
+        new_keys = set(state.filter_new(site, [r[key] for r in records])) - pending_keys
+        new_records = [r for r in records if str(r[key]) in new_keys]
+        total += len(new_records)
+        if sink is not None:
+            sink.write_many(new_records)
+            sink.flush()
+            state.mark_seen(site, new_keys)
+            state.set_cursor(site, keyword, page)
+        else:
+            out.extend(new_records)
+            pending.extend(k for k in new_keys)
+            pending_keys |= new_keys
+        last_page = page
+
+        if verbose:
+            print(f"[{keyword}] {page}페이지 완료 / 새 글 {len(new_records)}개 / 누적 {total}개")
+
+        if stop_on_known and not new_records:
+            if verbose:
+                print(f"[{keyword}] {page}페이지: 이미 수집한 글만 있음 → 중단")
+            break
+
+        if sleep_sec:
+            time.sleep(sleep_sec)
+
+    if pending:
+        state.mark_seen(site, pending)
+    state.set_cursor(site, keyword, last_page, done=True)
+    return out
+
+
+# FmKorea 검색 결과 증분 수집 → 새 글만 담은 DataFrame (crawl_one 과 같은 컬럼)
+# sink 를 주면 새 글은 sink 로 가고 빈 DataFrame 반환
+def crawl_incremental(session, url_base: str, source_name: str, state: CrawlState,
+                      start_page=1, end_page=10_000, sleep_sec=2, site="fmkorea",
+                      verbose=True, sink=None) -> pd.DataFrame:
+    def fetch_page(page):
+        r = session.get(url_base.format(page), timeout=20)
+        r.raise_for_status()
+        return parse_list_page(r.text, source_name)
+
+    records = incremental_pages(fetch_page, state, site, source_name, start_page, end_page,
+                                key="post_url", sleep_sec=sleep_sec, verbose=verbose, sink=sink)
+    return pd.DataFrame(records, columns=COLUMNS)
+
+
+# =========================
+# 어댑터 기반 증분 수집 (DC / Blind / FmKorea 공통 스키마)
+# =========================
+# Crawler.fetch + adapter.parse_list 로 목록을 읽어 incremental_pages 에 넘긴다.
+# seen 키는 공통 스키마의 post_url, cursor 는 (adapter.name, keyword).
+#
+#   state = CrawlState("../data/crawl_state.sqlite")
+#   with JsonlSink("../data/dc_kospi") as sink:
+#       crawl_incremental_dc("kospi", state, sink=sink)
+#   with JsonlSink("../data/blind_samsung") as sink:
+#       crawl_incremental_blind("삼성전자", state, sink=sink)
+def crawl_incremental_site(adapter, keyword: str, state: CrawlState, crawler: Crawler = None,
+                           start_page=1, end_page=10_000, sleep_sec=2, verbose=True,
+                           sink=None) -> list:
+    crawler = crawler or Crawler(sleep_sec=0, verbose=verbose)
+
+    def fetch_page(page):
+        html = crawler.fetch(adapter, adapter.list_url(keyword, page), keyword)
+        return adapter.parse_list(html, keyword, datetime.now())
+
+    return incremental_pages(fetch_page, state, adapter.name, keyword, start_page, end_page,
+                             key="post_url", sleep_sec=sleep_sec, verbose=verbose, sink=sink)
+
+
+# DC 갤러리 (keyword = 갤러리 id, 예: "kospi")
+def crawl_incremental_dc(gallery_id: str, state: CrawlState, base_url: str = None, **kwargs) -> list:
+    return crawl_incremental_site(DCAdapter(base_url), gallery_id, state, **kwargs)
+
+
+# Blind 검색 결과 (?page=N 목록)
+def crawl_incremental_blind(keyword: str, state: CrawlState, base_url: str = None, **kwargs) -> list:
+    return crawl_incremental_site(BlindAdapter(base_url), keyword, state, **kwargs)
@@ -0,0 +1,121 @@
+import json
+import mmap
+import os
+import re
+
+# 줄 앞부분에서 "date": "YYYY-MM-DD..." 만 뽑는다 (문자열 안의 따옴표는 \" 로 이스케이프돼 있어 오탐 없음)
+_DATE_RE = re.compile(rb'"date"\s*:\s*"(\d{4}[-.]\d{2}[-.]\d{2})')
+
+
+# =========================
+# 상세 JSONL 날짜 → 바이트 위치 인덱스
+# =========================
+# kiwipiepy.ipynb 는 TARGET_DATE 하루를 보려고 fmkorea_*_hot_posts.jsonl 전체를 읽고
+# 모든 줄을 json.loads 한 뒤 post["date"] 를 비교했다.
+#
+# 옆에 <jsonl>.dateidx 파일(날짜\t시작바이트\t길이)을 두고
+# 그 날짜의 줄만 mmap 으로 바로 잘라 읽는다.
+# - JSONL 에 줄이 추가되면(collect_details 등) 다음 조회 때 늘어난 뒷부분만 색인 (refresh)
+# - 파일이 줄었으면(다시 쓴 경우) 처음부터 다시 색인
+# - 크래시로 잘린 마지막 줄(개행 없음)은 색인하지 않음
+#
+#   idx = JsonlDateIndex("../data/fmkorea_hynix_hot_posts.jsonl")
+#   posts = idx.read("2025-11-04")
+#   for post in idx.iter_range("2026-01-01", "2026-01-16"): ...
+class JsonlDateIndex:
+    def __init__(self, jsonl_path: str, index_path: str = None):
+        self.jsonl_path = jsonl_path
+        self.index_path = index_path or jsonl_path + ".dateidx"
+        self.offsets = {}       # date → [(offset, length), ...]
+        self.indexed_upto = 0   # 색인이 끝난 JSONL 바이트 위치
+        self._load()
+        self.refresh()
+
+    def _load(self):
+        if not os.path.exists(self.index_path):
+            return
+        with open(self.index_path, encoding="utf-8") as f:
+            for line in f:
+                parts = line.rstrip("\n").split("\t")
+                if len(parts) != 3:
+                    continue  # 잘린 줄
+                d, off, n = parts[0], int(parts[1]), int(parts[2])
+                self.offsets.setdefault(d, []).append((off, n))
+                self.indexed_upto = max(self.indexed_upto, off + n)
+
+    def _reset(self):
+        self.offsets = {}
+        self.indexed_upto = 0
+        if os.path.exists(self.index_path):
+            os.remove(self.index_path)
+
+    @staticmethod
+    def _line_date(line: bytes) -> str:
+        m = _DATE_RE.search(line)
+        if m:
+            return m.group(1).decode().replace(".", "-")
+        try:
+            d = json.loads(line).get("date") or ""
+        except (json.JSONDecodeError, UnicodeDecodeError, AttributeError):
+            return ""
+        return str(d)[:10].replace(".", "-")
+
+    # JSONL 에서 아직 색인 안 된 뒷부분만 읽어 인덱스에 추가 → 새로 색인한 줄 수
+    def refresh(self) -> int:
+        if not os.path.exists(self.jsonl_path):
+            return 0
+        size = os.path.getsize(self.jsonl_path)
+        if size < self.indexed_upto:
+            self._reset()
+        if size == self.indexed_upto:
+            return 0
+
+        rows = []
+        with open(self.jsonl_path, "rb") as f:
+            f.seek(self.indexed_upto)
+            pos = self.indexed_upto
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                if line.strip():
+                    d = self._line_date(line)
+                    if d:
+                        rows.append((d, pos, len(line)))
+                pos += len(line)
+
+        with open(self.index_path, "a", encoding="utf-8") as f:
+            f.write("".join(f"{d}\t{off}\t{n}\n" for d, off, n in rows))
+        for d, off, n in rows:
+            self.offsets.setdefault(d, []).append((off, n))
+        self.indexed_upto = pos
+        return len(rows)
+
+    def dates(self) -> list:
+        return sorted(self.offsets)
+
+    def count(self, date: str) -> int:
+        return len(self.offsets.get(date, ()))
+
+    def _iter(self, spans):
+        if not spans:
+            return
+        with open(self.jsonl_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            for off, n in spans:
+                yield json.loads(m[off:off + n])
+
+    # 하루치 게시글 (파일 순서)
+    def read(self, date: str) -> list:
+        self.refresh()
+        return list(self._iter(self.offsets.get(date, ())))
+
+    # start ~ end (문자열 비교, 둘 다 포함) 게시글을 날짜순으로
+    def iter_range(self, start: str = None, end: str = None):
+        self.refresh()
+        for d in self.dates():
+            if (start and d < start) or (end and d > end):
+                continue
+            yield from self._iter(self.offsets[d])
+
+    # 읽게 될 바이트 수 (전체 파일 대비 얼마나 줄었는지 확인용)
+    def span_bytes(self, dates) -> int:
+        return sum(n for d in dates for _, n in self.offsets.get(d, ()))
@@ -0,0 +1,274 @@
+import json
+import os
+import re
+import time
+from datetime import date, datetime, timedelta
+
+from bs4 import BeautifulSoup as bs
+
+# =========================
+# 0) 접속 정보 / 컬럼
+# =========================
+BASE_URL = "https://gall.dcinside.com"
+LIST_URL = BASE_URL + "/mgallery/board/lists/?id={gal_id}&page={page}"
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/143.0.0.0 Safari/537.36"
+}
+
+COLUMNS = ["post_id", "subject", "title", "date", "view_count", "recommend_count", "post_url"]
+
+# 말머리가 이 값이면 일반 게시글이 아님
+SKIP_SUBJECTS = ("설문", "AD", "공지")
+
+
+def list_url(gal_id: str, page: int) -> str:
+    return LIST_URL.format(gal_id=gal_id, page=page)
+
+
+# =========================
+# 1) 갤러리 목록(table.gall_list) 파싱
+# =========================
+# 목록 HTML 한 페이지 → 행(dict) 리스트, 테이블이 없으면 None
+# 값은 노트북과 같이 원본 문자열 그대로 (날짜/조회수 정리는 정규화 단계에서)
+# backend: "bs4"(기본) / "lxml" / "selectolax" (extract.py)
+def parse_gall_list(html: str, backend="bs4"):
+    if backend != "bs4":
+        from .extract import get_backend
+        return get_backend(backend).dc_list(html)
+
+    soup = bs(html, "lxml")
+    table = soup.select_one("table.gall_list")
+    if table is None:
+        return None
+
+    records = []
+    for tr in table.select("tbody tr"):  # tr : 게시글 목록에서 한 row
+        subject_td = tr.select_one("td.gall_subject")
+        title_a = tr.select_one("td.gall_tit a")
+        if subject_td is None or title_a is None:
+            continue
+        subject = subject_td.text.strip()
+        if subject in SKIP_SUBJECTS:
+            continue
+
+        records.append({
+            "post_id": tr.select_one("td.gall_num").text.strip(),
+            "subject": subject,
+            "title": title_a.text.strip(),
+            "date": tr.select_one("td.gall_date").text.strip(),
+            "view_count": tr.select_one("td.gall_count").text.strip(),
+            "recommend_count": tr.select_one("td.gall_recommend").text.strip(),
+            "post_url": BASE_URL + title_a.attrs["href"],
+        })
+    return records
+
+
+# =========================
+# 2) 게시글 상세
+# =========================
+def parse_content(html: str) -> str:
+    soup = bs(html, "lxml")
+    body = soup.select(".write_div")
+    return " ".join(b.get_text(" ", strip=True) for b in body)
+
+
+def parse_comment_count(html: str) -> int:
+    soup = bs(html, "lxml")
+    comment_span = soup.select_one("span.gall_comment a")
+    if not comment_span:
+        return 0
+    count = re.sub(r"[^\d]", "", comment_span.get_text(strip=True))  # "댓글 20" → 20
+    return int(count) if count else 0
+
+
+# =========================
+# 3) 작성일 파싱
+# =========================
+# gall_date 표시 형식: 오늘 "HH:MM" / 올해 "MM.DD" / 그 이전 "YY.MM.DD"
+# title 속성에는 "YYYY-MM-DD HH:MM:SS" 전체 시각이 있으므로 있으면 그걸 우선 사용
+def parse_gall_date(text: str, today: date = None, title: str = None):
+    if title:
+        try:
+            return datetime.strptime(title.strip()[:10], "%Y-%m-%d").date()
+        except ValueError:
+            pass
+
+    today = today or date.today()
+    raw = (text or "").strip()
+    if re.fullmatch(r"\d{1,2}:\d{2}", raw):
+        return today
+    if re.fullmatch(r"\d{1,2}\.\d{1,2}", raw):
+        m, d = map(int, raw.split("."))
+        return date(today.year, m, d)
+    if re.fullmatch(r"\d{2}\.\d{2}\.\d{2}", raw):
+        y, m, d = map(int, raw.split("."))
+        return date(2000 + y, m, d)
+    return None
+
+
+# 목록 HTML → 일반 게시글 작성일 리스트 (공지/AD/설문 제외, 목록 순서)
+def page_dates(html: str, today: date = None) -> list:
+    soup = bs(html, "lxml")
+    out = []
+    for tr in soup.select("table.gall_list tbody tr"):
+        subject_td = tr.select_one("td.gall_subject")
+        date_td = tr.select_one("td.gall_date")
+        if subject_td is None or date_td is None:
+            continue
+        if subject_td.text.strip() in SKIP_SUBJECTS:
+            continue
+        d = parse_gall_date(date_td.text, today, date_td.get("title"))
+        if d is not None:
+            out.append(d)
+    return out
+
+
+# =========================
+# 4) 날짜 → 페이지 위치 찾기 (이진 탐색)
+# =========================
+# 목록은 최신순이므로 페이지 번호가 커질수록 날짜가 과거로 간다.
+# 각 페이지의 (가장 최신, 가장 오래된) 작성일만 보고 이진 탐색해서
+# [start_date, end_date] 에 걸치는 첫/마지막 페이지를 O(log n) 요청으로 찾는다.
+#
+#   loc = PageLocator(session, "kospi", cache_path="../data/dc_page_index.json")
+#   first, last = loc.find_bounds(date(2025, 1, 14), date(2026, 1, 14))
+#
+# 페이지 ↔ 날짜 관측값은 gal_id 별로 JSON 에 저장해 두고 max_age 동안 재사용
+# (새 글이 올라오면 페이지가 밀리므로 오래된 관측값은 버린다)
+class PageLocator:
+    def __init__(self, session, gal_id: str, cache_path: str = None, max_age_hours=6,
+                 url_fmt=LIST_URL, sleep_sec=0.3, verbose=True):
+        self.session = session
+        self.gal_id = gal_id
+        self.cache_path = cache_path
+        self.max_age = timedelta(hours=max_age_hours)
+        self.url_fmt = url_fmt
+        self.sleep_sec = sleep_sec
+        self.verbose = verbose
+        self.requests = 0
+        self._pages = self._load()
+
+    # ---------- 캐시 ----------
+    def _load(self) -> dict:
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return {}
+        with open(self.cache_path, "r", encoding="utf-8") as f:
+            allc = json.load(f)
+        now = datetime.now()
+        pages = {}
+        for p, v in allc.get(self.gal_id, {}).items():
+            if now - datetime.fromisoformat(v["fetched_at"]) <= self.max_age:
+                pages[int(p)] = v
+        return pages
+
+    def _save(self):
+        if not self.cache_path:
+            return
+        allc = {}
+        if os.path.exists(self.cache_path):
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                allc = json.load(f)
+        allc[self.gal_id] = {str(p): v for p, v in sorted(self._pages.items())}
+        tmp = self.cache_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(allc, f, ensure_ascii=False, indent=1)
+        os.replace(tmp, self.cache_path)
+
+    # ---------- 페이지 날짜 범위 ----------
+    # page → (newest, oldest), 빈 페이지(마지막 페이지 이후)는 None
+    def page_range(self, page: int):
+        if page not in self._pages:
+            url = self.url_fmt.format(gal_id=self.gal_id, page=page)
+            r = self.session.get(url, timeout=10)
+            r.raise_for_status()
+            self.requests += 1
+            ds = page_dates(r.text)
+            self._pages[page] = {
+                "newest": max(ds).isoformat() if ds else None,
+                "oldest": min(ds).isoformat() if ds else None,
+                "fetched_at": datetime.now().isoformat(timespec="seconds"),
+            }
+            if self.verbose:
+                v = self._pages[page]
+                print(f"[{self.gal_id}] {page}페이지: {v['newest']} ~ {v['oldest']}")
+            if self.sleep_sec:
+                time.sleep(self.sleep_sec)
+
+        v = self._pages[page]
+        if v["newest"] is None:
+            return None
+        return date.fromisoformat(v["newest"]), date.fromisoformat(v["oldest"])
+
+    # pred(page) 가 단조(False...False True...True)일 때 처음 True 인 페이지, 없으면 hi + 1
+    def _first_true(self, pred, lo: int, hi: int) -> int:
+        while lo <= hi:
+            mid = (lo + hi) // 2
+            if pred(mid):
+                hi = mid - 1
+            else:
+                lo = mid + 1
+        return lo
+
+    # start_date 보다 과거이거나 빈 페이지가 나올 때까지 1, 2, 4, 8 ... 로 상한을 찾음
+    def _upper_bound(self, start_date, max_page=None) -> int:
+        if max_page:
+            return max_page
+        p = 1
+        while True:
+            rng = self.page_range(p)
+            if rng is None or rng[0] < start_date:
+                return p
+            p *= 2
+
+    def find_bounds(self, start_date, end_date, max_page=None):
+        try:
+            hi = self._upper_bound(start_date, max_page)
+
+            # 첫 페이지: oldest <= end_date 인 가장 작은 페이지
+            def older_than_end(p):
+                rng = self.page_range(p)
+                return rng is None or rng[1] <= end_date
+
+            # 마지막 페이지 + 1: newest < start_date (또는 빈 페이지)인 가장 작은 페이지
+            def before_start(p):
+                rng = self.page_range(p)
+                return rng is None or rng[0] < start_date
+
+            first = self._first_true(older_than_end, 1, hi)
+            last = self._first_true(before_start, first, hi) - 1
+        finally:
+            self._save()
+
+        if self.verbose:
+            print(f"[{self.gal_id}] {start_date} ~ {end_date} → {first} ~ {last}페이지 (요청 {self.requests}번)")
+        if last < first:
+            return None
+        return first, last
+
+
+# 기간 안의 글만 수집: 페이지 범위를 찾은 뒤 그 안의 목록 페이지만 요청
+def crawl_date_range(session, gal_id: str, start_date, end_date, locator: PageLocator = None,
+                     sleep_sec=0.3, backend="bs4", verbose=True) -> list:
+    locator = locator or PageLocator(session, gal_id, sleep_sec=sleep_sec, verbose=verbose)
+    bounds = locator.find_bounds(start_date, end_date)
+    if bounds is None:
+        return []
+
+    first, last = bounds
+    today = date.today()
+    out = []
+    for page in range(first, last + 1):
+        r = session.get(locator.url_fmt.format(gal_id=gal_id, page=page), timeout=10)
+        r.raise_for_status()
+
+        for rec in parse_gall_list(r.text, backend=backend) or []:
+            d = parse_gall_date(rec["date"], today)
+            if d is not None and start_date <= d <= end_date:
+                out.append(rec)
+
+        if verbose and page % 100 == 0:
+            print(f"{page}페이지 크롤링 완료")
+        if sleep_sec:
+            time.sleep(sleep_sec)
+    return out
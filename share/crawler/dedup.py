@@ -0,0 +1,139 @@
+import sqlite3
+import threading
+from datetime import datetime
+
+import pandas as pd
+
+
+# =========================
+# 검색어 간 중복 제거 레지스트리
+# =========================
+# "하이닉스" + "하닉", "삼성전자" + "삼전" 검색 결과는 상당 부분 겹친다.
+# 예전에는 전부 모은 뒤 pd.concat → drop_duplicates(subset=["post_url"]) 라서
+# 그 사이 상세 페이지를 겹치는 만큼 중복으로 요청했다.
+#
+# 레지스트리를 크롤 전체(모든 검색어/사이트 작업)에서 같이 쓰면
+# - 목록에서 본 글은 (site, post_url) 로 한 번만 등록 → 매칭된 검색어는 전부 기록
+# - 상세 페이지는 글마다 한 번만 요청 (detail_done)
+# - SQLite 파일에 남기므로 다음 실행에도 이어짐
+#
+#   reg = DedupRegistry("../data/dedup.sqlite")
+#   crawler = Crawler(registry=reg)
+#   posts = crawler.crawl_list(fm, "하이닉스", 1, 100) + crawler.crawl_list(fm, "하닉", 1, 100)
+#   posts = crawler.crawl_details(fm, posts)   # 겹치는 글은 한 번만 요청
+#   posts = reg.tag(posts)                     # keywords = "하이닉스|하닉"
+class DedupRegistry:
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS posts (
+                site TEXT NOT NULL,
+                key  TEXT NOT NULL,
+                first_seen  TEXT NOT NULL,
+                detail_done INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (site, key)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS post_keywords (
+                site    TEXT NOT NULL,
+                key     TEXT NOT NULL,
+                keyword TEXT NOT NULL,
+                PRIMARY KEY (site, key, keyword)
+            ) WITHOUT ROWID;
+        """)
+        self.conn.commit()
+        self._lock = threading.Lock()
+
+        # 조회는 메모리에서: (site, key) → 검색어 집합 / 상세 완료 집합
+        self._keywords = {}
+        self._done = set()
+        for site, key, kw in self.conn.execute("SELECT site, key, keyword FROM post_keywords"):
+            self._keywords.setdefault((site, key), set()).add(kw)
+        for site, key, done in self.conn.execute("SELECT site, key, detail_done FROM posts"):
+            self._keywords.setdefault((site, key), set())
+            if done:
+                self._done.add((site, key))
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return len(self._keywords)
+
+    def __contains__(self, site_key) -> bool:
+        return site_key in self._keywords
+
+    # 목록에서 본 글 등록 → 처음 보는 글만 반환 (입력 순서 유지)
+    # 이미 있던 글도 이번 검색어는 기록된다
+    def add_many(self, posts, key="post_url") -> list:
+        now = datetime.now().isoformat(timespec="seconds")
+        new, new_rows, kw_rows = [], [], []
+        with self._lock:
+            for p in posts:
+                sk = (p["site"], str(p[key]))
+                kws = self._keywords.get(sk)
+                if kws is None:
+                    kws = self._keywords[sk] = set()
+                    new.append(p)
+                    new_rows.append((*sk, now))
+                if p["keyword"] not in kws:
+                    kws.add(p["keyword"])
+                    kw_rows.append((*sk, p["keyword"]))
+            if new_rows or kw_rows:
+                self.conn.executemany(
+                    "INSERT OR IGNORE INTO posts(site, key, first_seen) VALUES (?, ?, ?)", new_rows)
+                self.conn.executemany(
+                    "INSERT OR IGNORE INTO post_keywords(site, key, keyword) VALUES (?, ?, ?)", kw_rows)
+                self.conn.commit()
+        return new
+
+    def keywords(self, site: str, key: str) -> list:
+        return sorted(self._keywords.get((site, str(key)), ()))
+
+    # 상세를 아직 안 가져온 글만, 글마다 한 번씩
+    def pending_details(self, posts, key="post_url") -> list:
+        out, picked = [], set()
+        with self._lock:
+            for p in posts:
+                sk = (p["site"], str(p[key]))
+                if sk in self._done or sk in picked:
+                    continue
+                picked.add(sk)
+                out.append(p)
+        return out
+
+    def mark_detail(self, site: str, keys):
+        rows = [(site, str(k)) for k in keys]
+        with self._lock:
+            self._done.update(rows)
+            self.conn.executemany("UPDATE posts SET detail_done=1 WHERE site=? AND key=?", rows)
+            self.conn.commit()
+
+    # 글마다 매칭된 검색어 전체를 sep 로 이어 col 에 기록 (글 하나당 한 행)
+    def tag(self, posts, key="post_url", col="keywords", sep="|") -> list:
+        out, picked = [], set()
+        for p in posts:
+            sk = (p["site"], str(p[key]))
+            if sk in picked:
+                continue
+            picked.add(sk)
+            out.append({**p, col: sep.join(sorted(self._keywords.get(sk, {p["keyword"]})))})
+        return out
+
+
+# 기존 crawl_one 결과용: concat → drop_duplicates 대신 source 를 합쳐서 한 행으로
+#   df = dedup_frame(pd.concat([df_hynix, df_hanik]))   # source = "하닉|하이닉스"
+def dedup_frame(df: pd.DataFrame, key="post_url", source_col="source", sep="|") -> pd.DataFrame:
+    sources = (
+        df.groupby(key, sort=False)[source_col]
+        .agg(lambda s: sep.join(sorted(set(s.dropna().astype(str)))))
+    )
+    out = df.drop_duplicates(subset=[key]).reset_index(drop=True)
+    out[source_col] = out[key].map(sources)
+    return out
@@ -0,0 +1,111 @@
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from .fmkorea import parse_post_detail
+from .http import build_session
+
+
+# =========================
+# JSONL 저장 유틸
+# =========================
+def append_jsonl(path, obj):
+    # JSONL(JSON Lines) 파일에 "한 줄 = JSON 객체 1개" 형태로 누적 저장하는 함수
+    # - mode="a": 기존 파일 뒤에 계속 추가(append)
+    # - ensure_ascii=False: 한글을 \uXXXX 이스케이프가 아니라 실제 한글로 저장
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(obj, ensure_ascii=False) + "\n")
+
+
+# JSONL 전체를 읽어서 pretty JSON(들여쓰기/줄바꿈)으로 저장
+def export_pretty_json(jsonl_path, pretty_json_path):
+    rows = []
+    with open(jsonl_path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            rows.append(json.loads(line))
+
+    with open(pretty_json_path, "w", encoding="utf-8") as f:
+        json.dump(rows, f, ensure_ascii=False, indent=2)
+
+
+# 이미 JSONL 에 저장된 post_url 집합 (재실행 시 건너뛰기용)
+# 크래시로 마지막 줄이 잘려 있으면 그 줄은 무시
+def load_done_urls(jsonl_path) -> set:
+    done = set()
+    if not os.path.exists(jsonl_path):
+        return done
+    with open(jsonl_path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                done.add(json.loads(line)["post_url"])
+            except (json.JSONDecodeError, KeyError):
+                continue
+    return done
+
+
+# =========================
+# 상세 페이지 병렬 수집
+# =========================
+# post_url 들을 스레드 풀로 돌려 parse_post_detail 결과를 JSONL 에 바로 추가한다.
+#
+# - 모든 워커가 keep-alive 커넥션 풀 + 재시도가 걸린 세션 하나를 공유
+# - batch_size 개씩만 제출 → 메모리 일정, 크래시 시 잃는 건 진행 중이던 한 배치뿐
+# - 끝난 게시글은 그 즉시 한 줄씩 기록 (순서는 완료 순)
+# - 이미 JSONL 에 있는 post_url 은 건너뜀 → 같은 코드로 이어서 수집 가능
+#   (예전처럼 START = 0, 100, 200 ... 을 손으로 바꿀 필요 없음)
+# - 실패한 URL 은 모아서 반환
+# - date_index(JsonlDateIndex)를 주면 배치마다 날짜 인덱스도 새로 추가된 줄만큼 갱신
+def collect_details(urls, jsonl_path, workers=8, batch_size=100, sleep_sec=0.0,
+                    session=None, parse_fn=parse_post_detail, verbose=True, date_index=None):
+    if session is None:
+        session = build_session(pool_size=workers)
+
+    done = load_done_urls(jsonl_path)
+    todo = []
+    for u in urls:
+        u = str(u)
+        if u not in done:
+            todo.append(u)
+            done.add(u)  # 입력 안의 중복도 한 번만
+
+    def work(url):
+        obj = parse_fn(session, url)
+        if sleep_sec:
+            time.sleep(sleep_sec)
+        return obj
+
+    failed = []
+    saved = 0
+    with ThreadPoolExecutor(max_workers=workers) as ex, \
+            open(jsonl_path, "a", encoding="utf-8") as f:
+        for start in range(0, len(todo), batch_size):
+            batch = todo[start:start + batch_size]
+            futures = {ex.submit(work, u): u for u in batch}
+
+            for fut in as_completed(futures):
+                url = futures[fut]
+                try:
+                    obj = fut.result()
+                except Exception as e:
+                    failed.append(url)
+                    if verbose:
+                        print(f"[상세 실패] {url} | {e}")
+                    continue
+                f.write(json.dumps(obj, ensure_ascii=False) + "\n")
+                f.flush()
+                saved += 1
+
+            if date_index is not None:
+                date_index.refresh()
+
+            if verbose:
+                print(f"[상세] {min(start + batch_size, len(todo))}/{len(todo)} 완료 / 저장 {saved}개 / 실패 {len(failed)}개")
+
+    return failed
@@ -0,0 +1,153 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+
+import requests
+
+from .dedup import DedupRegistry
+from .http import SessionPool
+from .metrics import CrawlMetrics, response_retries
+from .sites import SiteAdapter
+
+
+# =========================
+# 사이트 공통 크롤러
+# =========================
+# 어댑터(FmKorea / DC / Blind)만 바꿔 끼우면 같은 루프로 목록 + 상세를 수집한다.
+# 모든 요청은 Crawler.fetch → SessionPool.get 한 곳을 지나가므로
+# 동시성/캐시/계측을 여기 한 번만 붙이면 세 사이트에 같이 적용된다.
+#
+#   crawler = Crawler(sleep_sec=2)
+#   fm = FmKoreaAdapter()
+#   posts = crawler.crawl_list(fm, "하이닉스", 1, 100)
+#   posts = crawler.crawl_details(fm, posts, workers=4)
+#
+# registry(DedupRegistry)를 주면 검색어가 달라도 같은 글은 상세를 한 번만 가져온다.
+# metrics(CrawlMetrics)를 주면 요청/파싱 지표를 (site, keyword)별로 쌓는다.
+class Crawler:
+    def __init__(self, pool: SessionPool = None, sleep_sec=1.0, verbose=True,
+                 registry: DedupRegistry = None, metrics: CrawlMetrics = None):
+        self.pool = pool or SessionPool()
+        self.sleep_sec = sleep_sec
+        self.verbose = verbose
+        self.registry = registry
+        self.metrics = metrics
+
+    def fetch(self, adapter: SiteAdapter, url: str, keyword: str = "") -> str:
+        if self.metrics is None:
+            return self.pool.get(adapter.name, url, headers=adapter.headers).text
+
+        t0 = time.perf_counter()
+        try:
+            r = self.pool.get(adapter.name, url, headers=adapter.headers)
+        except requests.RequestException as e:
+            resp = e.response
+            self.metrics.observe_request(
+                adapter.name, keyword, time.perf_counter() - t0,
+                len(resp.content) if resp is not None else 0,
+                resp.status_code if resp is not None else 0,
+                response_retries(resp),
+            )
+            raise
+        self.metrics.observe_request(adapter.name, keyword, time.perf_counter() - t0,
+                                     len(r.content), r.status_code, response_retries(r))
+        return r.text
+
+    # 목록 페이지 하나 → (기간 안의 글, 중단 사유 또는 None)
+    def crawl_page(self, adapter: SiteAdapter, keyword: str, page: int,
+                   start_date: date = None, end_date: date = None):
+        now = datetime.now()
+        html = self.fetch(adapter, adapter.list_url(keyword, page), keyword)
+        t0 = time.perf_counter()
+        posts = adapter.parse_list(html, keyword, now)
+        t_parse = time.perf_counter() - t0
+        if not posts:
+            if self.metrics is not None:
+                self.metrics.observe_parse(adapter.name, keyword, t_parse, 0)
+            return [], "rows=0" if posts is None else "page_added=0"
+
+        dates = [p["date"] for p in posts if p["date"]]
+        kept = [p for p in posts if self._in_range(p["date"], start_date, end_date)]
+        if self.metrics is not None:
+            self.metrics.observe_parse(adapter.name, keyword, t_parse, len(kept))
+        if self.registry is not None:
+            self.registry.add_many(kept)
+        if start_date and dates and max(dates) < start_date.isoformat():
+            return kept, f"{start_date} 이전 도달"
+        return kept, None
+
+    # 목록 페이지 순회 → 공통 스키마 dict 리스트
+    # 중단: 목록 끝(None) / 파싱된 글 0개 / (start_date 지정 시) 페이지 전체가 start_date 이전
+    # start_date / end_date 를 주면 그 기간 글만 남긴다 (목록이 최신순이라는 전제)
+    # sink 를 주면 페이지마다 sink 로 보내고 빈 리스트 반환
+    def crawl_list(self, adapter: SiteAdapter, keyword: str, start_page=1, end_page=10,
+                   start_date: date = None, end_date: date = None, sink=None) -> list:
+        out, total = [], 0
+        for page in range(start_page, end_page + 1):
+            kept, stop = self.crawl_page(adapter, keyword, page, start_date, end_date)
+            total += len(kept)
+            if sink is not None:
+                sink.write_many(kept)
+            else:
+                out.extend(kept)
+            if kept or stop is None:
+                self._log(f"[{adapter.name}:{keyword}] {page}페이지 완료 / 이번 페이지 {len(kept)}개 / 누적 {total}개")
+            if stop:
+                self._log(f"[{adapter.name}:{keyword}] {page}페이지: {stop} → 중단")
+                break
+
+            if self.sleep_sec:
+                time.sleep(self.sleep_sec)
+        return out
+
+    # 상세 페이지로 content(+사이트별 추가 필드)를 채움. 실패한 글은 content="" 로 남김
+    # registry 가 있으면 이미 상세를 가져온 글 / 같은 호출 안의 중복 글은 요청하지 않는다
+    # 반환은 항상 입력과 같은 길이·순서: 중복 글은 이번에 가져온 결과를, 이전 실행에서 이미
+    # 상세를 가져온 글은 입력 그대로(content 없이) 돌려준다
+    def crawl_details(self, adapter: SiteAdapter, posts: list, workers=4) -> list:
+        given = posts
+        if self.registry is not None:
+            posts = self.registry.pending_details(given)
+            if len(given) != len(posts):
+                self._log(f"[중복 제외] {len(given) - len(posts)}개 / 상세 요청 {len(posts)}개")
+
+        def work(post):
+            try:
+                html = self.fetch(adapter, adapter.detail_url(post), post["keyword"])
+                t0 = time.perf_counter()
+                post = {**post, **adapter.parse_detail(html, post, datetime.now())}
+                if self.metrics is not None:
+                    self.metrics.observe_parse(adapter.name, post["keyword"],
+                                               time.perf_counter() - t0, 1)
+                if self.registry is not None:
+                    self.registry.mark_detail(adapter.name, [post["post_url"]])
+            except Exception as e:
+                self._log(f"[상세 실패] {post['post_url']} | {e}")
+            if self.sleep_sec:
+                time.sleep(self.sleep_sec)
+            return post
+
+        out = []
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            for i, post in enumerate(ex.map(work, posts), 1):
+                out.append(post)
+                if i % 50 == 0:
+                    self._log(f"[본문] {i}/{len(posts)}")
+        if self.registry is None:
+            return out
+        fetched = {(p["site"], str(p["post_url"])): p for p in out}
+        return [fetched.get((p["site"], str(p["post_url"])), p) for p in given]
+
+    @staticmethod
+    def _in_range(d: str, start_date, end_date) -> bool:
+        if not d:
+            return start_date is None and end_date is None
+        if start_date and d < start_date.isoformat():
+            return False
+        if end_date and d > end_date.isoformat():
+            return False
+        return True
+
+    def _log(self, msg):
+        if self.verbose:
+            print(msg)
@@ -0,0 +1,370 @@
+from lxml import etree
+from lxml import html as lxml_html
+
+from . import blind, dc, fmkorea
+
+
+# =========================
+# 빠른 HTML 추출 백엔드
+# =========================
+# 기본 파서(BeautifulSoup + CSS select)와 같은 레코드를 만드는 대체 구현.
+# 추출한 문자열은 fmkorea.make_list_record / make_post_record, blind.make_card_record 로
+# 넘기므로 후처리(숫자 변환, 날짜 정규화, 댓글 중복 제거)는 완전히 같은 코드를 탄다.
+#
+#   parse_list_page(html, "하닉", backend="lxml")
+#   parse_gall_list(html, backend="selectolax")
+#
+# - lxml       : lxml.html + 미리 컴파일한 XPath (bs4 "lxml" 파서와 같은 libxml2 트리)
+# - selectolax : lexbor 기반 CSS 선택자 (requirements.txt, 없으면 backend="selectolax" 에서 ImportError)
+#
+# 일치 여부는 tests/test_extract.py, 속도는 bench.py 의 bench_extract 로 확인한다.
+
+
+# BeautifulSoup get_text(sep, strip=True) 와 같은 규칙: 텍스트 노드별 strip, 빈 것 제외, sep 로 연결
+def _join(strings, sep="", strip=True):
+    if not strip:
+        return "".join(strings)
+    return sep.join(t for t in (s.strip() for s in strings) if t)
+
+
+# -------------------------
+# lxml + XPath
+# -------------------------
+def _cls(*names):
+    return " and ".join(
+        f"contains(concat(' ', normalize-space(@class), ' '), ' {n} ')" for n in names
+    )
+
+
+class LxmlBackend:
+    name = "lxml"
+
+    # FmKorea 목록
+    _fm_rows = etree.XPath(f"//table[{_cls('bd_lst', 'bd_tb_lst', 'bd_tb')}]//tbody//tr")
+    _fm_cate_a = etree.XPath(f".//td[{_cls('cate')}]//a")
+    _fm_cate_span = etree.XPath(f".//td[{_cls('cate')}]//span")
+    _fm_title = etree.XPath(f".//td[{_cls('title')}]//a[{_cls('hx')}]")
+    _fm_author = etree.XPath(f".//td[{_cls('author')}]//a")
+    _fm_reply = etree.XPath(f".//td[{_cls('title')}]//a[{_cls('replyNum')}]")
+    _fm_time = etree.XPath(f".//td[{_cls('time')}]")
+    _fm_mno = etree.XPath(f".//td[{_cls('m_no')}]")
+
+    # FmKorea 상세
+    _cap = f"//*[@id='bd_capture']"
+    _side = f"{_cap}//*[{_cls('btm_area')}]//*[{_cls('side', 'fr')}]"
+    _fd_title = etree.XPath(f"{_cap}//h1[{_cls('np_18px')}]//span[{_cls('np_18px_span')}]")
+    _fd_date = etree.XPath(f"{_cap}//*[{_cls('top_area')}]//*[{_cls('date', 'm_no')}]")
+    _fd_views = etree.XPath(f"{_side}//span[1]//b")
+    _fd_votes = etree.XPath(f"{_side}//span[2]//b")
+    _fd_cmt = etree.XPath(f"{_side}//span[3]//b")
+    _fd_content = etree.XPath(f"{_cap}//*[{_cls('rd_body')}]//article//*[{_cls('xe_content')}]")
+    _fd_items = etree.XPath(
+        f"//*[{_cls('fdb_lst_wrp')}]//*[@id='cmtPosition']//ul[{_cls('fdb_lst_ul')}]"
+        f"/li[{_cls('fdb_itm', 'clear')}]"
+    )
+    _fd_nick = etree.XPath(f".//div[{_cls('meta')}]//a[{_cls('member_plate')}]")
+    _fd_ctext = etree.XPath(f".//*[{_cls('comment-content')}]//*[{_cls('xe_content')}]")
+    _fd_like = etree.XPath(f".//*[{_cls('voted_count')}]")
+
+    # DC 목록
+    _dc_table = etree.XPath(f"//table[{_cls('gall_list')}]")
+    _dc_rows = etree.XPath(".//tbody//tr")
+    _dc_subject = etree.XPath(f".//td[{_cls('gall_subject')}]")
+    _dc_title = etree.XPath(f".//td[{_cls('gall_tit')}]//a")
+    _dc_num = etree.XPath(f".//td[{_cls('gall_num')}]")
+    _dc_date = etree.XPath(f".//td[{_cls('gall_date')}]")
+    _dc_count = etree.XPath(f".//td[{_cls('gall_count')}]")
+    _dc_rec = etree.XPath(f".//td[{_cls('gall_recommend')}]")
+
+    # Blind 카드
+    _bl_cards = etree.XPath(f"//div[{_cls('article-list-pre')}]")
+    _bl_title = etree.XPath(f".//div[{_cls('tit')}]//a")
+    _bl_past = etree.XPath(f".//a[{_cls('past')}]")
+    _bl_pv = etree.XPath(f".//a[{_cls('pv')}]")
+    _bl_like = etree.XPath(f".//span[{_cls('like')}]")
+    _bl_cmt = etree.XPath(f".//a[{_cls('cmt')}]")
+
+    @staticmethod
+    def _doc(html):
+        return lxml_html.document_fromstring(html)
+
+    @staticmethod
+    def _first(xp, node):
+        r = xp(node)
+        return r[0] if r else None
+
+    @staticmethod
+    def _text(el, sep="", strip=True):
+        return _join(el.itertext(), sep, strip)
+
+    def fmkorea_list(self, html, source_name, today=None):
+        rows = self._fm_rows(self._doc(html))
+        if not rows:
+            return None
+
+        first, text = self._first, self._text
+        records = []
+        for tr in rows:
+            cate_a = first(self._fm_cate_a, tr)
+            if cate_a is None:
+                cate_a = first(self._fm_cate_span, tr)
+            title_a = first(self._fm_title, tr)
+            author_a = first(self._fm_author, tr)
+            reply_a = first(self._fm_reply, tr)
+            time_td = first(self._fm_time, tr)
+            mno_tds = self._fm_mno(tr)
+
+            if cate_a is None or title_a is None or author_a is None or time_td is None \
+                    or len(mno_tds) < 2:
+                continue
+
+            records.append(fmkorea.make_list_record(
+                text(cate_a),
+                text(title_a, " "),
+                text(author_a),
+                text(reply_a) if reply_a is not None else None,
+                text(time_td),
+                text(mno_tds[0], strip=False).strip(),
+                text(mno_tds[1], strip=False).strip(),
+                title_a.get("href", ""),
+                source_name, today,
+            ))
+        return records
+
+    def fmkorea_detail(self, html, post_url, today=None):
+        doc = self._doc(html)
+        first, text = self._first, self._text
+
+        def t(xp, sep=""):
+            el = first(xp, doc)
+            return text(el, sep) if el is not None else None
+
+        comment_items = []
+        for li in self._fd_items(doc):
+            nick_el = first(self._fd_nick, li)
+            text_el = first(self._fd_ctext, li)
+            like_el = first(self._fd_like, li)
+            comment_items.append((
+                text(nick_el) if nick_el is not None else "",
+                text(text_el, "\n") if text_el is not None else "",
+                text(like_el) if like_el is not None else None,
+            ))
+
+        return fmkorea.make_post_record(
+            post_url,
+            title=t(self._fd_title, " "),
+            date_text=t(self._fd_date),
+            views_text=t(self._fd_views),
+            votes_text=t(self._fd_votes),
+            cmt_text=t(self._fd_cmt),
+            content=t(self._fd_content, "\n"),
+            comment_items=comment_items,
+            today=today,
+        )
+
+    def dc_list(self, html):
+        table = self._first(self._dc_table, self._doc(html))
+        if table is None:
+            return None
+
+        first = self._first
+
+        def t(xp, tr):
+            return self._text(first(xp, tr), strip=False).strip()
+
+        records = []
+        for tr in self._dc_rows(table):
+            subject_td = first(self._dc_subject, tr)
+            title_a = first(self._dc_title, tr)
+            if subject_td is None or title_a is None:
+                continue
+            subject = self._text(subject_td, strip=False).strip()
+            if subject in dc.SKIP_SUBJECTS:
+                continue
+
+            records.append({
+                "post_id": t(self._dc_num, tr),
+                "subject": subject,
+                "title": self._text(title_a, strip=False).strip(),
+                "date": t(self._dc_date, tr),
+                "view_count": t(self._dc_count, tr),
+                "recommend_count": t(self._dc_rec, tr),
+                "post_url": dc.BASE_URL + title_a.attrib["href"],
+            })
+        return records
+
+    def blind_cards(self, html, now=None):
+        first, text = self._first, self._text
+
+        def raw(xp, card):
+            el = first(xp, card)
+            return text(el, strip=False) if el is not None else None
+
+        out = []
+        for card in self._bl_cards(self._doc(html)):
+            title_tag = first(self._bl_title, card)
+            date_tag = first(self._bl_past, card)
+            if title_tag is None or date_tag is None:
+                continue
+            rec = blind.make_card_record(
+                text(title_tag),
+                title_tag.get("href", ""),
+                text(date_tag),
+                raw(self._bl_pv, card),
+                raw(self._bl_like, card),
+                raw(self._bl_cmt, card),
+                now,
+            )
+            if rec is not None:
+                out.append(rec)
+        return out
+
+
+# -------------------------
+# selectolax (lexbor)
+# -------------------------
+class SelectolaxBackend:
+    name = "selectolax"
+
+    def __init__(self):
+        try:
+            from selectolax.lexbor import LexborHTMLParser
+        except ImportError as e:
+            raise ImportError("selectolax 백엔드는 selectolax 가 필요합니다 (pip install selectolax)") from e
+        self._parser = LexborHTMLParser
+
+    @staticmethod
+    def _text(node, sep="", strip=True):
+        return _join(
+            (n.text_content for n in node.traverse(include_text=True) if n.tag == "-text"),
+            sep, strip,
+        )
+
+    def fmkorea_list(self, html, source_name, today=None):
+        rows = self._parser(html).css("table.bd_lst.bd_tb_lst.bd_tb tbody tr")
+        if not rows:
+            return None
+
+        text = self._text
+        records = []
+        for tr in rows:
+            cate_a = tr.css_first("td.cate a") or tr.css_first("td.cate span")
+            title_a = tr.css_first("td.title a.hx")
+            author_a = tr.css_first("td.author a")
+            reply_a = tr.css_first("td.title a.replyNum")
+            time_td = tr.css_first("td.time")
+            mno_tds = tr.css("td.m_no")
+
+            if not (cate_a and title_a and author_a and time_td and len(mno_tds) >= 2):
+                continue
+
+            records.append(fmkorea.make_list_record(
+                text(cate_a),
+                text(title_a, " "),
+                text(author_a),
+                text(reply_a) if reply_a else None,
+                text(time_td),
+                text(mno_tds[0], strip=False).strip(),
+                text(mno_tds[1], strip=False).strip(),
+                title_a.attributes.get("href") or "",
+                source_name, today,
+            ))
+        return records
+
+    def fmkorea_detail(self, html, post_url, today=None):
+        doc = self._parser(html)
+        text = self._text
+
+        def t(sel, sep=""):
+            el = doc.css_first(sel)
+            return text(el, sep) if el else None
+
+        comment_items = []
+        for li in doc.css(".fdb_lst_wrp #cmtPosition ul.fdb_lst_ul > li.fdb_itm.clear"):
+            nick_el = li.css_first("div.meta a.member_plate")
+            text_el = li.css_first(".comment-content .xe_content")
+            like_el = li.css_first(".voted_count")
+            comment_items.append((
+                text(nick_el) if nick_el else "",
+                text(text_el, "\n") if text_el else "",
+                text(like_el) if like_el else None,
+            ))
+
+        return fmkorea.make_post_record(
+            post_url,
+            title=t("#bd_capture h1.np_18px span.np_18px_span", " "),
+            date_text=t("#bd_capture .top_area .date.m_no"),
+            views_text=t("#bd_capture .btm_area .side.fr span:nth-of-type(1) b"),
+            votes_text=t("#bd_capture .btm_area .side.fr span:nth-of-type(2) b"),
+            cmt_text=t("#bd_capture .btm_area .side.fr span:nth-of-type(3) b"),
+            content=t("#bd_capture .rd_body article .xe_content", "\n"),
+            comment_items=comment_items,
+            today=today,
+        )
+
+    def dc_list(self, html):
+        table = self._parser(html).css_first("table.gall_list")
+        if table is None:
+            return None
+
+        def t(sel, tr):
+            return self._text(tr.css_first(sel), strip=False).strip()
+
+        records = []
+        for tr in table.css("tbody tr"):
+            subject_td = tr.css_first("td.gall_subject")
+            title_a = tr.css_first("td.gall_tit a")
+            if subject_td is None or title_a is None:
+                continue
+            subject = self._text(subject_td, strip=False).strip()
+            if subject in dc.SKIP_SUBJECTS:
+                continue
+
+            records.append({
+                "post_id": t("td.gall_num", tr),
+                "subject": subject,
+                "title": self._text(title_a, strip=False).strip(),
+                "date": t("td.gall_date", tr),
+                "view_count": t("td.gall_count", tr),
+                "recommend_count": t("td.gall_recommend", tr),
+                "post_url": dc.BASE_URL + title_a.attributes["href"],
+            })
+        return records
+
+    def blind_cards(self, html, now=None):
+        text = self._text
+
+        def raw(sel, card):
+            el = card.css_first(sel)
+            return text(el, strip=False) if el else None
+
+        out = []
+        for card in self._parser(html).css("div.article-list-pre"):
+            title_tag = card.css_first("div.tit a")
+            date_tag = card.css_first("a.past")
+            if not title_tag or not date_tag:
+                continue
+            rec = blind.make_card_record(
+                text(title_tag),
+                title_tag.attributes.get("href") or "",
+                text(date_tag),
+                raw("a.pv", card),
+                raw("span.like", card),
+                raw("a.cmt", card),
+                now,
+            )
+            if rec is not None:
+                out.append(rec)
+        return out
+
+
+_BACKEND_TYPES = {"lxml": LxmlBackend, "selectolax": SelectolaxBackend}
+_BACKENDS = {}
+
+
+def get_backend(name: str):
+    if name not in _BACKENDS:
+        if name not in _BACKEND_TYPES:
+            raise ValueError(f"알 수 없는 백엔드: {name} (가능: bs4, {', '.join(_BACKEND_TYPES)})")
+        _BACKENDS[name] = _BACKEND_TYPES[name]()
+    return _BACKENDS[name]
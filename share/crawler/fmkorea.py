@@ -0,0 +1,253 @@
+import re
+import time
+from datetime import datetime
+
+import pandas as pd
+import requests
+from bs4 import BeautifulSoup as bs
+
+# =========================
+# 0) 접속 정보 / 컬럼
+# =========================
+BASE_URL = "https://www.fmkorea.com"
+
+HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/143.0.0.0 Safari/537.36"
+    ),
+    "Referer": "https://www.fmkorea.com/",
+    "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+}
+
+# 주식 게시판 일반 검색 노트북의 검색 URL 에 붙는 category (인기글 노트북은 없음)
+STOCK_CATEGORY = "2997203870"
+
+# crawl_one 이 반환하는 DataFrame 컬럼 (노트북과 동일)
+COLUMNS = ["탭", "제목", "글쓴이", "날짜", "조회", "추천", "댓글수", "post_url", "source"]
+
+
+# =========================
+# 1) 날짜 정규화
+# =========================
+# - "17:27" 처럼 시간만 있으면 오늘 날짜(YYYY-MM-DD)로 치환
+# - "2026.01.12" 처럼 점(.)으로 된 날짜는 "-"로 변경
+# today: 기준일 "YYYY-MM-DD" (기본: 오늘, 아카이브 재파싱 때는 수집한 날)
+def normalize_date(date_str: str, today: str = None) -> str:
+    today = today or datetime.now().strftime("%Y-%m-%d")
+    s = (date_str or "").strip()
+    if re.match(r"^\d{1,2}:\d{2}$", s):
+        return today
+    if "." in s:
+        return s.replace(".", "-")
+    return s
+
+
+# =========================
+# 2) 검색 결과 페이지 파싱
+# =========================
+# 검색 결과 HTML 한 페이지 → 행(dict) 리스트
+# - 행이 하나도 없으면 None (rows=0 → 크롤링 중단 신호)
+# - 일반글은 "td.cate a", 인기글은 "td.cate span" 에 탭 이름이 있음
+# - backend: "bs4"(기본) / "lxml" / "selectolax" (extract.py, 결과는 동일)
+def parse_list_page(html: str, source_name: str, today: str = None, backend="bs4"):
+    if backend != "bs4":
+        from .extract import get_backend
+        return get_backend(backend).fmkorea_list(html, source_name, today)
+
+    soup = bs(html, "lxml")
+    rows = soup.select("table.bd_lst.bd_tb_lst.bd_tb tbody tr")
+    if not rows:
+        return None
+
+    records = []
+    for tr in rows:
+        cate_a = tr.select_one("td.cate a") or tr.select_one("td.cate span")
+        title_a = tr.select_one("td.title a.hx")
+        author_a = tr.select_one("td.author a")
+        reply_a = tr.select_one("td.title a.replyNum")
+        time_td = tr.select_one("td.time")
+        mno_tds = tr.select("td.m_no")
+
+        if not (cate_a and title_a and author_a and time_td and len(mno_tds) >= 2):
+            continue
+
+        records.append(make_list_record(
+            cate_a.get_text(strip=True),
+            title_a.get_text(" ", strip=True),
+            author_a.get_text(strip=True),
+            reply_a.get_text(strip=True) if reply_a else None,
+            time_td.get_text(strip=True),
+            mno_tds[0].text.strip(),
+            mno_tds[1].text.strip(),
+            title_a.get("href", ""),
+            source_name, today,
+        ))
+    return records
+
+
+# 추출한 문자열들 → 행 dict (extract.py 의 lxml/selectolax 백엔드도 같은 함수 사용)
+def make_list_record(cate, title, author, reply, time_text, views, votes, href,
+                     source_name, today=None) -> dict:
+    post_url = BASE_URL + href if href.startswith("/") else href
+    return {
+        "탭": cate,
+        "제목": title,
+        "글쓴이": author,
+        "날짜": normalize_date(time_text, today),
+        "조회": int(views.replace(",", "")) if views else 0,
+        "추천": int(votes.replace(",", "")) if votes else 0,
+        "댓글수": int(reply) if reply is not None else 0,
+        "post_url": post_url,
+        "source": source_name,
+    }
+
+
+# =========================
+# 3) 게시글 상세 페이지 파싱
+# =========================
+# 상세 페이지 날짜 정규화
+# - "11:07" 처럼 시간만 주면 오늘 날짜로
+# - "2026.01.16 11:07" 또는 "2026.01.16" -> "2026-01-16"
+def normalize_post_date(date_str: str, today: str = None) -> str:
+    today = today or datetime.now().strftime("%Y-%m-%d")
+    s = (date_str or "").strip()
+
+    if re.match(r"^\d{1,2}:\d{2}$", s):
+        return today
+
+    if re.match(r"^\d{4}\.\d{2}\.\d{2}", s):
+        s = s.split()[0]          # 시간 잘라내기
+        return s.replace(".", "-")
+
+    return s
+
+
+def parse_int(text):
+    # "조회 수 15,720" 같은 문자열에서 숫자만 뽑아 int로 변환
+    if text is None:
+        return 0
+    t = re.sub(r"[^\d]", "", text)
+    return int(t) if t else 0
+
+
+# 상세 페이지 HTML → 게시글 dict (제목/날짜/조회/추천/댓글수/본문/댓글 목록)
+def parse_post_detail_html(html: str, post_url: str, today: str = None, backend="bs4") -> dict:
+    if backend != "bs4":
+        from .extract import get_backend
+        return get_backend(backend).fmkorea_detail(html, post_url, today)
+
+    soup = bs(html, "lxml")
+
+    def text(sel, sep=""):
+        el = soup.select_one(sel)
+        return el.get_text(sep, strip=True) if el else None
+
+    # 댓글: (닉네임, 내용, 추천수 문자열)
+    # - 닉네임: meta 안 a.member_plate / 내용: comment-content 안 xe_content / 추천: span.voted_count
+    comment_items = []
+    for li in soup.select(".fdb_lst_wrp #cmtPosition ul.fdb_lst_ul > li.fdb_itm.clear"):
+        nick_el = li.select_one("div.meta a.member_plate")
+        text_el = li.select_one(".comment-content .xe_content")
+        like_el = li.select_one(".voted_count")
+        comment_items.append((
+            nick_el.get_text(strip=True) if nick_el else "",
+            text_el.get_text("\n", strip=True) if text_el else "",
+            like_el.get_text(strip=True) if like_el else None,
+        ))
+
+    return make_post_record(
+        post_url,
+        title=text("#bd_capture h1.np_18px span.np_18px_span", " "),
+        date_text=text("#bd_capture .top_area .date.m_no"),
+        views_text=text("#bd_capture .btm_area .side.fr span:nth-of-type(1) b"),
+        votes_text=text("#bd_capture .btm_area .side.fr span:nth-of-type(2) b"),
+        cmt_text=text("#bd_capture .btm_area .side.fr span:nth-of-type(3) b"),
+        content=text("#bd_capture .rd_body article .xe_content", "\n"),
+        comment_items=comment_items,
+        today=today,
+    )
+
+
+# 추출한 문자열들 → 게시글 dict (extract.py 의 lxml/selectolax 백엔드도 같은 함수 사용)
+# 없는 요소는 None 으로 넘김
+def make_post_record(post_url, title, date_text, views_text, votes_text, cmt_text, content,
+                     comment_items, today=None) -> dict:
+    comments = []
+    seen = set()  # (nickname, comment) 중복 체크용
+    for nick, c_text, like_text in comment_items:
+        # 닉+내용 완전 동일 중복 제거
+        key = (nick, c_text)
+        if key in seen:
+            continue
+        seen.add(key)
+
+        comments.append({
+            "nickname": nick,
+            "comment": c_text,
+            "like": parse_int(like_text)
+        })
+
+    return {
+        "post_url": post_url,
+        "title": title or "",
+        "date": normalize_post_date(date_text, today) if date_text is not None else "",
+        "views": parse_int(views_text),
+        "votes": parse_int(votes_text),
+        "comment_count": parse_int(cmt_text),
+        "content": content or "",
+        "comments": comments
+    }
+
+
+def parse_post_detail(session, post_url):
+    r = session.get(post_url, timeout=20)
+    r.raise_for_status()
+    return parse_post_detail_html(r.text, post_url)
+
+
+# =========================
+# 4) 순차 크롤링 (기존 노트북 방식)
+# =========================
+# 검색 결과 페이지를 순회하며 게시글 리스트를 수집해서 DataFrame으로 반환
+# start_page ~ end_page: 수집할 페이지 범위
+# sink(JsonlSink/ParquetSink)를 주면 페이지마다 sink 로 보내고 메모리에는 모으지 않음 → 빈 DataFrame 반환
+def crawl_one(session: requests.Session, url_base: str, source_name: str,
+              start_page=1, end_page=10, sleep_sec=2, verbose=True, backend="bs4",
+              sink=None) -> pd.DataFrame:
+    data = {c: [] for c in COLUMNS}
+    total = 0
+
+    for page in range(start_page, end_page + 1):
+        url = url_base.format(page)
+
+        r = session.get(url, timeout=20)
+        r.raise_for_status()
+
+        records = parse_list_page(r.text, source_name, backend=backend)
+        if records is None:
+            if verbose:
+                print(f"[{source_name}] {page}페이지: rows=0 → 중단")
+            break
+
+        if sink is not None:
+            sink.write_many(records)
+        else:
+            for rec in records:
+                for c in COLUMNS:
+                    data[c].append(rec[c])
+        page_added = len(records)
+        total += page_added
+
+        if verbose:
+            print(f"[{source_name}] {page}페이지 완료 / 이번 페이지 {page_added}개 / 누적 {total}개")
+
+        if page_added == 0:
+            if verbose:
+                print(f"[{source_name}] {page}페이지: page_added=0 → 중단")
+            break
+
+        time.sleep(sleep_sec)
+
+    return pd.DataFrame(data)
@@ -0,0 +1,72 @@
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .fmkorea import HEADERS
+
+
+# =========================
+# 공용 requests 세션
+# =========================
+# - keep-alive 커넥션 풀 (pool_maxsize 를 워커 수 이상으로 잡아야 커넥션을 재사용함)
+# - 429/5xx 는 지수 백오프로 재시도
+#   (retry_statuses=() 로 주면 상태코드 재시도는 끄고 응답을 그대로 돌려줌 → throttle.py 가 직접 처리)
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def build_session(headers=None, pool_size=16, retries=3, backoff_factor=0.4,
+                  retry_statuses=RETRY_STATUSES) -> requests.Session:
+    s = requests.Session()
+    retry = Retry(total=retries, connect=retries, read=retries, backoff_factor=backoff_factor,
+                  status_forcelist=list(retry_statuses), allowed_methods=["GET"],
+                  # urllib3 는 forcelist 가 비어 있어도 Retry-After 달린 429/503 을 재시도하므로 같이 끔
+                  respect_retry_after_header=bool(retry_statuses))
+    ad = HTTPAdapter(max_retries=retry, pool_connections=pool_size, pool_maxsize=pool_size)
+    s.mount("https://", ad)
+    s.mount("http://", ad)
+    s.headers.update(headers or HEADERS)
+    return s
+
+
+# =========================
+# 사이트별 세션 풀
+# =========================
+# 모든 크롤러 요청이 지나가는 한 곳.
+# 사이트(어댑터)마다 헤더가 다른 세션을 하나씩 만들어 두고 여러 스레드가 같이 쓴다.
+# (재시도/백오프, 커넥션 풀 크기는 build_session 설정을 공유)
+# archive: ResponseArchive 를 넘기면 모든 사이트 세션에 원본 HTML 저장이 붙는다 (cache.py)
+class SessionPool:
+    def __init__(self, pool_size=16, retries=3, backoff_factor=0.4, timeout=20, archive=None,
+                 archive_mode="record", retry_statuses=RETRY_STATUSES):
+        self.pool_size = pool_size
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.retry_statuses = retry_statuses
+        self.timeout = timeout
+        self.archive = archive
+        self.archive_mode = archive_mode
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    def session(self, site: str, headers=None) -> requests.Session:
+        with self._lock:
+            if site not in self._sessions:
+                s = build_session(headers, self.pool_size, self.retries, self.backoff_factor,
+                                  self.retry_statuses)
+                if self.archive is not None:
+                    from .cache import attach_archive
+                    attach_archive(s, self.archive, self.archive_mode)
+                self._sessions[site] = s
+            return self._sessions[site]
+
+    def get(self, site: str, url: str, headers=None, timeout=None) -> requests.Response:
+        r = self.session(site, headers).get(url, timeout=timeout or self.timeout)
+        r.raise_for_status()
+        return r
+
+    def close(self):
+        for s in self._sessions.values():
+            s.close()
+        self._sessions.clear()
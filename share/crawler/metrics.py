@@ -0,0 +1,239 @@
+import bisect
+import csv
+import json
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+PARSE_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+
+
+# 누적 버킷 히스토그램 (Prometheus 와 같은 le 경계, 마지막은 +Inf)
+class Histogram:
+    def __init__(self, buckets):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, v: float):
+        self.counts[bisect.bisect_left(self.buckets, v)] += 1
+        self.sum += v
+        self.count += 1
+
+    # 버킷 안에서 선형 보간한 근사 분위수
+    def quantile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, c in enumerate(self.counts):
+            if seen + c >= rank and c:
+                lo = self.buckets[i - 1] if i > 0 else 0.0
+                hi = self.buckets[i] if i < len(self.buckets) else lo
+                return lo + (hi - lo) * (rank - seen) / c
+            seen += c
+        return self.buckets[-1]
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+
+class _Series:
+    def __init__(self):
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.parse = Histogram(PARSE_BUCKETS)
+        self.status = {}
+        self.bytes = 0
+        self.retries = 0
+        self.errors = 0
+        self.pages = 0
+        self.rows = 0
+
+
+# =========================
+# 크롤러 계측
+# =========================
+# (site, keyword) 라벨별로
+# - 요청 지연 히스토그램 / 받은 바이트 / HTTP 상태 코드 수 / 재시도 수 / 네트워크 오류 수
+# - 페이지 파싱 시간 히스토그램 / 페이지 수 / 행 수 → rows/sec
+# Crawler(metrics=m) 로 붙이면 fetch / crawl_page / crawl_details 에서 자동으로 쌓인다.
+#
+#   m = CrawlMetrics()
+#   crawler = Crawler(metrics=m)
+#   m.start_http_server(9108)          # (선택) http://localhost:9108/metrics
+#   ... 크롤링 ...
+#   m.to_json("../data/run_report.json"); m.to_csv("../data/run_report.csv")
+#
+# 리포트의 bound 열: network(지연 합이 파싱 합보다 큼) / parse / throttled(429·503 이 5% 이상)
+class CrawlMetrics:
+    def __init__(self):
+        self.started = time.time()
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def _get(self, site, keyword) -> _Series:
+        key = (site or "", keyword or "")
+        s = self._series.get(key)
+        if s is None:
+            s = self._series.setdefault(key, _Series())
+        return s
+
+    # ---------- 기록 ----------
+    # status=0 은 응답을 못 받은 경우(타임아웃/연결 오류)
+    def observe_request(self, site, keyword, latency: float, nbytes: int, status: int, retries=0):
+        with self._lock:
+            s = self._get(site, keyword)
+            s.latency.observe(latency)
+            s.bytes += nbytes
+            s.retries += retries
+            if status:
+                s.status[status] = s.status.get(status, 0) + 1
+            else:
+                s.errors += 1
+
+    def observe_parse(self, site, keyword, seconds: float, rows: int):
+        with self._lock:
+            s = self._get(site, keyword)
+            s.parse.observe(seconds)
+            s.pages += 1
+            s.rows += rows
+
+    def inc_retry(self, site, keyword, n=1):
+        with self._lock:
+            self._get(site, keyword).retries += n
+
+    # with m.time_parse(site, kw) as done: rows = parse(...); done(len(rows))
+    @contextmanager
+    def time_parse(self, site, keyword):
+        t0 = time.perf_counter()
+        n = [0]
+
+        def done(rows):
+            n[0] = rows
+
+        try:
+            yield done
+        finally:
+            self.observe_parse(site, keyword, time.perf_counter() - t0, n[0])
+
+    # ---------- 리포트 ----------
+    def report(self) -> list:
+        elapsed = max(time.time() - self.started, 1e-9)
+        out = []
+        with self._lock:
+            for (site, kw), s in sorted(self._series.items()):
+                n_req = s.latency.count
+                throttled = s.status.get(429, 0) + s.status.get(503, 0)
+                if n_req and throttled / n_req >= 0.05:
+                    bound = "throttled"
+                elif s.latency.sum >= s.parse.sum:
+                    bound = "network"
+                else:
+                    bound = "parse"
+                out.append({
+                    "site": site,
+                    "keyword": kw,
+                    "requests": n_req,
+                    "bytes": s.bytes,
+                    "status": {str(k): v for k, v in sorted(s.status.items())},
+                    "errors": s.errors,
+                    "retries": s.retries,
+                    "latency_avg": round(s.latency.mean, 4),
+                    "latency_p50": round(s.latency.quantile(0.5), 4),
+                    "latency_p95": round(s.latency.quantile(0.95), 4),
+                    "latency_sum": round(s.latency.sum, 3),
+                    "pages": s.pages,
+                    "rows": s.rows,
+                    "parse_avg": round(s.parse.mean, 5),
+                    "parse_p95": round(s.parse.quantile(0.95), 5),
+                    "parse_sum": round(s.parse.sum, 3),
+                    "rows_per_sec": round(s.rows / elapsed, 2),
+                    "bound": bound,
+                })
+        return out
+
+    def to_json(self, path: str):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"started": self.started, "elapsed": time.time() - self.started,
+                       "series": self.report()}, f, ensure_ascii=False, indent=2)
+
+    # status 는 "200:10 429:2" 처럼 한 칸에
+    def to_csv(self, path: str):
+        rows = self.report()
+        if not rows:
+            return
+        with open(path, "w", newline="", encoding="utf-8-sig") as f:
+            w = csv.DictWriter(f, fieldnames=list(rows[0]))
+            w.writeheader()
+            for r in rows:
+                w.writerow({**r, "status": " ".join(f"{k}:{v}" for k, v in r["status"].items())})
+
+    # ---------- Prometheus text ----------
+    def prometheus(self) -> str:
+        def esc(v):
+            return str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+        def hist(name, h, lbl, lines):
+            acc = 0
+            for b, c in zip(list(h.buckets) + ["+Inf"], h.counts):
+                acc += c
+                lines.append(f'{name}_bucket{{{lbl},le="{b}"}} {acc}')
+            lines.append(f"{name}_sum{{{lbl}}} {h.sum}")
+            lines.append(f"{name}_count{{{lbl}}} {h.count}")
+
+        def statuses(name, s, lbl, lines):
+            for code, n in sorted(s.status.items()):
+                lines.append(f'{name}{{{lbl},status="{code}"}} {n}')
+
+        def counter(attr):
+            return lambda name, s, lbl, lines: lines.append(f"{name}{{{lbl}}} {getattr(s, attr)}")
+
+        # 텍스트 형식은 한 메트릭(family)의 줄이 한 묶음이어야 함 → family 마다 # TYPE 다음에 전체 시리즈
+        families = [
+            ("crawler_request_latency_seconds", "histogram", lambda n, s, l, out: hist(n, s.latency, l, out)),
+            ("crawler_parse_seconds", "histogram", lambda n, s, l, out: hist(n, s.parse, l, out)),
+            ("crawler_bytes_total", "counter", counter("bytes")),
+            ("crawler_responses_total", "counter", statuses),
+            ("crawler_errors_total", "counter", counter("errors")),
+            ("crawler_retries_total", "counter", counter("retries")),
+            ("crawler_rows_total", "counter", counter("rows")),
+        ]
+        lines = []
+        with self._lock:
+            series = [(f'site="{esc(site)}",keyword="{esc(kw)}"', s) for (site, kw), s in sorted(self._series.items())]
+            for name, kind, emit in families:
+                lines.append(f"# TYPE {name} {kind}")
+                for lbl, s in series:
+                    emit(name, s, lbl, lines)
+        return "\n".join(lines) + "\n"
+
+    # /metrics 를 내보내는 백그라운드 서버. 반환값.shutdown() 으로 종료
+    def start_http_server(self, port=9108, host="127.0.0.1"):
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = metrics.prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+
+# urllib3 Retry 가 실제로 다시 보낸 횟수
+def response_retries(resp) -> int:
+    retries = getattr(getattr(resp, "raw", None), "retries", None)
+    return len(retries.history) if retries is not None else 0
@@ -0,0 +1,325 @@
+import random
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+
+# =========================
+# 로컬 스텁 HTTP 서버 (벤치마크용)
+# =========================
+# 실제 사이트에 요청하지 않고 크롤러 성능을 재기 위한 가짜 서버.
+# 파서가 기대하는 HTML 구조를 그대로 만들어 준다.
+#   FmKorea : /search.php (table.bd_lst.bd_tb_lst.bd_tb), /<doc_id> (#bd_capture)
+#   DC      : /mgallery/board/lists/ (table.gall_list), /mgallery/board/view/ (.write_div)
+#   Blind   : /kr/search/<검색어> (div.article-list-pre), /kr/post/<id> (p#contentArea)
+#
+#   site = MockSite(n_pages=100, rows_per_page=20, latency=0.05)
+#   with serve(site) as base:
+#       url_base = base + "/search.php?mid=stock&page={}"
+#
+# 장애 주입 (seed 고정이라 매번 같은 순서로 발생)
+# - error_rate   : 이 비율만큼 500
+# - throttle_rate: 이 비율만큼 429 + Retry-After: retry_after
+# - rate_limit   : 최근 1초 요청 수가 이 값을 넘으면 429 (실제 차단에 가까운 형태)
+class MockSite:
+    def __init__(self, n_pages=100, rows_per_page=20, latency=0.0, comments_per_post=30,
+                 today=date(2026, 1, 14), posts_per_day=50, rate_limit=None, error_rate=0.0,
+                 throttle_rate=0.0, retry_after=1, seed=0):
+        self.n_pages = n_pages
+        self.rows_per_page = rows_per_page
+        self.latency = latency
+        self.comments_per_post = comments_per_post
+        # DC/Blind 날짜: today 부터 과거로 하루 posts_per_day 개씩 (최신순 목록)
+        self.today = today
+        self.posts_per_day = posts_per_day
+        # rate_limit: 최근 1초 동안 이 수를 넘는 요청은 429 + Retry-After (차단 흉내)
+        self.rate_limit = rate_limit
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.n_requests = 0
+        self.n_throttled = 0
+        self.n_errors = 0
+        self._hits = deque()
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    # 1초 슬라이딩 윈도우. 한도를 넘으면 Retry-After 초, 아니면 None
+    def throttled(self):
+        if not self.rate_limit:
+            return None
+        with self._lock:
+            now = time.monotonic()
+            while self._hits and now - self._hits[0] >= 1.0:
+                self._hits.popleft()
+            if len(self._hits) >= self.rate_limit:
+                self.n_throttled += 1
+                return 1
+            self._hits.append(now)
+            return None
+
+    # 주입할 장애 → (status, Retry-After 또는 None), 정상이면 None
+    def inject(self):
+        with self._lock:
+            self.n_requests += 1
+        retry_after = self.throttled()
+        if retry_after is not None:
+            return 429, retry_after
+        if not (self.error_rate or self.throttle_rate):
+            return None
+        with self._lock:
+            r = self._rng.random()
+            if r < self.throttle_rate:
+                self.n_throttled += 1
+                return 429, self.retry_after
+            if r < self.throttle_rate + self.error_rate:
+                self.n_errors += 1
+                return 500, None
+        return None
+
+    # FmKorea 검색 결과 페이지. n_pages 를 넘으면 빈 테이블(rows=0)
+    def fmkorea_list(self, page: int) -> str:
+        trs = []
+        if 1 <= page <= self.n_pages:
+            for i in range(self.rows_per_page):
+                doc_id = 9_000_000_000 - (page - 1) * self.rows_per_page - i
+                day = 1 + (page + i) % 28
+                trs.append(
+                    "<tr>"
+                    f'<td class="cate"><span><a href="/stock?category=1">주식</a></span></td>'
+                    f'<td class="title"><a class="hx" href="/{doc_id}">하이닉스 {page}-{i} 글</a>'
+                    f'<a class="replyNum" href="/{doc_id}#comment">{(page * i) % 50}</a></td>'
+                    f'<td class="author"><span><a href="#">user{i}</a></span></td>'
+                    f'<td class="time">2025.11.{day:02d}</td>'
+                    f'<td class="m_no">{page * 100 + i:,}</td>'
+                    f'<td class="m_no">{i}</td>'
+                    "</tr>"
+                )
+        return (
+            "<html><body>"
+            '<table class="bd_lst bd_tb_lst bd_tb"><tbody>'
+            + "".join(trs)
+            + "</tbody></table></body></html>"
+        )
+
+    # FmKorea 게시글 상세 페이지 (#bd_capture + 댓글 li.fdb_itm)
+    def fmkorea_post(self, doc_id: int) -> str:
+        lis = []
+        for i in range(self.comments_per_post):
+            lis.append(
+                '<li class="fdb_itm clear">'
+                f'<div class="meta"><a class="member_plate">닉{i % 7}</a></div>'
+                f'<div class="comment-content"><div class="xe_content">댓글 {i} ㅋㅋㅋ 가즈아</div></div>'
+                f'<span class="vote"><span class="voted_count">{i % 5}</span></span>'
+                "</li>"
+            )
+        return (
+            '<html><body><div id="bd_capture">'
+            f'<div class="top_area"><h1 class="np_18px"><span class="np_18px_span">글 {doc_id}</span></h1>'
+            '<span class="date m_no">2025.11.04 11:07</span></div>'
+            f'<div class="rd_body"><article><div class="xe_content">본문 {doc_id}<br>둘째 줄</div></article></div>'
+            '<div class="btm_area"><div class="side fr">'
+            f'<span>조회 수 <b>{doc_id % 10000:,}</b></span>'
+            f'<span>추천 수 <b>{doc_id % 100}</b></span>'
+            f'<span>댓글 <b>{self.comments_per_post}</b></span>'
+            "</div></div></div>"
+            '<div class="fdb_lst_wrp"><div id="cmtPosition"><ul class="fdb_lst_ul">'
+            + "".join(lis)
+            + "</ul></div></div></body></html>"
+        )
+
+    # k 번째(0 = 최신) 게시글의 작성 시각
+    def post_time(self, k: int) -> datetime:
+        d = self.today - timedelta(days=k // self.posts_per_day)
+        minute = (self.posts_per_day - 1 - k % self.posts_per_day) * 1440 // self.posts_per_day
+        return datetime(d.year, d.month, d.day) + timedelta(minutes=minute)
+
+    # DC 갤러리 목록 (table.gall_list). 공지/AD 행 포함, n_pages 를 넘으면 빈 tbody
+    def dc_list(self, page: int) -> str:
+        trs = [
+            '<tr class="ub-content"><td class="gall_num">공지</td><td class="gall_subject">공지</td>'
+            '<td class="gall_tit"><a href="/mgallery/board/view/?id=kospi&no=1">공지사항</a></td>'
+            '<td class="gall_writer">운영자</td><td class="gall_date" title="2024-01-01 00:00:00">24.01.01</td>'
+            '<td class="gall_count">-</td><td class="gall_recommend">-</td></tr>',
+            '<tr class="ub-content"><td class="gall_num">-</td><td class="gall_subject">AD</td>'
+            '<td class="gall_tit"><a href="https://ad.example/">광고</a></td>'
+            '<td class="gall_writer"></td><td class="gall_date"></td>'
+            '<td class="gall_count">-</td><td class="gall_recommend">-</td></tr>',
+        ]
+        if 1 <= page <= self.n_pages:
+            for i in range(self.rows_per_page):
+                k = (page - 1) * self.rows_per_page + i
+                no = 5_000_000 - k
+                ts = self.post_time(k)
+                if ts.date() == self.today:
+                    shown = ts.strftime("%H:%M")
+                elif ts.year == self.today.year:
+                    shown = ts.strftime("%m.%d")
+                else:
+                    shown = ts.strftime("%y.%m.%d")
+                trs.append(
+                    '<tr class="ub-content us-post">'
+                    f'<td class="gall_num">{no}</td>'
+                    f'<td class="gall_subject">일반</td>'
+                    f'<td class="gall_tit ub-word"><a href="/mgallery/board/view/?id=kospi&no={no}&page={page}">'
+                    f'<em class="icon_img icon_txt"></em>삼전 {no} 글</a>'
+                    f'<a class="reply_numbox" href="#"><span class="reply_num">[{k % 9}]</span></a></td>'
+                    f'<td class="gall_writer ub-writer">ㅇㅇ</td>'
+                    f'<td class="gall_date" title="{ts:%Y-%m-%d %H:%M:%S}">{shown}</td>'
+                    f'<td class="gall_count">{100 + k % 900}</td>'
+                    f'<td class="gall_recommend">{k % 7}</td>'
+                    "</tr>"
+                )
+        return (
+            '<html><body><table class="gall_list"><thead><tr>'
+            "<th>번호</th><th>말머리</th><th>제목</th><th>글쓴이</th><th>작성일</th><th>조회</th><th>추천</th>"
+            "</tr></thead><tbody>" + "".join(trs) + "</tbody></table></body></html>"
+        )
+
+    # Blind 검색 결과 카드 (div.article-list-pre) 하나
+    def blind_card(self, k: int) -> str:
+        now = datetime.combine(self.today, datetime.min.time()) + timedelta(hours=23, minutes=59)
+        ts = self.post_time(k)
+        delta = now - ts
+        if delta < timedelta(hours=1):
+            shown = f"{delta.seconds // 60}분"
+        elif delta < timedelta(days=1):
+            shown = f"{delta.seconds // 3600}시간"
+        elif ts.year == self.today.year:
+            shown = ts.strftime("%m.%d")
+        else:
+            shown = ts.strftime("%y.%m.%d")
+        return (
+            '<div class="article-list-pre">'
+            f'<div class="tit"><h3><a href="/kr/post/{7_000_000 - k}">삼성 {k} 글</a></h3></div>'
+            f'<div class="info"><a class="past" href="#"><i class="blind">작성시간</i>{shown}</a>'
+            f'<a class="pv" href="#"><i class="blind">조회수</i>{50 + k % 500}</a>'
+            f'<span class="like"><i class="blind">좋아요</i>{k % 13}</span>'
+            f'<a class="cmt" href="#"><i class="blind">댓글</i>{k % 11}</a></div>'
+            "</div>"
+        )
+
+    # k 번째부터 n 개 카드가 든 검색 결과 페이지
+    def blind_cards(self, start: int, n: int) -> str:
+        cards = "".join(self.blind_card(k) for k in range(start, start + n))
+        return '<html><body><div class="article-list">' + cards + "</div></body></html>"
+
+    # DC 게시글 본문 (.write_div + 댓글 수)
+    def dc_post(self, no: int) -> str:
+        return (
+            '<html><body><div class="view_content_wrap">'
+            f'<span class="gall_comment"><a href="#">댓글 {no % 9}</a></span>'
+            f'<div class="write_div"><p>삼전 {no} 본문</p><p>둘째 줄</p></div>'
+            "</div></body></html>"
+        )
+
+    # Blind 게시글 본문 (p#contentArea)
+    def blind_post(self, post_id: int) -> str:
+        return (
+            '<html><body><div class="article-view">'
+            f'<p id="contentArea" class="contents-txt">삼성 {post_id} 본문<br>둘째 줄</p>'
+            "</div></body></html>"
+        )
+
+    # 경로 → (status, html)
+    def route(self, path: str, query: dict):
+        if path == "/search.php":
+            page = int(query.get("page", ["1"])[0])
+            return 200, self.fmkorea_list(page)
+        if path[1:].isdigit():
+            return 200, self.fmkorea_post(int(path[1:]))
+        if path == "/mgallery/board/lists/":
+            page = int(query.get("page", ["1"])[0])
+            return 200, self.dc_list(page)
+        if path == "/mgallery/board/view/":
+            return 200, self.dc_post(int(query.get("no", ["0"])[0]))
+        if path.startswith("/kr/post/"):
+            return 200, self.blind_post(int(path.rsplit("/", 1)[1]))
+        if path.startswith("/kr/search/"):
+            # ?page=N 이면 N 번째 묶음만, 없으면 전체 (무한 스크롤 화면과 같은 형태)
+            if "page" in query:
+                page = int(query["page"][0])
+                if not 1 <= page <= self.n_pages:
+                    return 200, self.blind_cards(0, 0)
+                return 200, self.blind_cards((page - 1) * self.rows_per_page, self.rows_per_page)
+            return 200, self.blind_cards(0, self.rows_per_page * self.n_pages)
+        return 404, "<html><body>not found</body></html>"
+
+
+# =========================
+# 수집해 둔 원본 HTML 그대로 서빙 (cache.ResponseArchive)
+# =========================
+# 호스트는 무시하고 경로 + 쿼리(순서 무관)로 찾는다. 없으면 404.
+# 지연/장애 주입 옵션은 MockSite 와 같다.
+#
+#   site = RecordedSite(ResponseArchive("../data/raw_html"), latency=0.1, throttle_rate=0.02)
+#   with serve(site) as base:
+#       crawl_one(session, base + "/search.php?mid=stock&search_keyword=...&page={}", ...)
+class RecordedSite(MockSite):
+    def __init__(self, archive, **kwargs):
+        super().__init__(**kwargs)
+        self.archive = archive
+        self._index = {}
+        for url, _, sha in archive.entries():
+            parts = urlsplit(url)
+            self._index[self._key(parts.path, parse_qs(parts.query))] = sha
+
+    @staticmethod
+    def _key(path: str, query: dict):
+        return path, tuple(sorted((k, tuple(v)) for k, v in query.items()))
+
+    def route(self, path: str, query: dict):
+        sha = self._index.get(self._key(path, query))
+        if sha is None:
+            return 404, "<html><body>not recorded</body></html>"
+        return 200, self.archive.read_body(sha).decode("utf-8", errors="replace")
+
+
+def _make_handler(site: MockSite):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive
+
+        def do_GET(self):
+            parts = urlsplit(self.path)
+            fault = site.inject()
+            if fault is not None:
+                status, retry_after = fault
+                body = f"<html><body>error {status}</body></html>".encode("utf-8")
+                self.send_response(status)
+                if retry_after is not None:
+                    self.send_header("Retry-After", str(retry_after))
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                return
+            if site.latency:
+                time.sleep(site.latency)
+            status, html = site.route(parts.path, parse_qs(parts.query))
+            body = html.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+@contextmanager
+def serve(site: MockSite, host="127.0.0.1", port=0):
+    server = ThreadingHTTPServer((host, port), _make_handler(site))
+    server.daemon_threads = True
+    th = threading.Thread(target=server.serve_forever, daemon=True)
+    th.start()
+    try:
+        yield f"http://{host}:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
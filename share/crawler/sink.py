@@ -0,0 +1,171 @@
+import glob
+import json
+import os
+import time
+from datetime import datetime
+
+import pandas as pd
+
+
+# =========================
+# 스트리밍 저장 (append-only JSONL / Parquet)
+# =========================
+# crawl_one 은 dict of lists 에, Blind 노트북은 posts 리스트에 전부 모았다가 마지막에 저장했다.
+# 긴 백필은 메모리가 계속 늘고, 중간에 예외가 나면 통째로 날아간다.
+#
+# Sink 는 페이지가 끝날 때마다 행을 받아서
+# - flush_rows 개가 쌓이거나 flush_sec 초가 지나면 파일에 씀 (JSONL 줄 / Parquet row group)
+# - rotate_rows 개마다 파일을 닫고 이름을 바꿔 확정 (*.inprogress → part-....jsonl, os.replace 라 원자적)
+# - 예외로 빠져나와도 with 블록이 닫히면서 지금까지의 행은 확정 파일로 남음
+#
+#   with JsonlSink("../data/fmkorea_hynix") as sink:
+#       crawl_one(session, url_base, "하이닉스", 1, 5000, sink=sink)
+#   df = read_sink("../data/fmkorea_hynix")
+class RowSink:
+    suffix = ""
+
+    def __init__(self, root: str, prefix="part", columns=None, flush_rows=500, flush_sec=30.0,
+                 rotate_rows=100_000, fsync=True):
+        self.root = root
+        self.prefix = prefix
+        self.columns = columns
+        self.flush_rows = flush_rows
+        self.flush_sec = flush_sec
+        self.rotate_rows = rotate_rows
+        self.fsync = fsync
+        os.makedirs(root, exist_ok=True)
+
+        self.n_rows = 0          # 지금까지 받은 행 수
+        self.n_files = 0         # 확정된 파일 수
+        self._buf = []
+        self._file_rows = 0      # 현재 파일에 쓴 행 수
+        self._tmp_path = None
+        self._last_flush = time.monotonic()
+        # 같은 폴더에 여러 번 실행해도 이름이 겹치지 않게 시작 시각을 붙임
+        self._run_id = datetime.now().strftime("%Y%m%d-%H%M%S")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def write(self, row: dict):
+        self.write_many([row])
+
+    def write_many(self, rows):
+        for row in rows:
+            if self.columns is not None:
+                row = {c: row.get(c) for c in self.columns}
+            self._buf.append(row)
+            self.n_rows += 1
+        if len(self._buf) >= self.flush_rows or time.monotonic() - self._last_flush >= self.flush_sec:
+            self.flush()
+
+    def flush(self):
+        self._last_flush = time.monotonic()
+        while self._buf:
+            if self._tmp_path is None:
+                self._tmp_path = os.path.join(
+                    self.root, f"{self.prefix}-{self._run_id}-{self.n_files:05d}{self.suffix}.inprogress")
+                self._open(self._tmp_path)
+            room = self.rotate_rows - self._file_rows if self.rotate_rows else len(self._buf)
+            chunk, self._buf = self._buf[:room], self._buf[room:]
+            self._write_rows(chunk)
+            self._file_rows += len(chunk)
+            if self.rotate_rows and self._file_rows >= self.rotate_rows:
+                self.rotate()
+
+    # 현재 파일 확정: 닫고(fsync) → .inprogress 떼기
+    def rotate(self):
+        if self._tmp_path is None:
+            return
+        self._close_file()
+        os.replace(self._tmp_path, self._tmp_path[: -len(".inprogress")])
+        self._tmp_path = None
+        self._file_rows = 0
+        self.n_files += 1
+
+    def close(self):
+        self.flush()
+        self.rotate()
+
+    # ---------- 포맷별 ----------
+    def _open(self, path):
+        raise NotImplementedError
+
+    def _write_rows(self, rows):
+        raise NotImplementedError
+
+    def _close_file(self):
+        raise NotImplementedError
+
+
+class JsonlSink(RowSink):
+    suffix = ".jsonl"
+
+    def _open(self, path):
+        self._f = open(path, "a", encoding="utf-8")
+
+    def _write_rows(self, rows):
+        self._f.write("".join(json.dumps(r, ensure_ascii=False) + "\n" for r in rows))
+        self._f.flush()
+        if self.fsync:
+            os.fsync(self._f.fileno())
+
+    def _close_file(self):
+        self._f.close()
+
+
+# flush 한 번 = row group 하나. 스키마는 첫 flush 의 행으로 정해진다
+# (columns 를 주면 열 순서 고정, 타입이 섞일 수 있는 열은 미리 문자열로 맞춰 둘 것)
+class ParquetSink(RowSink):
+    suffix = ".parquet"
+
+    def __init__(self, root: str, prefix="part", columns=None, flush_rows=5_000, flush_sec=60.0,
+                 rotate_rows=500_000, fsync=True, compression="zstd"):
+        import pyarrow  # noqa: F401  (없으면 여기서 바로 ImportError)
+
+        super().__init__(root, prefix, columns, flush_rows, flush_sec, rotate_rows, fsync)
+        self.compression = compression
+        self.schema = None
+
+    def _open(self, path):
+        self._path = path
+        self._writer = None
+
+    def _write_rows(self, rows):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if self.schema is None:
+            self.schema = pa.Table.from_pylist(rows).schema
+        table = pa.Table.from_pylist(rows, schema=self.schema)
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self._path, self.schema, compression=self.compression)
+        self._writer.write_table(table)
+
+    def _close_file(self):
+        if self._writer is not None:
+            self._writer.close()
+            if self.fsync:
+                with open(self._path, "rb") as f:
+                    os.fsync(f.fileno())
+        self._writer = None
+
+
+# 확정된 파일만 읽어서 DataFrame 하나로 (include_inprogress=True 면 JSONL 작성 중 파일도 포함)
+def read_sink(root: str, include_inprogress=False) -> pd.DataFrame:
+    paths = sorted(glob.glob(os.path.join(root, "*.jsonl")) + glob.glob(os.path.join(root, "*.parquet")))
+    if include_inprogress:
+        paths += sorted(glob.glob(os.path.join(root, "*.jsonl.inprogress")))
+
+    frames = []
+    for p in paths:
+        if ".parquet" in p:
+            frames.append(pd.read_parquet(p))
+        else:
+            frames.append(pd.read_json(p, lines=True, dtype=False))
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, ignore_index=True)
@@ -0,0 +1,193 @@
+import re
+from datetime import date, datetime
+from urllib.parse import quote
+
+from . import blind, dc, fmkorea
+
+# =========================
+# 공통 게시글 스키마
+# =========================
+# 어느 사이트든 어댑터를 거치면 이 컬럼으로 나온다.
+# - date: "YYYY-MM-DD" / views·likes·comments: int / content: 상세 수집 전에는 ""
+# - FmKorea 는 상세 수집 후 댓글 목록이 "comment_list" 로 추가된다
+POST_COLUMNS = [
+    "site", "keyword", "post_id", "post_url", "title", "author", "date",
+    "views", "likes", "comments", "category", "content",
+]
+
+
+def _to_int(v) -> int:
+    if v is None:
+        return 0
+    if isinstance(v, int):
+        return v
+    t = re.sub(r"[^\d]", "", str(v))
+    return int(t) if t else 0
+
+
+def _post(**kw) -> dict:
+    return {c: kw.get(c, "") for c in POST_COLUMNS}
+
+
+# =========================
+# 사이트 어댑터
+# =========================
+# 사이트마다 다른 부분만 구현한다.
+# - list_url(keyword, page)       : 목록 페이지 URL
+# - parse_list(html, now)         : 목록 HTML → 공통 스키마 dict 리스트 (목록 끝이면 None)
+# - parse_detail(html, post, now) : 상세 HTML → post 에 채울 필드 dict
+# - parse_date(text, now)         : 사이트 날짜 표기 → date
+# base_url 을 바꾸면 같은 코드로 로컬 mockserver 에 붙일 수 있다.
+class SiteAdapter:
+    name = ""
+    headers = None
+    origin = ""  # 실제 사이트 주소 (post_url 에 들어가는 값)
+
+    def __init__(self, base_url: str = None):
+        self.base_url = base_url or self.origin
+
+    def list_url(self, keyword: str, page: int) -> str:
+        raise NotImplementedError
+
+    def parse_list(self, html: str, keyword: str, now: datetime):
+        raise NotImplementedError
+
+    def parse_detail(self, html: str, post: dict, now: datetime) -> dict:
+        raise NotImplementedError
+
+    def parse_date(self, text: str, now: datetime) -> date:
+        raise NotImplementedError
+
+    # 상세 요청 URL (base_url 을 바꿨으면 그 주소로)
+    def detail_url(self, post: dict) -> str:
+        return post["post_url"].replace(self.origin, self.base_url, 1)
+
+
+class FmKoreaAdapter(SiteAdapter):
+    name = "fmkorea"
+    headers = fmkorea.HEADERS
+    origin = fmkorea.BASE_URL
+
+    # sort="pop" 이면 인기글 검색
+    # category: 안 주면 노트북과 같게 일반 검색은 fmkorea.STOCK_CATEGORY, 인기글은 없음 ("" 이면 항상 없음)
+    def __init__(self, base_url: str = None, search_target="title_content", sort=None,
+                 backend="bs4", category=None):
+        super().__init__(base_url)
+        self.search_target = search_target
+        self.sort = sort
+        self.backend = backend
+        if category is None:
+            category = "" if sort == "pop" else fmkorea.STOCK_CATEGORY
+        self.category = category
+
+    def list_url(self, keyword, page):
+        url = f"{self.base_url}/search.php?mid=stock"
+        if self.category:
+            url += f"&category={self.category}"
+        url += (f"&search_keyword={quote(keyword)}"
+                f"&search_target={self.search_target}&listStyle=list&page={page}")
+        if self.sort == "pop":
+            url += "&sort_index=pop&order_type=desc"
+        return url
+
+    def parse_date(self, text, now):
+        return date.fromisoformat(fmkorea.normalize_date(text, now.strftime("%Y-%m-%d")))
+
+    def parse_list(self, html, keyword, now):
+        rows = fmkorea.parse_list_page(html, keyword, today=now.strftime("%Y-%m-%d"),
+                                       backend=self.backend)
+        if rows is None:
+            return None
+        return [_post(
+            site=self.name, keyword=keyword,
+            post_id=r["post_url"].rstrip("/").rsplit("/", 1)[-1],
+            post_url=r["post_url"], title=r["제목"], author=r["글쓴이"], date=r["날짜"],
+            views=r["조회"], likes=r["추천"], comments=r["댓글수"], category=r["탭"],
+        ) for r in rows]
+
+    def parse_detail(self, html, post, now):
+        d = fmkorea.parse_post_detail_html(html, post["post_url"], today=now.strftime("%Y-%m-%d"),
+                                           backend=self.backend)
+        return {
+            "content": d["content"],
+            "views": d["views"] or post["views"],
+            "likes": d["votes"] or post["likes"],
+            "comments": d["comment_count"] or post["comments"],
+            "comment_list": d["comments"],
+        }
+
+
+class DCAdapter(SiteAdapter):
+    name = "dcinside"
+    headers = dc.HEADERS
+    origin = dc.BASE_URL
+
+    # keyword 자리에 갤러리 id (예: "kospi")
+    def __init__(self, base_url: str = None, backend="bs4"):
+        super().__init__(base_url)
+        self.backend = backend
+
+    def list_url(self, keyword, page):
+        return f"{self.base_url}/mgallery/board/lists/?id={keyword}&page={page}"
+
+    def parse_date(self, text, now):
+        return dc.parse_gall_date(text, now.date())
+
+    def parse_list(self, html, keyword, now):
+        rows = dc.parse_gall_list(html, backend=self.backend)
+        if rows is None:
+            return None
+        out = []
+        for r in rows:
+            d = self.parse_date(r["date"], now)
+            out.append(_post(
+                site=self.name, keyword=keyword, post_id=r["post_id"], post_url=r["post_url"],
+                title=r["title"], author="", date=d.isoformat() if d else "",
+                views=_to_int(r["view_count"]), likes=_to_int(r["recommend_count"]), comments=0,
+                category=r["subject"],
+            ))
+        return out
+
+    def parse_detail(self, html, post, now):
+        return {"content": dc.parse_content(html), "comments": dc.parse_comment_count(html)}
+
+
+class BlindAdapter(SiteAdapter):
+    name = "blind"
+    headers = blind.HEADERS
+    origin = blind.BASE_URL
+
+    # 목록 엔드포인트: {keyword}, {page} 자리 표시 (blind.collect_list_http 참고)
+    def __init__(self, base_url: str = None, list_path="/kr/search/{keyword}?page={page}",
+                 backend="bs4"):
+        super().__init__(base_url)
+        self.list_path = list_path
+        self.backend = backend
+
+    def list_url(self, keyword, page):
+        return self.base_url + self.list_path.format(keyword=quote(keyword), page=page)
+
+    def parse_date(self, text, now):
+        dt = blind.parse_date_kor(text, now)
+        return dt.date() if dt else None
+
+    def parse_list(self, html, keyword, now):
+        cards = blind.parse_article_cards(html, now, backend=self.backend)
+        if not cards:
+            return None
+        return [_post(
+            site=self.name, keyword=keyword, post_id=c["url"].rstrip("/").rsplit("/", 1)[-1],
+            post_url=c["url"], title=c["title"], author="", date=c["date"],
+            views=_to_int(c["views"]), likes=_to_int(c["likes"]), comments=_to_int(c["comments"]),
+            category="",
+        ) for c in cards]
+
+    def parse_detail(self, html, post, now):
+        return {"content": blind.extract_content(html)}
+
+
+ADAPTERS = {a.name: a for a in (FmKoreaAdapter, DCAdapter, BlindAdapter)}
+
+
+def get_adapter(name: str, **kwargs) -> SiteAdapter:
+    return ADAPTERS[name](**kwargs)
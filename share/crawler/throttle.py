@@ -0,0 +1,260 @@
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+import requests
+
+from .engine import Crawler
+from .http import SessionPool
+
+
+# =========================
+# 호스트별 자동 속도 조절 (AutoThrottle)
+# =========================
+# 고정 sleep_sec=2 / SCROLL_PAUSE 대신 응답을 보고 간격과 동시 요청 수를 바꾼다.
+#
+# - 정상 응답 : 목표 간격 = 응답시간 / target_concurrency, 현재 간격과 평균 (서버가 빠르면 빨라짐)
+#               연속 성공이 쌓이면 동시 요청 수 +1 (additive increase)
+# - 429 / 503 : 간격 2배 + Retry-After 만큼 일시 정지, 동시 요청 수 절반 (multiplicative decrease)
+# - 그 외 오류 : 간격 1.5배
+# - min_delay 는 호스트별 요청 예산 (초당 최대 1/min_delay 건)
+class HostThrottle:
+    def __init__(self, start_delay=1.0, min_delay=0.05, max_delay=60.0, start_concurrency=1,
+                 max_concurrency=8, target_concurrency=2.0):
+        self.delay = start_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.concurrency = start_concurrency
+        self.max_concurrency = max_concurrency
+        self.target_concurrency = target_concurrency
+
+        self.in_flight = 0
+        self.next_at = 0.0
+        self.ok_streak = 0
+        self.stats = {"requests": 0, "ok": 0, "throttled": 0, "errors": 0, "latency_sum": 0.0}
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                if self.in_flight < self.concurrency and now >= self.next_at:
+                    break
+                timeout = max(self.next_at - now, 0.0) if self.in_flight < self.concurrency else None
+                self._cond.wait(timeout)
+            self.in_flight += 1
+            self.next_at = time.monotonic() + self.delay
+            self.stats["requests"] += 1
+
+    def release(self, latency: float, status: int, retry_after: float = None):
+        with self._cond:
+            self.in_flight -= 1
+            self.stats["latency_sum"] += latency
+
+            if status in (429, 503):
+                self.stats["throttled"] += 1
+                self.delay = min(self.max_delay, self.delay * 2)
+                self.concurrency = max(1, self.concurrency // 2)
+                # Retry-After 는 그 시간만큼 멈추는 데만 쓰고 간격 자체에는 반영하지 않음
+                self.next_at = time.monotonic() + max(self.delay, retry_after or 0.0)
+                self.ok_streak = 0
+            elif status == 0 or status >= 400:
+                self.stats["errors"] += 1
+                self.delay = min(self.max_delay, self.delay * 1.5)
+                self.ok_streak = 0
+            else:
+                self.stats["ok"] += 1
+                target = latency / self.target_concurrency
+                self.delay = min(self.max_delay, max(self.min_delay, (self.delay + target) / 2))
+                self.ok_streak += 1
+                if self.ok_streak >= 2 * self.concurrency and self.concurrency < self.max_concurrency:
+                    self.concurrency += 1
+                    self.ok_streak = 0
+
+            self._cond.notify_all()
+
+
+class AutoThrottle:
+    def __init__(self, **host_kwargs):
+        self.host_kwargs = host_kwargs
+        self.hosts = {}
+        self._lock = threading.Lock()
+
+    def host(self, url: str) -> HostThrottle:
+        netloc = urlsplit(url).netloc
+        with self._lock:
+            if netloc not in self.hosts:
+                self.hosts[netloc] = HostThrottle(**self.host_kwargs)
+            return self.hosts[netloc]
+
+    # with throttle.slot(url) as done: ... done(status, retry_after)
+    @contextmanager
+    def slot(self, url: str):
+        h = self.host(url)
+        h.acquire()
+        t0 = time.monotonic()
+        result = {"status": 0, "retry_after": None}
+
+        def done(status, retry_after=None):
+            result["status"] = status
+            result["retry_after"] = retry_after
+
+        try:
+            yield done
+        finally:
+            h.release(time.monotonic() - t0, result["status"], result["retry_after"])
+
+    def summary(self) -> dict:
+        out = {}
+        for netloc, h in self.hosts.items():
+            s = h.stats
+            out[netloc] = {
+                **{k: v for k, v in s.items() if k != "latency_sum"},
+                "avg_latency": s["latency_sum"] / s["requests"] if s["requests"] else 0.0,
+                "delay": h.delay,
+                "concurrency": h.concurrency,
+            }
+        return out
+
+
+def _retry_after(resp) -> float:
+    try:
+        return float(resp.headers.get("Retry-After", ""))
+    except (TypeError, ValueError):
+        return None
+
+
+# Crawler.fetch 를 AutoThrottle 로 감싼 버전
+# 상태코드 재시도는 세션에서 끄고(retry_statuses=()), 429/5xx 는 스케줄러가 다시 큐에 넣는다
+class ThrottledCrawler(Crawler):
+    def __init__(self, throttle: AutoThrottle = None, pool: SessionPool = None, verbose=True,
+                 registry=None, metrics=None):
+        super().__init__(pool or SessionPool(retry_statuses=()), sleep_sec=0, verbose=verbose,
+                         registry=registry, metrics=metrics)
+        self.throttle = throttle or AutoThrottle()
+
+    def fetch(self, adapter, url, keyword=""):
+        with self.throttle.slot(url) as done:
+            try:
+                text = super().fetch(adapter, url, keyword)
+            except requests.HTTPError as e:
+                done(e.response.status_code, _retry_after(e.response))
+                raise
+            done(200)
+            return text
+
+
+# =========================
+# 검색어 작업 공정 스케줄러
+# =========================
+# (사이트, 검색어) 작업 여러 개를 워커 스레드로 돌리되
+# - 한 작업 안에서는 페이지를 순서대로 (rows=0 / 날짜 중단 조건 유지)
+# - 작업끼리는 라운드로빈으로 번갈아 → "하이닉스"가 끝날 때까지 "하닉"이 굶지 않음
+# - 같은 호스트의 작업들은 AutoThrottle 예산 하나를 나눠 씀
+# - 429/5xx 페이지는 max_attempts 번까지 다시 시도, 그래도 실패하면 그 작업은 그 페이지에서 끝나고
+#   (사이트, 검색어, 페이지, 상태코드) 가 실패 목록에 남음 → 나중에 sched.add(..., start_page=page) 로 재수집
+#
+#   sched = CrawlScheduler(ThrottledCrawler(), workers=8)
+#   fm = FmKoreaAdapter()
+#   for kw in ["하이닉스", "하닉", "삼성전자", "삼전"]:
+#       sched.add(fm, kw, 1, 100)
+#   results, failed = sched.run()   # {("fmkorea", "하이닉스"): [...], ...}, [("fmkorea", "하닉", 37, 429), ...]
+class _Job:
+    def __init__(self, adapter, keyword, start_page, end_page, start_date, end_date):
+        self.adapter = adapter
+        self.keyword = keyword
+        self.page = start_page
+        self.end_page = end_page
+        self.start_date = start_date
+        self.end_date = end_date
+        self.posts = []
+        self.n_posts = 0
+        self.attempts = 0
+        self.busy = False
+        self.done = False
+
+    @property
+    def key(self):
+        return self.adapter.name, self.keyword
+
+
+class CrawlScheduler:
+    # sink 를 주면 페이지마다 sink 로 보내고 작업별 posts 에는 모으지 않음
+    def __init__(self, crawler: ThrottledCrawler = None, workers=8, max_attempts=5, sink=None):
+        self.crawler = crawler or ThrottledCrawler()
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.sink = sink
+        self._jobs = deque()
+        self._cond = threading.Condition()
+        self.failed = []
+
+    def add(self, adapter, keyword, start_page=1, end_page=10, start_date=None, end_date=None):
+        self._jobs.append(_Job(adapter, keyword, start_page, end_page, start_date, end_date))
+
+    # 다음에 돌릴 작업 (라운드로빈). 모두 끝났으면 None
+    def _next_job(self):
+        with self._cond:
+            while True:
+                if all(j.done for j in self._jobs):
+                    return None
+                for _ in range(len(self._jobs)):
+                    j = self._jobs[0]
+                    self._jobs.rotate(-1)
+                    if not j.done and not j.busy:
+                        j.busy = True
+                        return j
+                self._cond.wait()
+
+    def _finish(self, job, done=False):
+        with self._cond:
+            job.busy = False
+            job.done = job.done or done
+            self._cond.notify_all()
+
+    def _worker(self):
+        c = self.crawler
+        while True:
+            job = self._next_job()
+            if job is None:
+                return
+            try:
+                kept, stop = c.crawl_page(job.adapter, job.keyword, job.page,
+                                          job.start_date, job.end_date)
+            except Exception as e:
+                job.attempts += 1
+                if c.metrics is not None and job.attempts < self.max_attempts:
+                    c.metrics.inc_retry(job.adapter.name, job.keyword)
+                status = getattr(getattr(e, "response", None), "status_code", None)
+                c._log(f"[{job.adapter.name}:{job.keyword}] {job.page}페이지 실패({status or e}) "
+                       f"{job.attempts}/{self.max_attempts}")
+                if job.attempts >= self.max_attempts:
+                    c._log(f"[{job.adapter.name}:{job.keyword}] {job.page}페이지 포기 → 이 검색어는 여기서 중단")
+                    with self._cond:
+                        self.failed.append((job.adapter.name, job.keyword, job.page, status or 0))
+                self._finish(job, done=job.attempts >= self.max_attempts)
+                continue
+
+            job.attempts = 0
+            job.n_posts += len(kept)
+            if self.sink is not None:
+                with self._cond:
+                    self.sink.write_many(kept)
+            else:
+                job.posts.extend(kept)
+            c._log(f"[{job.adapter.name}:{job.keyword}] {job.page}페이지 완료 / 이번 페이지 {len(kept)}개 / 누적 {job.n_posts}개")
+            if stop:
+                c._log(f"[{job.adapter.name}:{job.keyword}] {job.page}페이지: {stop} → 중단")
+            job.page += 1
+            self._finish(job, done=bool(stop) or job.page > job.end_page)
+
+    # → (작업별 결과 dict, 포기한 페이지 [(사이트, 검색어, 페이지, 상태코드)])
+    def run(self):
+        threads = [threading.Thread(target=self._worker, daemon=True) for _ in range(self.workers)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        return {j.key: j.posts for j in self._jobs}, list(self.failed)
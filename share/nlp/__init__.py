@@ -0,0 +1,5 @@
+from .tokens import (
+    REPEAT_RULES, STOP_TAGS, USER_WORDS, KiwiTokenizer, build_kiwi, daily_token_counts, iter_post_texts,
+    normalize_repeats,
+)
+from .cache import CachedTokenizer, TokenCache
@@ -0,0 +1,117 @@
+import argparse
+import os
+import random
+import re
+import tempfile
+import time
+
+from .cache import CachedTokenizer
+from .tokens import STOP_TAGS, KiwiTokenizer, build_kiwi
+
+
+# =========================
+# 벤치마크/검증: 토큰화
+# =========================
+#   python -m share.nlp.bench tokens --comments 20000
+#   python -m share.nlp.bench cache --comments 20000 --unique 0.3
+
+
+# 가짜 댓글 (반복 문자/어미 섞인 짧은 문장)
+def _sample_comments(n, seed=0):
+    rng = random.Random(seed)
+    words = ["삼전", "하닉", "오늘", "떡상", "가즈아", "손절", "존버", "물렸다", "고점", "반도체",
+             "외인", "매수", "매도", "실적", "발표", "내일", "폭락", "ㅋ" * 12, "ㅠ" * 6, "ㅎㅎㅎㅎㅎㅎ"]
+    tails = ["이다", "네요", "가자", "했음", "인듯", "?", "!!", "...", ""]
+    return [" ".join(rng.choice(words) + rng.choice(tails) for _ in range(rng.randint(2, 12)))
+            for _ in range(n)]
+
+
+def _legacy_tokenize(kiwi, text):
+    s = re.sub(r"ㅋ{5,}", "ㅋㅋㅋㅋ", text)
+    s = re.sub(r"ㅎ{5,}", "ㅎㅎㅎㅎ", s)
+    s = re.sub(r"ㅠ{3,}", "ㅠㅠ", s)
+    s = re.sub(r"ㅜ{3,}", "ㅜㅜ", s)
+    out = []
+    for t in kiwi.tokenize(s):
+        if t.tag in STOP_TAGS:
+            continue
+        w = t.form.strip()
+        if len(w) <= 1:
+            continue
+        out.append(w)
+    return out
+
+
+# 댓글마다 tokenize (notebook) vs 배치 tokenize_many
+def bench_tokens(comments=20_000, num_workers=-1):
+    texts = _sample_comments(comments)
+    tk = KiwiTokenizer(num_workers=num_workers)
+    legacy_kiwi = build_kiwi(num_workers=None)
+    legacy_kiwi.tokenize("워밍업")
+    tk.tokenize("워밍업")
+
+    t0 = time.perf_counter()
+    old = [_legacy_tokenize(legacy_kiwi, t) for t in texts]
+    t_old = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    new = list(tk.tokenize_many(texts))
+    t_new = time.perf_counter() - t0
+
+    assert new == old
+    print(f"댓글 {comments:,}개 / 코어 {os.cpu_count()} / num_workers {num_workers}")
+    print(f"  댓글마다 tokenize  {comments / t_old:10,.0f} comments/s  ({t_old:.2f}s)")
+    print(f"  배치 tokenize_many {comments / t_new:10,.0f} comments/s  ({t_new:.2f}s)")
+
+
+# 토큰 캐시: 캐시 없음 / 첫 실행(빈 캐시) / 재실행
+def bench_cache(comments=20_000, unique=0.3, path=None):
+    rng = random.Random(1)
+    pool = _sample_comments(max(int(comments * unique), 1), seed=2) + ["ㅋㅋㅋㅋㅋㅋ", "가즈아", "ㅠㅠㅠ"]
+    texts = [rng.choice(pool) for _ in range(comments)]
+
+    tk = KiwiTokenizer()
+    tk.tokenize("워밍업")
+    t0 = time.perf_counter()
+    ref = list(tk.tokenize_many(texts))
+    t_plain = time.perf_counter() - t0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = path or os.path.join(tmp, "token_cache.sqlite")
+        rows = []
+        for label in ("첫 실행", "재실행"):
+            with CachedTokenizer(tk, path) as ct:
+                t0 = time.perf_counter()
+                got = list(ct.tokenize_many(texts))
+                sec = time.perf_counter() - t0
+                assert got == ref
+                rows.append((label, sec, ct.cache.misses))
+        size = os.path.getsize(path)
+
+        # 사용자 사전이 바뀌면 캐시가 비워져야 함
+        tk2 = KiwiTokenizer(user_words=tk.user_words + [("가즈아", "NNP", 0)])
+        with CachedTokenizer(tk2, path) as ct:
+            assert len(ct.cache) == 0
+
+    print(f"댓글 {comments:,}개 (고유 약 {len(pool):,}개)")
+    print(f"  캐시 없음 {comments / t_plain:10,.0f} comments/s  ({t_plain:.2f}s)")
+    for label, sec, misses in rows:
+        print(f"  {label:<8}{comments / sec:10,.0f} comments/s  ({sec:.2f}s, Kiwi 분석 {misses:,}개)")
+    print(f"  캐시 파일 {size / 2**10:,.0f}KB")
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("what", nargs="?", default="all", choices=["all", "tokens", "cache"])
+    ap.add_argument("--comments", type=int, default=20_000)
+    ap.add_argument("--workers", type=int, default=-1, help="tokens: Kiwi num_workers (-1: 전체 코어)")
+    ap.add_argument("--unique", type=float, default=0.3, help="cache: 고유 댓글 비율")
+    args = ap.parse_args()
+    if args.what in ("all", "tokens"):
+        bench_tokens(args.comments, args.workers)
+    if args.what in ("all", "cache"):
+        bench_cache(args.comments, args.unique)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+import hashlib
+import itertools
+import os
+import sqlite3
+from collections import deque
+
+from .tokens import KiwiTokenizer, normalize_repeats
+
+_SEP = "\x1f"           # 토큰 구분자 (Kiwi 형태소에 나오지 않는 제어 문자)
+_IN_CHUNK = 500         # SQLite IN (...) 한 번에 넣는 키 수
+
+
+# =========================
+# 토큰화 결과 영구 캐시
+# =========================
+# 같은 댓글이 하루 점수 / 날짜별 워드클라우드 / 일별 감성 작업마다 다시 토큰화되고,
+# "ㅋㅋㅋㅋ", "가즈아" 같은 똑같은 댓글도 많다.
+# 정규화한 텍스트의 해시 → 토큰 목록을 SQLite 에 저장해 두고 처음 보는 텍스트만 Kiwi 로 보낸다.
+# - 키   : blake2b(설정 지문 + 정규화 텍스트) 16바이트
+# - 값   : 토큰을 \x1f 로 이은 문자열 (WITHOUT ROWID 테이블)
+# - 설정 지문(KiwiTokenizer.config_key: 사용자 사전 / STOP_TAGS / min_len / kiwipiepy 버전)이
+#   저장된 것과 다르면 열 때 통째로 비운다 → add_user_word 를 바꾸면 자동 무효화
+# - max_entries 를 넘으면 가장 오래 안 쓴 것부터 지움 (close/flush 때)
+#
+#   tk = CachedTokenizer(KiwiTokenizer(), "../data/token_cache.sqlite")
+#   for d, tokens in tk.stream(iter_post_texts(posts)): ...
+#   tk.close()
+class TokenCache:
+    def __init__(self, path: str, config_key: str, max_entries: int = 2_000_000):
+        self.path = path
+        self.config_key = config_key
+        self.max_entries = max_entries
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS meta (k TEXT PRIMARY KEY, v TEXT NOT NULL);
+            CREATE TABLE IF NOT EXISTS tokens (
+                h    BLOB PRIMARY KEY,
+                toks TEXT NOT NULL,
+                used INTEGER NOT NULL
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS tokens_used ON tokens (used);
+        """)
+        row = self.conn.execute("SELECT v FROM meta WHERE k='config'").fetchone()
+        if row is None or row[0] != config_key:
+            self.conn.execute("DELETE FROM tokens")
+            self.conn.execute("INSERT OR REPLACE INTO meta VALUES ('config', ?)", (config_key,))
+        self.conn.commit()
+        self._prefix = config_key.encode("utf-8")
+        self._clock = (self.conn.execute("SELECT MAX(used) FROM tokens").fetchone()[0] or 0) + 1
+        # 행 수는 열 때 한 번만 세고 이후 넣기/지우기로 맞춤 (flush 마다 COUNT(*) 안 함)
+        self._count = self.conn.execute("SELECT COUNT(*) FROM tokens").fetchone()[0]
+        self._touched = set()
+        self.hits = self.misses = 0
+
+    def close(self):
+        self.flush()
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self._count
+
+    def key(self, normalized: str) -> bytes:
+        return hashlib.blake2b(self._prefix + normalized.encode("utf-8"), digest_size=16).digest()
+
+    # 키 목록 → {키: 토큰 리스트} (없는 키는 빠짐)
+    def get_many(self, keys) -> dict:
+        keys = list(keys)
+        out = {}
+        for i in range(0, len(keys), _IN_CHUNK):
+            part = keys[i:i + _IN_CHUNK]
+            q = f"SELECT h, toks FROM tokens WHERE h IN ({','.join('?' * len(part))})"
+            for h, toks in self.conn.execute(q, part):
+                out[h] = toks.split(_SEP) if toks else []
+        self._touched.update(out)
+        return out
+
+    # 새 키만 행 수에 더함. 이미 있던 키는 토큰만 덮어씀
+    def put_many(self, items):
+        rows = [(h, _SEP.join(toks), self._clock) for h, toks in items]
+        before = self.conn.total_changes
+        self.conn.executemany("INSERT OR IGNORE INTO tokens VALUES (?, ?, ?)", rows)
+        added = self.conn.total_changes - before
+        self._count += added
+        if added < len(rows):
+            self.conn.executemany("UPDATE tokens SET toks=?, used=? WHERE h=?",
+                                  ((t, u, h) for h, t, u in rows))
+
+    # 이번에 쓴 키의 사용 시각 갱신 + 초과분 삭제 + 커밋
+    def flush(self):
+        if self._touched:
+            self.conn.executemany("UPDATE tokens SET used=? WHERE h=?",
+                                  ((self._clock, h) for h in self._touched))
+            self._touched.clear()
+        self._clock += 1
+        if self._count > self.max_entries:
+            cur = self.conn.execute("DELETE FROM tokens WHERE h IN "
+                                    "(SELECT h FROM tokens ORDER BY used LIMIT ?)",
+                                    (self._count - self.max_entries,))
+            self._count -= cur.rowcount
+        self.conn.commit()
+
+
+# =========================
+# 캐시를 거치는 토큰화 (KiwiTokenizer 와 같은 tokenize / tokenize_many / stream)
+# =========================
+# 입력을 batch_size 개씩 끊어
+#   정규화 → 해시 → 배치 안 중복 제거 → 캐시 조회 → 없는 것만 Kiwi 배치 분석 → 저장
+# 하고 입력 순서대로 돌려준다.
+class CachedTokenizer:
+    def __init__(self, tokenizer: KiwiTokenizer = None, path: str = ":memory:", max_entries: int = 2_000_000,
+                 batch_size: int = 2000):
+        self.tokenizer = tokenizer or KiwiTokenizer()
+        self.cache = TokenCache(path, self.tokenizer.config_key(), max_entries)
+        self.batch_size = batch_size
+
+    def close(self):
+        self.cache.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def add_user_word(self, word: str, tag: str = "NNP", score: float = 0):
+        self.tokenizer.add_user_word(word, tag, score)
+        self.cache.close()
+        self.cache = TokenCache(self.cache.path, self.tokenizer.config_key(), self.cache.max_entries)
+
+    def _batch(self, texts) -> list:
+        norm = [normalize_repeats(str(t or "")) for t in texts]
+        keys = [self.cache.key(t) for t in norm]
+        found = self.cache.get_many(set(keys))
+
+        todo = {}
+        for k, t in zip(keys, norm):
+            if k not in found and k not in todo:
+                todo[k] = t
+        if todo:
+            new = list(self.tokenizer.tokenize_many(todo.values()))
+            found.update(zip(todo, new))
+            self.cache.put_many(zip(todo, new))
+        self.cache.misses += len(todo)
+        self.cache.hits += len(keys) - len(todo)
+        return [found[k] for k in keys]
+
+    def tokenize(self, text: str) -> list:
+        return self._batch([text])[0]
+
+    def tokenize_many(self, texts):
+        it = iter(texts)
+        while True:
+            chunk = list(itertools.islice(it, self.batch_size))
+            if not chunk:
+                break
+            yield from self._batch(chunk)
+            self.cache.flush()
+
+    def stream(self, pairs):
+        keys = deque()
+
+        def texts():
+            for key, text in pairs:
+                keys.append(key)
+                yield text
+
+        for tokens in self.tokenize_many(texts()):
+            yield keys.popleft(), tokens
@@ -0,0 +1,146 @@
+import hashlib
+import json
+import re
+from collections import Counter, defaultdict, deque
+
+# =========================
+# Kiwi 토큰화 설정 (kiwipiepy.ipynb 와 같은 값)
+# =========================
+USER_WORDS = [
+    ("삼전", "NNP", 0),
+    ("삼성전자", "NNP", 0),
+    ("하닉", "NNP", 0),
+    ("하이닉스", "NNP", 0),
+]
+
+STOP_TAGS = frozenset({
+    "JKS", "JKC", "JKG", "JKO", "JKB", "JKV", "JKQ", "JX", "JC",
+    "EP", "EF", "EC", "ETN", "ETM",
+    "SF", "SP", "SS", "SE", "SO", "SW",
+})
+
+# 반복 문자 → (이 개수 이상이면, 이 개수로 줄임)
+REPEAT_RULES = {"ㅋ": (5, 4), "ㅎ": (5, 4), "ㅠ": (3, 2), "ㅜ": (3, 2)}
+_REPEAT_RE = re.compile("|".join(f"{c}{{{n},}}" for c, (n, _) in REPEAT_RULES.items()))
+_REPEAT_TO = {c: c * keep for c, (_, keep) in REPEAT_RULES.items()}
+
+
+# notebook 의 re.sub 4번과 같은 결과를 정규식 한 번으로
+# (한 문자의 반복을 줄여도 다른 문자의 반복이 새로 생기지 않으므로 순서 무관)
+def normalize_repeats(s: str) -> str:
+    return _REPEAT_RE.sub(lambda m: _REPEAT_TO[m.group()[0]], s)
+
+
+# num_workers: -1 = 전체 코어, None = Kiwi 기본값 (notebook 의 Kiwi())
+def build_kiwi(user_words=USER_WORDS, num_workers: int = -1):
+    from kiwipiepy import Kiwi
+
+    kiwi = Kiwi(num_workers=num_workers)
+    for word, tag, score in user_words:
+        kiwi.add_user_word(word, tag, score)
+    return kiwi
+
+
+# =========================
+# 배치 토큰화
+# =========================
+# notebook 은 댓글마다 kiwi.tokenize(text) 를 불러 한 코어에서 하나씩 분석했다.
+# kiwi.tokenize 에 문자열 iterable 을 넘기면 Kiwi 내부 스레드 풀(num_workers)이 나눠 분석하고
+# 결과는 입력 순서대로 돌려준다. 여기서는
+#   - 반복 문자 정규화 (정규식 1번)
+#   - STOP_TAGS / min_len 미만 토큰 제거
+# 를 결과를 받는 같은 루프에서 처리하고, (날짜, 토큰) 을 스트리밍으로 내보낸다.
+#
+#   tk = KiwiTokenizer()
+#   for d, tokens in tk.stream(iter_post_texts(JsonlDateIndex(path).iter_range("2026-01-01", "2026-01-16"))):
+#       daily[d].update(tokens)
+#
+# kiwi= 로 이미 만든 Kiwi 를 넘길 때는 거기에 넣은 사용자 사전을 user_words= 로 같이 넘겨야 한다
+# (config_key 는 user_words 로 계산하므로, 다르면 토큰 캐시가 옛 결과를 돌려줌)
+class KiwiTokenizer:
+    def __init__(self, kiwi=None, user_words=None, stop_tags=STOP_TAGS, min_len: int = 2,
+                 num_workers: int = -1):
+        if kiwi is not None and user_words is None:
+            raise ValueError("kiwi= 를 넘기면 그 Kiwi 에 넣은 사용자 사전을 user_words= 로 같이 넘겨야 합니다")
+        self.user_words = list(USER_WORDS if user_words is None else user_words)
+        self.stop_tags = frozenset(stop_tags)
+        self.min_len = min_len
+        self.kiwi = kiwi or build_kiwi(self.user_words, num_workers)
+
+    # 사용자 사전은 이걸로 추가해야 config_key 에 반영됨 (토큰 캐시 무효화 기준)
+    def add_user_word(self, word: str, tag: str = "NNP", score: float = 0):
+        self.kiwi.add_user_word(word, tag, score)
+        self.user_words.append((word, tag, score))
+
+    # 토큰 결과를 바꾸는 설정의 지문: 사용자 사전 / STOP_TAGS / min_len / kiwipiepy 버전
+    def config_key(self) -> str:
+        from kiwipiepy import __version__
+
+        cfg = {
+            "user_words": sorted([list(w) for w in self.user_words]),
+            "stop_tags": sorted(self.stop_tags),
+            "min_len": self.min_len,
+            "kiwipiepy": __version__,
+        }
+        return hashlib.sha1(json.dumps(cfg, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+    def _filter(self, tokens) -> list:
+        stop, n = self.stop_tags, self.min_len
+        out = []
+        for t in tokens:
+            if t.tag in stop:
+                continue
+            w = t.form.strip()
+            if len(w) >= n:
+                out.append(w)
+        return out
+
+    def tokenize(self, text: str) -> list:
+        return self._filter(self.kiwi.tokenize(normalize_repeats(str(text or ""))))
+
+    # 텍스트 iterable → 토큰 리스트 제너레이터 (입력 순서 유지)
+    def tokenize_many(self, texts):
+        texts = (normalize_repeats(str(t or "")) for t in texts)
+        # num_workers=0 인 Kiwi 는 배치(비동기) 분석을 못 하므로 하나씩
+        batches = self.kiwi.tokenize(texts) if self.kiwi.num_workers else map(self.kiwi.tokenize, texts)
+        for tokens in batches:
+            yield self._filter(tokens)
+
+    # (key, text) iterable → (key, tokens) 제너레이터
+    # Kiwi 가 입력을 앞서 읽어 가므로 key 는 큐에 쌓아 두고 결과 순서대로 꺼낸다
+    def stream(self, pairs):
+        keys = deque()
+
+        def texts():
+            for key, text in pairs:
+                keys.append(key)
+                yield text
+
+        for tokens in self.tokenize_many(texts()):
+            yield keys.popleft(), tokens
+
+
+# 상세 JSONL 게시글 dict iterable → (날짜, 텍스트)  (제목/본문/댓글, 빈 문자열 제외)
+def iter_post_texts(posts, fields=("title", "content", "comments")):
+    for post in posts:
+        d = str(post.get("date", "")).strip()[:10]
+        if not d:
+            continue
+        for f in fields:
+            if f == "comments":
+                for c in post.get("comments", []) or []:
+                    t = c.get("comment", "") if isinstance(c, dict) else str(c)
+                    if t and str(t).strip():
+                        yield d, t
+            else:
+                t = post.get(f, "")
+                if t and str(t).strip():
+                    yield d, t
+
+
+# (날짜, 토큰) 스트림 → 날짜별 Counter
+def daily_token_counts(stream) -> dict:
+    counters = defaultdict(Counter)
+    for d, tokens in stream:
+        counters[d].update(tokens)
+    return dict(counters)
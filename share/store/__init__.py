@@ -0,0 +1,17 @@
+from .posts import (
+    COUNT_COLUMNS, PARTITION_COLUMNS, SCHEMA, STORE_COLUMNS, PostStore, PostStoreSink,
+    to_store_frame,
+)
+from .posts import HiveStore
+from .comments import (
+    COMMENT_COLUMNS, CommentStore, daily_comment_stats, flatten_comments, like_weight,
+    like_weighted_mean, post_ids, read_comments_jsonl,
+)
+from .analytics import DEFAULT_DB_PATH, TABLES, AnalyticsDB, get_db
+from .merge import merge_parts
+from .clean import clean_posts, parse_counts, parse_kor_dates
+from .oi import (
+    METRICS, OI_WEIGHTS, CausalOI, DailyOI, IncrementalOI, IntWindowStats, RunningStats, causal_oi, compute_oi,
+    daily_counts, write_oi,
+)
+from .sweep import next_day_targets, rank_weights, reweight, sweep_oi, weight_grid, weight_name, weight_vector
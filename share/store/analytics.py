@@ -0,0 +1,250 @@
+import json
+import os
+import sqlite3
+import threading
+from datetime import date, datetime
+
+import pandas as pd
+
+DEFAULT_DB_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "data", "analytics.sqlite")
+
+# 테이블 → (구분 키 컬럼, 날짜 컬럼). 날짜 컬럼 이름은 대시보드가 쓰던 이름 그대로
+#   daily : 일별집계 + z + 과열지수_OI (normalization 노트북 출력)
+#   fng   : 공포-탐욕 지수 (date, fng_index ...)
+#   ohlcv : FinanceDataReader 일봉 (Date, Open, High, Low, Close, Volume, Change)
+TABLES = {
+    "daily": (["community", "stock"], "날짜"),
+    "fng": (["community", "stock"], "date"),
+    "ohlcv": (["ticker"], "Date"),
+}
+
+
+def _q(name: str) -> str:
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _sql_type(s: pd.Series) -> str:
+    if pd.api.types.is_integer_dtype(s) or pd.api.types.is_bool_dtype(s):
+        return "INTEGER"
+    if pd.api.types.is_float_dtype(s):
+        return "REAL"
+    return "TEXT"
+
+
+def _day(d) -> str:
+    return pd.Timestamp(d).strftime("%Y-%m-%d")
+
+
+# =========================
+# 대시보드 공용 분석 DB (SQLite 파일 1개)
+# =========================
+# Streamlit 앱마다 CSV 경로를 따로 들고 캐시가 비면 pd.read_csv + 날짜 필터를 다시 했다.
+# 여기서는 일별집계/OI, 공포-탐욕, OHLCV 를 한 DB 에 넣고
+# (키, 날짜) 기본키 인덱스로 기간 조회만 한다.
+#
+#   db = get_db()                                           # 프로세스당 하나 (앱끼리 공유)
+#   db.sync_csv("../data/hynix_data.csv", "daily", community="FmKorea", stock="SK하이닉스")
+#   df = db.daily("FmKorea", "SK하이닉스", start, end)        # 날짜: datetime64
+#   px = db.ohlcv("000660", start, end)                     # 없으면 FinanceDataReader 로 받아 저장
+#
+# sync_csv 는 파일 수정시각/크기가 바뀐 경우에만 다시 넣는다 → 평소에는 CSV 를 열지 않음.
+# 다시 넣을 때는 그 (table, 키) 행을 지우고 CSV 내용으로 통째로 바꾼다 (한 트랜잭션).
+# 그래서 CSV 파일 하나가 (table, 키) 하나를 맡는다: 다른 CSV 가 이미 맡은 키로 동기화하면 ValueError
+# (맡고 있던 파일이 없어졌으면 새 파일이 넘겨받음).
+# 값 컬럼은 처음 들어올 때 자동으로 추가되고, 어느 키도 안 쓰게 되면 지운다
+# (CSV 마다 z/OI 컬럼 구성이 조금씩 달라서).
+class AnalyticsDB:
+    def __init__(self, path: str = DEFAULT_DB_PATH):
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self.conn.executescript("""
+                CREATE TABLE IF NOT EXISTS sources (
+                    path  TEXT PRIMARY KEY,
+                    tbl   TEXT NOT NULL,
+                    mtime REAL NOT NULL,
+                    size  INTEGER NOT NULL,
+                    imported_at TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS fetched (
+                    ticker TEXT NOT NULL,
+                    start  TEXT NOT NULL,
+                    end    TEXT NOT NULL,
+                    PRIMARY KEY (ticker, start, end)
+                );
+            """)
+            # 예전 DB: sources 에 키 컬럼이 없음
+            if "keys" not in [r[1] for r in self.conn.execute("PRAGMA table_info(sources)")]:
+                self.conn.execute("ALTER TABLE sources ADD COLUMN keys TEXT")
+            for name in TABLES:
+                self._create(name)
+            self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+    # ---------- 스키마 ----------
+    def _create(self, table):
+        keys, dcol = TABLES[table]
+        cols = ", ".join(f"{_q(k)} TEXT NOT NULL" for k in keys + [dcol])
+        pk = ", ".join(_q(k) for k in keys + [dcol])
+        self.conn.execute(f"CREATE TABLE IF NOT EXISTS {table} ({cols}, PRIMARY KEY ({pk})) WITHOUT ROWID")
+
+    def _columns(self, table) -> list:
+        return [r[1] for r in self.conn.execute(f"PRAGMA table_info({table})")]
+
+    # 값이 하나도 안 남은 컬럼 삭제 (SQLite 3.35 미만은 DROP COLUMN 이 없어 그대로 둠)
+    def _prune_columns(self, table, cols):
+        if sqlite3.sqlite_version_info < (3, 35, 0):
+            return
+        for c in cols:
+            if self.conn.execute(f"SELECT 1 FROM {table} WHERE {_q(c)} IS NOT NULL LIMIT 1").fetchone() is None:
+                self.conn.execute(f"ALTER TABLE {table} DROP COLUMN {_q(c)}")
+
+    # ---------- 쓰기 ----------
+    # df: 날짜 컬럼 + 값 컬럼들. keys: community/stock 또는 ticker
+    # replace=True 면 그 키의 기존 행을 지우고 df 로 바꿈 (df 에 없는 날짜/컬럼은 남지 않음)
+    def upsert(self, table: str, df: pd.DataFrame, replace=False, **keys) -> int:
+        with self._lock:
+            n = self._upsert(table, df, replace, keys)
+            self.conn.commit()
+        return n
+
+    # 커밋하지 않음 (호출하는 쪽이 _lock 을 잡고 한 트랜잭션으로 묶음)
+    def _upsert(self, table: str, df: pd.DataFrame, replace: bool, keys: dict) -> int:
+        key_cols, dcol = TABLES[table]
+        df = df.copy()
+        if dcol not in df.columns:
+            raise KeyError(f"{table}: '{dcol}' 컬럼이 없습니다 (있는 컬럼: {list(df.columns)})")
+        df[dcol] = pd.to_datetime(df[dcol], errors="coerce")
+        df = df.dropna(subset=[dcol])
+        df[dcol] = df[dcol].dt.strftime("%Y-%m-%d")
+        for k in key_cols:
+            df[k] = str(keys[k])
+        df = df.drop_duplicates(subset=key_cols + [dcol], keep="last")
+
+        have = self._columns(table)
+        for c in df.columns:
+            if c not in have:
+                self.conn.execute(f"ALTER TABLE {table} ADD COLUMN {_q(c)} {_sql_type(df[c])}")
+        if replace:
+            self.conn.execute(f"DELETE FROM {table} WHERE " + " AND ".join(f"{_q(k)}=?" for k in key_cols),
+                              [str(keys[k]) for k in key_cols])
+
+        cols = list(df.columns)
+        pk = key_cols + [dcol]
+        vals = [c for c in cols if c not in pk]
+        sql = (f"INSERT INTO {table} ({', '.join(map(_q, cols))}) VALUES ({', '.join('?' * len(cols))})"
+               f" ON CONFLICT ({', '.join(map(_q, pk))}) DO ")
+        sql += ("UPDATE SET " + ", ".join(f"{_q(c)}=excluded.{_q(c)}" for c in vals)) if vals else "NOTHING"
+        rows = df.astype(object).where(df.notna(), None).itertuples(index=False, name=None)
+        self.conn.executemany(sql, rows)
+        if replace:
+            self._prune_columns(table, [c for c in have if c not in pk and c not in cols])
+        return len(df)
+
+    # CSV 가 바뀌었을 때만 (table, 키) 를 CSV 내용으로 바꿈 → 넣었으면 True
+    def sync_csv(self, path: str, table: str, rename: dict = None, **keys) -> bool:
+        st = os.stat(path)
+        key = os.path.realpath(path)
+        owner_keys = json.dumps({k: str(keys[k]) for k in TABLES[table][0]}, ensure_ascii=False, sort_keys=True)
+        with self._lock:
+            row = self.conn.execute("SELECT mtime, size, keys FROM sources WHERE path=?", (key,)).fetchone()
+            owners = [p for (p,) in self.conn.execute(
+                "SELECT path FROM sources WHERE tbl=? AND keys=? AND path<>?", (table, owner_keys, key))]
+        if row is not None and row[0] == st.st_mtime and row[1] == st.st_size and row[2] == owner_keys:
+            return False
+        owners = [p for p in owners if os.path.exists(p)]
+        if owners:
+            raise ValueError(f"{table} {owner_keys} 는 이미 {owners[0]} 에서 동기화한 키입니다 "
+                             f"({path} 에는 다른 키를 쓰세요)")
+
+        try:
+            df = pd.read_csv(path, encoding="utf-8-sig")
+        except UnicodeDecodeError:
+            df = pd.read_csv(path, encoding="cp949")
+        if rename:
+            df = df.rename(columns=rename)
+        with self._lock:
+            try:
+                # 같은 키를 맡던 (없어진) 파일 기록은 정리
+                self.conn.execute("DELETE FROM sources WHERE tbl=? AND keys=? AND path<>?", (table, owner_keys, key))
+                self._upsert(table, df, True, keys)
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO sources(path, tbl, mtime, size, imported_at, keys) VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, table, st.st_mtime, st.st_size, datetime.now().isoformat(timespec="seconds"), owner_keys),
+                )
+                self.conn.commit()
+            except Exception:
+                self.conn.rollback()
+                raise
+        return True
+
+    # ---------- 조회 ----------
+    def query(self, table: str, start=None, end=None, columns=None, **keys) -> pd.DataFrame:
+        key_cols, dcol = TABLES[table]
+        where, args = [], []
+        for k in key_cols:
+            if k in keys:
+                where.append(f"{_q(k)}=?")
+                args.append(str(keys[k]))
+        if start is not None:
+            where.append(f"{_q(dcol)}>=?")
+            args.append(_day(start))
+        if end is not None:
+            where.append(f"{_q(dcol)}<=?")
+            args.append(_day(end))
+
+        sel = "*" if columns is None else ", ".join(map(_q, [dcol] + [c for c in columns if c != dcol]))
+        sql = f"SELECT {sel} FROM {table}"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += f" ORDER BY {_q(dcol)}"
+        with self._lock:
+            cur = self.conn.execute(sql, args)
+            names = [d[0] for d in cur.description]
+            df = pd.DataFrame(cur.fetchall(), columns=names)
+        df[dcol] = pd.to_datetime(df[dcol])
+        return df.drop(columns=[k for k in key_cols if k in df.columns and k in keys])
+
+    def daily(self, community: str, stock: str, start=None, end=None, columns=None) -> pd.DataFrame:
+        return self.query("daily", start, end, columns, community=community, stock=stock)
+
+    def fng(self, community: str, stock: str, start=None, end=None, columns=None) -> pd.DataFrame:
+        return self.query("fng", start, end, columns, community=community, stock=stock)
+
+    # fetch=True: 요청 구간을 받아 둔 적이 없으면 FinanceDataReader 로 받아서 저장
+    def ohlcv(self, ticker: str, start, end, fetch=True) -> pd.DataFrame:
+        s, e = _day(start), _day(end)
+        if fetch:
+            with self._lock:
+                hit = self.conn.execute(
+                    "SELECT 1 FROM fetched WHERE ticker=? AND start<=? AND end>=? LIMIT 1", (ticker, s, e)
+                ).fetchone()
+            if hit is None:
+                import FinanceDataReader as fdr
+
+                px = fdr.DataReader(ticker, s, e).reset_index()
+                self.upsert("ohlcv", px, ticker=ticker)
+                # 오늘이 들어간 구간은 장중 값일 수 있으므로 받은 기록을 남기지 않음
+                if e < date.today().isoformat():
+                    with self._lock:
+                        self.conn.execute("INSERT OR IGNORE INTO fetched VALUES (?, ?, ?)", (ticker, s, e))
+                        self.conn.commit()
+        return self.query("ohlcv", s, e, ticker=ticker)
+
+
+_DBS = {}
+_DBS_LOCK = threading.Lock()
+
+
+# 같은 경로면 같은 객체 (한 프로세스 안의 Streamlit 세션/앱이 연결 하나를 공유)
+def get_db(path: str = DEFAULT_DB_PATH) -> AnalyticsDB:
+    key = os.path.abspath(path) if path != ":memory:" else path
+    with _DBS_LOCK:
+        if key not in _DBS:
+            _DBS[key] = AnalyticsDB(path)
+        return _DBS[key]
@@ -0,0 +1,186 @@
+import argparse
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from .clean import parse_counts, parse_kor_dates
+from .oi import METRICS, OI_COLUMN, OI_WEIGHTS, Z_COLUMNS, CausalOI, DailyOI
+from .sweep import next_day_targets, rank_weights, reweight, weight_grid
+
+
+# =========================
+# 벤치마크/검증: 집계·지표 계산
+# =========================
+#   python -m share.store.bench causal --days 730 --window 60
+#   python -m share.store.bench sweep --days 366 --step 0.02
+#   python -m share.store.bench clean --rows 10000000 --baseline-rows 300000
+def _daily(days, seed=0, start="2024-01-01"):
+    rng = np.random.default_rng(seed)
+    base = rng.gamma(2.0, 50, days)
+    df = pd.DataFrame({
+        "날짜": pd.date_range(start, periods=days, freq="D").strftime("%Y-%m-%d"),
+        "게시글수": rng.poisson(base),
+        "조회수": rng.poisson(base * 400),
+        "댓글수": rng.poisson(base * 8),
+        "좋아요수": rng.poisson(base * 2),
+    })
+    df.loc[rng.random(days) < 0.05, METRICS] = 0      # 글 없는 날
+    return df
+
+
+# 날짜마다 그날까지의 창을 잘라 notebook zscore 를 그대로 다시 계산 (O(days × window))
+def naive_causal_oi(daily: pd.DataFrame, window=None, weights=None, min_periods=2) -> pd.DataFrame:
+    weights = weights or OI_WEIGHTS
+    out = daily[["날짜"] + METRICS].reset_index(drop=True).copy()
+    for zc in Z_COLUMNS:
+        out[zc] = 0.0
+    for t in range(len(out)):
+        lo = 0 if window is None else max(0, t - window + 1)
+        if t - lo + 1 < min_periods:
+            continue
+        for zc in Z_COLUMNS:
+            s = out[zc[:-2]].iloc[lo:t + 1].astype("float64")
+            sd = s.std(ddof=1)
+            out.loc[t, zc] = 0.0 if sd == 0 or np.isnan(sd) else (s.iloc[-1] - s.mean()) / sd
+    out[OI_COLUMN] = sum(weights[zc[:-2]] * out[zc] for zc in Z_COLUMNS)
+    return out
+
+
+def bench_causal(days=730, window=60):
+    daily = _daily(days)
+    for w in (window, None):
+        t0 = time.perf_counter()
+        naive = naive_causal_oi(daily, w)
+        t_naive = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        got = CausalOI(w).run(daily)
+        t_run = time.perf_counter() - t0
+
+        # 앞 절반은 run, 나머지는 하루씩 push (상태 저장/복원 포함) → 같은 결과여야 함
+        half = days // 2
+        cz = CausalOI(w)
+        head = cz.run(daily.iloc[:half])
+        cz = CausalOI.from_dict(cz.to_dict())
+        tail = [cz.push(d, r) for d, r in zip(daily["날짜"].iloc[half:],
+                                              daily[METRICS].iloc[half:].to_dict("records"))]
+        live = pd.concat([head, pd.DataFrame(tail)], ignore_index=True)
+
+        for col in Z_COLUMNS + [OI_COLUMN]:
+            assert np.allclose(got[col], naive[col], rtol=1e-9, atol=1e-9), col
+            assert np.allclose(live[col], naive[col], rtol=1e-9, atol=1e-9), col
+        label = "expanding" if w is None else f"rolling {w}"
+        print(f"{days}일 / {label:<11}  naive {t_naive * 1000:8.1f}ms  causal {t_run * 1000:7.1f}ms"
+              f"  ({days / t_run:,.0f} days/s)  일치")
+
+
+def bench_sweep(days=366, step=0.02):
+    daily = _daily(days, start="2025-01-14")
+    oi = DailyOI()
+    oi.add_counts(daily.assign(날짜=pd.to_datetime(daily["날짜"])).set_index("날짜"))
+    daily = oi.frame()
+
+    # 거래량이 전날 댓글수를 조금 따라가는 가짜 시세 (거래일만)
+    rng = np.random.default_rng(1)
+    bdays = pd.bdate_range(daily["날짜"].iloc[0], periods=days * 5 // 7 + 5)
+    c = daily.set_index(pd.to_datetime(daily["날짜"]))["댓글수"].reindex(bdays - pd.Timedelta(days=1)).fillna(0)
+    ohlcv = pd.DataFrame({
+        "Date": bdays,
+        "Close": 50000 * np.exp(np.cumsum(rng.normal(0, 0.02, len(bdays)))),
+        "Volume": (1e6 * np.exp(rng.normal(0, 0.3, len(bdays)) + c.to_numpy() / c.mean())).astype("int64"),
+    })
+
+    W = weight_grid(step)
+    t0 = time.perf_counter()
+    rank = rank_weights(daily, ohlcv, W)
+    sec = time.perf_counter() - t0
+
+    # 1등 가중치를 하나만 다시 계산해 pandas corr 와 비교
+    top = rank.iloc[0]
+    w = top[[f"w_{m}" for m in ["조회수", "게시글수", "댓글수", "좋아요수"]]].to_numpy("float64")
+    tgt = next_day_targets(daily["날짜"], ohlcv)
+    one = reweight(daily, w)[OI_COLUMN]
+    assert np.isclose(one.corr(tgt["next_volume"]), top["corr_next_volume"])
+    assert np.isclose(one.corr(tgt["next_return"]), top["corr_next_return"])
+
+    print(f"{days}일 / 가중치 {len(W):,}개 (step {step})  {sec * 1000:.1f}ms  ({len(W) / sec:,.0f} weightings/s)")
+    print(rank.head(5).round(3).to_string(index=False))
+
+
+# 문자열 정제: 값 하나씩(노트북 to_int_series + parse_date_kor) vs 컬럼 단위(clean.py)
+def _clean_sample(rows: int, now: datetime, seed=0):
+    rng = np.random.default_rng(seed)
+    n_abs = 800
+    pool = (
+        [f"{h:02d}:{m:02d}" for h in range(24) for m in range(0, 60, 7)]
+        + [f"{k}분" for k in range(1, 60)] + [f"{k}시간" for k in range(1, 24)] + ["어제"]
+        + [f"{k}일" for k in range(2, 7)]
+        + [(now - pd.Timedelta(days=int(d))).strftime("%y.%m.%d") for d in range(n_abs)]
+        + [(now - pd.Timedelta(days=int(d))).strftime("%Y.%m.%d") for d in range(n_abs)]
+        + [(now - pd.Timedelta(days=int(d))).strftime("%m.%d") for d in range(1, 200)]
+    )
+    dates = np.asarray(pool, dtype=object)[rng.integers(0, len(pool), rows)]
+    v = rng.integers(0, 200_000, rows)
+    counts = pd.Series(v).map("{:,}".format).to_numpy(dtype=object)
+    counts[::3] = pd.Series(v[::3]).map("조회 수 {:,}".format).to_numpy(dtype=object)
+    return pd.DataFrame({"날짜": dates, "조회": counts})
+
+
+def bench_clean(rows=10_000_000, baseline_rows=300_000):
+    from share.crawler.blind import parse_date_kor
+
+    now = datetime(2026, 1, 14, 23, 59)
+    df = _clean_sample(rows, now)
+    base = df.iloc[:baseline_rows]
+
+    # 기존: 노트북 to_int_series + 행마다 parse_date_kor
+    t0 = time.perf_counter()
+    s = base["조회"].astype(str).str.replace(",", "", regex=False)
+    old_counts = s.str.extract(r"(\d+)")[0].fillna("0").astype(int).to_numpy()
+    t_old_c = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    old_dates = base["날짜"].map(lambda x: parse_date_kor(x, now))
+    t_old_d = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    new_counts = parse_counts(df["조회"])
+    t_new_c = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    new_dates = parse_kor_dates(df["날짜"], now)
+    t_new_d = time.perf_counter() - t0
+
+    assert (new_counts[:baseline_rows] == old_counts).all()
+    # parse_date_kor 는 "HH:MM" 을 모르므로(Blind 표기에 없음) 그 행은 비교에서 뺌
+    hm = base["날짜"].str.contains(":").to_numpy()
+    exp = pd.to_datetime(old_dates[~hm])
+    got = new_dates[:baseline_rows][~hm]
+    assert (exp.to_numpy("datetime64[s]") == got.to_numpy("datetime64[s]")).all()
+
+    print(f"행 {rows:,}개 (기존 방식은 앞 {baseline_rows:,}개로 측정)")
+    print(f"  조회수 기존 {baseline_rows / t_old_c:14,.0f} rows/s")
+    print(f"  조회수 신규 {rows / t_new_c:14,.0f} rows/s  ({t_new_c:.2f}s)")
+    print(f"  날짜   기존 {baseline_rows / t_old_d:14,.0f} rows/s")
+    print(f"  날짜   신규 {rows / t_new_d:14,.0f} rows/s  ({t_new_d:.2f}s)")
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("what", nargs="?", default="all", choices=["all", "causal", "sweep", "clean"])
+    ap.add_argument("--days", type=int, default=730)
+    ap.add_argument("--window", type=int, default=60)
+    ap.add_argument("--step", type=float, default=0.02)
+    ap.add_argument("--rows", type=int, default=10_000_000)
+    ap.add_argument("--baseline-rows", type=int, default=300_000)
+    args = ap.parse_args()
+    if args.what in ("all", "causal"):
+        bench_causal(args.days, args.window)
+    if args.what in ("all", "sweep"):
+        bench_sweep(args.days, args.step)
+    if args.what in ("all", "clean"):
+        bench_clean(args.rows, args.baseline_rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+import os
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+# =========================
+# 원본 문자열 → 숫자/날짜 (컬럼 단위 정제)
+# =========================
+# 노트북/크롤러의 정제는 값 하나씩 처리했다.
+#   to_int_series : astype(str) → str.replace → str.extract (행마다 파이썬 문자열 연산)
+#   parse_date_kor / normalize_date / parse_gall_date : 행마다 정규식 + strptime
+#
+# 조회수·날짜 문자열은 행 수에 비해 서로 다른 값이 훨씬 적다
+# ("17:27" 은 하루 1440개, 날짜는 수백 개, 조회수도 수만 개 수준).
+# 그래서 pd.factorize 로 고유값만 뽑아 한 번씩 해석하고, 결과는 코드 배열로 되돌려 붙인다.
+# 상대 시각("3시간", "어제")은 고유값 단계에서 (종류, 오프셋)만 정해 두고
+# 행별 수집 시각(crawled_at)과는 numpy 배열 연산으로 합친다.
+
+# 날짜 문자열 종류
+_NA, _ABS, _AGO, _TOD, _MD = 0, 1, 2, 3, 4
+
+_RE_FULL = r"^(\d{4})[.\-/](\d{1,2})[.\-/](\d{1,2})(?:[\sT]+(\d{1,2}):(\d{2})(?::(\d{2}))?)?$"
+_RE_YY = r"^(\d{2})\.(\d{1,2})\.(\d{1,2})$"
+_RE_MD = r"^(\d{1,2})\.(\d{1,2})$"
+_RE_HM = r"^(\d{1,2}):(\d{2})$"
+_RE_AGO = r"^(\d+)\s*(분|시간|일)"
+_WORD_DAYS = {"방금": 0, "방금 전": 0, "오늘": 0, "어제": 1, "그제": 2, "그저께": 2}
+_UNIT_SEC = {"분": 60, "시간": 3600, "일": 86400}
+
+
+# "15,720" / "조회 수 1,234" / 15720 / "-" / NaN → int64 (숫자가 없으면 0)
+# 쉼표를 지운 뒤 첫 번째 숫자 묶음 (노트북 to_int_series 와 같은 규칙)
+def parse_counts(s: pd.Series) -> np.ndarray:
+    if pd.api.types.is_numeric_dtype(s):
+        return s.fillna(0).to_numpy(dtype="int64")
+    codes, uniques = pd.factorize(s, use_na_sentinel=True)
+    u = pd.Series(uniques, dtype=object).astype(str).str.replace(",", "", regex=False)
+    # 대부분 "15720" 꼴이라 바로 정수 변환, 나머지("조회 수 1234", "-")만 정규식
+    vals = np.zeros(len(u), dtype="int64")
+    digit = u.str.isdigit().to_numpy(dtype=bool)
+    vals[digit] = u[digit].astype("int64").to_numpy()
+    if not digit.all():
+        rest = u[~digit].str.extract(r"(\d+)", expand=False)
+        vals[~digit] = pd.to_numeric(rest, errors="coerce").fillna(0).to_numpy("int64")
+    # 코드 -1(NaN) 은 끝에 붙인 0 을 가리키게 됨
+    return np.append(vals, 0)[codes]
+
+
+# 고유 날짜 문자열 → (종류, 값) 배열
+#   _ABS: epoch 초 / _AGO: 기준 시각에서 뺄 초 / _TOD: 기준 날짜 0시부터의 초 / _MD: 월*100+일
+def _classify(uniques: pd.Series):
+    t = uniques.astype(str).str.replace("작성시간", "", regex=False).str.strip(" .\n\t")
+    kind = np.full(len(t), _NA, dtype="int8")
+    val = np.zeros(len(t), dtype="int64")
+
+    full = t.str.extract(_RE_FULL)
+    m = full[0].notna().to_numpy()
+    if m.any():
+        f = full[m].fillna(0).astype(int)
+        ts = pd.to_datetime(dict(year=f[0], month=f[1], day=f[2], hour=f[3], minute=f[4], second=f[5]),
+                            errors="coerce")
+        ok = ts.notna().to_numpy()
+        idx = np.flatnonzero(m)[ok]
+        kind[idx] = _ABS
+        val[idx] = ts[ok].to_numpy("datetime64[s]").astype("int64")
+
+    yy = t.str.extract(_RE_YY)
+    m = yy[0].notna().to_numpy() & (kind == _NA)
+    if m.any():
+        f = yy[m].astype(int)
+        ts = pd.to_datetime(dict(year=2000 + f[0], month=f[1], day=f[2]), errors="coerce")
+        ok = ts.notna().to_numpy()
+        idx = np.flatnonzero(m)[ok]
+        kind[idx] = _ABS
+        val[idx] = ts[ok].to_numpy("datetime64[s]").astype("int64")
+
+    md = t.str.extract(_RE_MD)
+    m = md[0].notna().to_numpy() & (kind == _NA)
+    if m.any():
+        f = md[m].astype(int)
+        kind[m] = _MD
+        val[m] = (f[0] * 100 + f[1]).to_numpy()
+
+    hm = t.str.extract(_RE_HM)
+    m = hm[0].notna().to_numpy() & (kind == _NA)
+    if m.any():
+        f = hm[m].astype(int)
+        kind[m] = _TOD
+        val[m] = (f[0] * 3600 + f[1] * 60).to_numpy()
+
+    ago = t.str.extract(_RE_AGO)
+    m = ago[0].notna().to_numpy() & (kind == _NA)
+    if m.any():
+        kind[m] = _AGO
+        val[m] = ago[0][m].astype("int64").to_numpy() * ago[1][m].map(_UNIT_SEC).to_numpy("int64")
+
+    words = t.map(_WORD_DAYS)
+    m = words.notna().to_numpy() & (kind == _NA)
+    if m.any():
+        kind[m] = _AGO
+        val[m] = words[m].astype("int64").to_numpy() * 86400
+
+    return kind, val
+
+
+# 한국어 상대/절대 날짜 문자열 → datetime64[s] (해석 못 하면 NaT)
+#   "17:27"                   → 수집일 17:27
+#   "5분", "3시간 전", "2일"  → 수집 시각 - 그만큼
+#   "방금", "어제", "그제"    → 수집 시각 - 0/1/2일
+#   "2025.01.14", "2025-01-14 11:07", "2025-01-14T11:07:00" → 그대로
+#   "25.01.14"                → 2025-01-14
+#   "01.14"                   → 수집 연도 (수집일보다 뒤면 전년도)
+# crawled_at: 기준 시각 하나 또는 행별 수집 시각 (Series/배열), 없으면 지금
+# 이미 datetime 컬럼이면 초 단위로만 바꿔 돌려줌
+def parse_kor_dates(s: pd.Series, crawled_at=None) -> pd.Series:
+    if pd.api.types.is_datetime64_any_dtype(s):
+        if getattr(s.dt, "tz", None) is not None:
+            s = s.dt.tz_localize(None)
+        return s.astype("datetime64[s]")
+    codes, uniques = pd.factorize(s, use_na_sentinel=True)
+    kind_u, val_u = _classify(pd.Series(uniques, dtype=object))
+    kind = np.append(kind_u, _NA)[codes]
+    val = np.append(val_u, 0)[codes]
+
+    if crawled_at is None:
+        crawled_at = datetime.now()
+    ref = np.asarray(pd.to_datetime(crawled_at), dtype="datetime64[s]").astype("int64")
+    ref = np.broadcast_to(ref, kind.shape)
+    ref_day = ref - ref % 86400
+
+    out = np.zeros(len(kind), dtype="int64")
+    out[kind == _ABS] = val[kind == _ABS]
+    m = kind == _AGO
+    out[m] = ref[m] - val[m]
+    m = kind == _TOD
+    out[m] = ref_day[m] + val[m]
+
+    m = kind == _MD
+    if m.any():
+        ref_dt = pd.DatetimeIndex(ref[m].astype("datetime64[s]"))
+        year = ref_dt.year.to_numpy()
+        month, day = val[m] // 100, val[m] % 100
+        ts = pd.to_datetime(dict(year=year, month=month, day=day), errors="coerce")
+        later = (ts > ref_dt.normalize()).to_numpy()
+        if later.any():
+            ts = ts.where(~later, pd.to_datetime(dict(year=year - 1, month=month, day=day), errors="coerce"))
+        out[m] = ts.to_numpy("datetime64[s]").astype("int64")
+        kind[np.flatnonzero(m)[ts.isna().to_numpy()]] = _NA
+
+    res = out.astype("datetime64[s]")
+    res[kind == _NA] = np.datetime64("NaT")
+    return pd.Series(res, index=s.index, name=s.name)
+
+
+# 저장해 둔 크롤 결과 파일의 수집 시각 = 파일 수정 시각 (로컬 시각, "17:27" 같은 표기와 같은 기준)
+def file_crawled_at(path: str) -> datetime:
+    return datetime.fromtimestamp(int(os.path.getmtime(path)))
+
+
+# 게시글 프레임의 조회/추천/댓글수, 날짜 컬럼을 한 번에 정제 (원본 컬럼을 덮어씀)
+#   df = clean_posts(df_dc, date_col="date", count_cols=["view_count", "recommend_count"],
+#                    crawled_at=datetime(2026, 1, 14, 23, 59))
+def clean_posts(df: pd.DataFrame, date_col="날짜", count_cols=("조회", "추천", "댓글수"),
+                crawled_at=None, count_dtype="int32") -> pd.DataFrame:
+    df = df.copy()
+    for c in count_cols:
+        if c in df.columns:
+            df[c] = parse_counts(df[c]).astype(count_dtype)
+    if date_col in df.columns:
+        if isinstance(crawled_at, str) and crawled_at in df.columns:
+            crawled_at = df[crawled_at]
+        df[date_col] = parse_kor_dates(df[date_col], crawled_at)
+    return df
@@ -0,0 +1,121 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from .clean import file_crawled_at, parse_kor_dates
+from .posts import HiveStore
+
+# =========================
+# 댓글 테이블 (게시글 1 : 댓글 N 을 펼친 형태)
+# =========================
+# 상세 JSONL 은 댓글이 게시글 안에 post["comments"] = [{nickname, comment, like}, ...] 로 들어 있어서
+# 댓글만 보려 해도 게시글 전체를 json.loads 하고 중첩 리스트를 돌아야 했다.
+# 여기서는 댓글 한 개 = 한 행으로 펼쳐 두고 post_id 로 게시글과 연결한다.
+# - post_id    : post_url 끝의 숫자 (FmKorea 문서 번호), int64
+# - comment_no : 게시글 안에서 댓글 순서 (0부터)
+# - date       : 게시글 날짜 (댓글 자체 시각은 수집하지 않음)
+COMMENT_COLUMNS = ["post_id", "comment_no", "date", "nickname", "comment", "like"]
+
+COMMENT_SCHEMA = pa.schema([
+    ("post_id", pa.int64()),
+    ("comment_no", pa.int32()),
+    ("nickname", pa.string()),
+    ("comment", pa.string()),
+    ("like", pa.int32()),
+])
+
+
+def post_ids(post_urls: pd.Series) -> pd.Series:
+    return pd.to_numeric(post_urls.astype(str).str.extract(r"(\d+)\D*$")[0], errors="coerce").astype("Int64")
+
+
+# 게시글 DataFrame(comments 열 = 댓글 dict 리스트) → 댓글 DataFrame
+# 반복문 대신 explode 한 번 + 레코드 → 열 변환
+# 글 날짜는 clean.parse_kor_dates (상대 표기는 crawled_at 기준)
+def flatten_comments(posts: pd.DataFrame, crawled_at=None) -> pd.DataFrame:
+    if posts.empty or "comments" not in posts.columns:
+        return pd.DataFrame(columns=COMMENT_COLUMNS)
+
+    # 같은 글이 JSONL 에 두 번 들어 있으면 (재수집) 마지막 것만 → comment_no 가 이어서 늘지 않게
+    posts = posts.drop_duplicates("post_url", keep="last")
+    p = pd.DataFrame({
+        "post_id": post_ids(posts["post_url"]),
+        "date": parse_kor_dates(posts["date"], crawled_at).dt.strftime("%Y-%m-%d"),
+        "comments": posts["comments"],
+    })
+    # 날짜가 비었거나 URL 에 번호가 없는 글은 키가 NA → groupby 전에 제외
+    p = p.dropna(subset=["post_id", "date"])
+    p = p[p["comments"].map(lambda c: isinstance(c, list) and len(c) > 0)]
+    if p.empty:
+        return pd.DataFrame(columns=COMMENT_COLUMNS)
+
+    ex = p.explode("comments", ignore_index=True)
+    ex["comment_no"] = ex.groupby(["post_id", "date"], sort=False).cumcount().astype("int32")
+    items = pd.DataFrame.from_records(
+        [c if isinstance(c, dict) else {"comment": str(c)} for c in ex["comments"]])
+    for c in ["nickname", "comment"]:
+        ex[c] = items[c].fillna("").astype(str) if c in items else ""
+    like = items["like"] if "like" in items else pd.Series(0, index=ex.index)
+    ex["like"] = pd.to_numeric(like, errors="coerce").fillna(0).astype("int32")
+    return ex[COMMENT_COLUMNS]
+
+
+# crawled_at 을 안 주면 파일 수정 시각 기준
+def read_comments_jsonl(jsonl_path: str, crawled_at=None) -> pd.DataFrame:
+    with open(jsonl_path, encoding="utf-8") as f:
+        posts = [json.loads(line) for line in f if line.strip()]
+    return flatten_comments(pd.DataFrame(posts), crawled_at or file_crawled_at(jsonl_path))
+
+
+# =========================
+# 댓글 저장소 (게시글 저장소와 같은 community/stock/date 파티션)
+# =========================
+#   cstore = CommentStore("../data/comments")
+#   cstore.import_jsonl("../data/fmkorea_hynix_hot_posts.jsonl", "fmkorea", "하이닉스")
+#   cm = cstore.read("fmkorea", "하이닉스", start="2025-11-01", end="2025-11-30")
+#   daily = daily_comment_stats(cm)
+class CommentStore(HiveStore):
+    schema = COMMENT_SCHEMA
+    columns = [c for c in COMMENT_COLUMNS if c != "date"]
+    key = ["post_id", "comment_no"]
+
+    def write(self, comments: pd.DataFrame, community: str, stock: str) -> int:
+        return self._write_partitions(comments, community, stock)
+
+    def import_jsonl(self, jsonl_path: str, community: str, stock: str, crawled_at=None) -> int:
+        return self.write(read_comments_jsonl(jsonl_path, crawled_at), community, stock)
+
+
+# =========================
+# 댓글 단위 집계 (group-by)
+# =========================
+# 좋아요 가중치: 1 + log(1 + like)  (ai.ipynb 의 like_weight 와 같은 식)
+def like_weight(like) -> np.ndarray:
+    return 1.0 + np.log1p(np.maximum(np.asarray(like, dtype="float64"), 0))
+
+
+# 날짜별 댓글수 / 댓글 달린 게시글수 / 좋아요 합 / 가중치 합
+def daily_comment_stats(comments: pd.DataFrame) -> pd.DataFrame:
+    c = comments.assign(w=like_weight(comments["like"]))
+    return (
+        c.groupby("date", as_index=False)
+         .agg(댓글수=("comment", "size"), 댓글게시글수=("post_id", "nunique"),
+              좋아요합=("like", "sum"), 가중치합=("w", "sum"))
+    )
+
+
+# 댓글별 점수 열(score_cols: 예) negative/neutral/positive 확률)을 좋아요 가중 평균
+# by 별로 sum(w * score) / sum(w)
+def like_weighted_mean(comments: pd.DataFrame, score_cols, by="date") -> pd.DataFrame:
+    score_cols = list(score_cols)
+    w = like_weight(comments["like"])
+    wx = comments[score_cols].to_numpy(dtype="float64") * w[:, None]
+    tmp = pd.DataFrame(wx, columns=score_cols, index=comments.index)
+    tmp["_w"] = w
+    keys = [comments[b] for b in ([by] if isinstance(by, str) else by)]
+    g = tmp.groupby(keys).sum()
+    out = g[score_cols].div(g["_w"], axis=0)
+    out["가중치합"] = g["_w"]
+    return out.reset_index()
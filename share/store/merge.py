@@ -0,0 +1,141 @@
+import argparse
+import csv
+import heapq
+import math
+import os
+import shutil
+import tempfile
+
+import pandas as pd
+
+from .clean import parse_kor_dates
+
+
+# =========================
+# 파트 CSV 병합 + 중복 제거 (메모리 제한)
+# =========================
+# 노트북의 병합 셀은 1.csv ~ 5.csv 를 전부 읽어 concat → drop_duplicates(post_url) → 날짜_dt 정렬이라
+# 종목/기간이 늘면 메모리에 다 올라가지 않는다.
+#
+# 1) 해시 분할 : 청크 단위로 읽어 hash(key) % n 버킷 파일로 나눔 (같은 글은 같은 버킷)
+# 2) 버킷별    : 버킷 하나만 메모리에 올려 keep="first" 중복 제거 → 날짜 정렬된 런(run) 파일
+# 3) k-way 병합: 정렬된 런들을 heapq.merge 로 한 줄씩 합쳐 최종 CSV
+# keep="first" 는 입력 파일 순서 + 파일 안의 행 순서 기준 (노트북과 같음)
+# 정렬용 날짜는 clean.parse_kor_dates ("17:27" 같은 표기는 crawled_at, 없으면 지금 기준)
+#
+#   report = merge_parts(["../data/1.csv", ..., "../data/5.csv"], "../data/fm_hynix_normal.csv")
+#   report  # source 별 입력 행 / 중복으로 빠진 행 / 남은 행
+_SEQ, _SORT = "_seq", "_sort"
+
+
+def _n_buckets(files, memory_mb) -> int:
+    total = sum(os.path.getsize(f) for f in files)
+    # 버킷 CSV 를 DataFrame 으로 올리면 대략 파일 크기의 4배 정도 메모리를 쓴다
+    return max(1, math.ceil(total * 4 / (memory_mb * 2**20)))
+
+
+def merge_parts(files, out_path: str, key="post_url", date_col="날짜", source_col="source",
+                ascending=False, memory_mb=256, chunksize=100_000, tmp_dir=None,
+                crawled_at=None, verbose=True) -> pd.DataFrame:
+    files = list(files)
+    columns = []
+    for f in files:
+        for c in pd.read_csv(f, nrows=0, encoding="utf-8-sig").columns:
+            if c not in columns:
+                columns.append(c)
+    n = _n_buckets(files, memory_mb)
+    work = tempfile.mkdtemp(prefix="merge_", dir=tmp_dir)
+
+    try:
+        # 1) 해시 분할
+        bucket_paths = [os.path.join(work, f"bucket-{i:04d}.csv") for i in range(n)]
+        seq = 0
+        for fi, f in enumerate(files):
+            for chunk in pd.read_csv(f, dtype=str, keep_default_na=False, chunksize=chunksize,
+                                     encoding="utf-8-sig"):
+                chunk = chunk.reindex(columns=columns, fill_value="")
+                chunk[_SEQ] = range(seq, seq + len(chunk))
+                seq += len(chunk)
+                b = pd.util.hash_pandas_object(chunk[key], index=False).to_numpy() % n
+                for i, part in chunk.groupby(b):
+                    p = bucket_paths[i]
+                    part.to_csv(p, mode="a", header=not os.path.exists(p), index=False)
+            if verbose:
+                print(f"[분할] {os.path.basename(f)} 완료 / 누적 {seq:,}행")
+
+        # 2) 버킷별 중복 제거 + 정렬된 런
+        stats = []
+        run_paths = []
+        for p in bucket_paths:
+            if not os.path.exists(p):
+                continue
+            df = pd.read_csv(p, dtype=str, keep_default_na=False)
+            df[_SEQ] = df[_SEQ].astype("int64")
+            df = df.sort_values(_SEQ, kind="stable")
+
+            dup = df.duplicated(subset=[key], keep="first")
+            stats.append(pd.DataFrame({
+                "source": df[source_col] if source_col in df else "",
+                "dup": dup.to_numpy(),
+            }))
+            df = df[~dup]
+
+            dt = parse_kor_dates(df[date_col], crawled_at)
+            # NaT 는 항상 맨 뒤로: 내림차순이면 "" (가장 작음), 오름차순이면 "~" (가장 큼)
+            df[_SORT] = dt.dt.strftime("%Y-%m-%d %H:%M:%S").fillna("" if not ascending else "~")
+            df = df.sort_values([_SORT, _SEQ], ascending=[ascending, True], kind="stable")
+            rp = p.replace("bucket-", "run-")
+            df.to_csv(rp, index=False)
+            run_paths.append(rp)
+            os.remove(p)
+
+        # 3) k-way 병합 (한 줄씩)
+        def rows(path):
+            with open(path, newline="", encoding="utf-8") as f:
+                r = csv.reader(f)
+                header = next(r)
+                i_sort, i_seq = header.index(_SORT), header.index(_SEQ)
+                i_cols = [header.index(c) for c in columns]
+                for row in r:
+                    s = int(row[i_seq])
+                    yield (row[i_sort], -s if not ascending else s), [row[i] for i in i_cols]
+
+        n_out = 0
+        with open(out_path, "w", newline="", encoding="utf-8-sig") as f:
+            w = csv.writer(f)
+            w.writerow(columns)
+            for _, row in heapq.merge(*(rows(p) for p in run_paths), key=lambda x: x[0],
+                                      reverse=not ascending):
+                w.writerow(row)
+                n_out += 1
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+
+    st = pd.concat(stats, ignore_index=True) if stats else pd.DataFrame(columns=["source", "dup"])
+    report = (
+        st.groupby("source").agg(입력행=("dup", "size"), 중복제거=("dup", "sum"))
+          .assign(남은행=lambda d: d["입력행"] - d["중복제거"])
+          .reset_index()
+    )
+    if verbose:
+        print(f"[병합] 입력 {seq:,}행 → 중복 제거 후 {n_out:,}행 (버킷 {n}개) → {out_path}")
+        print(report.to_string(index=False))
+    return report
+
+
+def main():
+    ap = argparse.ArgumentParser(description="파트 CSV 병합 + post_url 중복 제거 + 날짜 정렬")
+    ap.add_argument("out")
+    ap.add_argument("files", nargs="+")
+    ap.add_argument("--key", default="post_url")
+    ap.add_argument("--date-col", default="날짜")
+    ap.add_argument("--source-col", default="source")
+    ap.add_argument("--memory-mb", type=int, default=256)
+    ap.add_argument("--ascending", action="store_true")
+    args = ap.parse_args()
+    merge_parts(args.files, args.out, args.key, args.date_col, args.source_col,
+                ascending=args.ascending, memory_mb=args.memory_mb)
+
+
+if __name__ == "__main__":
+    main()
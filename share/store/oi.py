@@ -0,0 +1,504 @@
+import argparse
+import json
+import math
+import os
+from collections import deque
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+from .clean import parse_counts, parse_kor_dates
+
+# =========================
+# 일별 집계 + 과열지수(OI)
+# =========================
+# fmkorea_normalization.ipynb 의 daily_aggregate / zscore / add_overheat_index 와 같은 정의.
+#   게시글수 = 그날 글 수, 조회수/댓글수/좋아요수 = 그날 합
+#   *_z      = 기간 전체 평균/표준편차(ddof=1) 기준 z-score (표준편차 0 이면 0)
+#   과열지수_OI = 0.25*조회수_z + 0.25*게시글수_z + 0.30*댓글수_z + 0.20*좋아요수_z
+METRICS = ["게시글수", "조회수", "댓글수", "좋아요수"]
+OI_WEIGHTS = {"조회수": 0.25, "게시글수": 0.25, "댓글수": 0.30, "좋아요수": 0.20}
+Z_COLUMNS = ["조회수_z", "게시글수_z", "댓글수_z", "좋아요수_z"]
+OI_COLUMN = "과열지수_OI"
+
+# 게시글 테이블(PostStore / FmKorea CSV) 컬럼 → 집계 지표
+SOURCE_COLUMNS = {"조회": "조회수", "댓글수": "댓글수", "추천": "좋아요수"}
+
+
+# 게시글 DataFrame → 날짜별 (게시글수, 조회수, 댓글수, 좋아요수), 빈 날은 채우지 않음
+# 날짜는 clean.parse_kor_dates 로 ("17:27", "어제", "25.01.14" 같은 원본 표기도 crawled_at 기준으로)
+def daily_counts(posts: pd.DataFrame, date_col="날짜", crawled_at=None) -> pd.DataFrame:
+    d = pd.DataFrame({"date": parse_kor_dates(posts[date_col], crawled_at).dt.normalize()})
+    d["게시글수"] = 1
+    for src, m in SOURCE_COLUMNS.items():
+        d[m] = parse_counts(posts[src]) if src in posts.columns else 0
+    d = d.dropna(subset=["date"])
+    return d.groupby("date")[METRICS].sum().astype("int64")
+
+
+# =========================
+# Welford 누적 평균/분산 (값 추가·삭제·교체가 O(1))
+# =========================
+class RunningStats:
+    __slots__ = ("n", "mean", "m2")
+
+    def __init__(self, n=0, mean=0.0, m2=0.0):
+        self.n, self.mean, self.m2 = n, mean, m2
+
+    def add(self, x):
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (x - self.mean)
+
+    def remove(self, x):
+        if self.n <= 1:
+            self.n, self.mean, self.m2 = 0, 0.0, 0.0
+            return
+        self.n -= 1
+        delta = x - self.mean
+        self.mean -= delta / self.n
+        self.m2 = max(self.m2 - delta * (x - self.mean), 0.0)
+
+    def replace(self, old, new):
+        self.remove(old)
+        self.add(new)
+
+    @property
+    def std(self):
+        return math.sqrt(self.m2 / (self.n - 1)) if self.n > 1 else float("nan")
+
+    # notebook zscore 와 같게: 표준편차가 0/NaN 이면 0
+    def z(self, x):
+        sd = self.std
+        if sd == 0 or math.isnan(sd):
+            return np.zeros_like(np.asarray(x, dtype="float64"))
+        return (np.asarray(x, dtype="float64") - self.mean) / sd
+
+
+# =========================
+# 정수 합 기반 평균/분산 (슬라이딩 창 / 일별 값 교체용)
+# =========================
+# Welford remove 는 뺄셈 상쇄로 오차가 쌓여 창을 오래 밀거나 값을 여러 번 교체하면 notebook 값과 어긋난다
+# (같은 값 두 개인 창 / 모든 날이 같은 값인 기간의 z 가 0 이 아니게 되는 등).
+# 지표는 정수 카운트이므로 n, Σx, Σx² 를 파이썬 int 로 정확히 유지하고 z 를 계산할 때만 float 로 바꾼다.
+class IntWindowStats:
+    __slots__ = ("n", "s1", "s2")
+
+    def __init__(self, n=0, s1=0, s2=0):
+        self.n, self.s1, self.s2 = n, s1, s2
+
+    def add(self, x):
+        x = int(x)
+        self.n += 1
+        self.s1 += x
+        self.s2 += x * x
+
+    def remove(self, x):
+        x = int(x)
+        self.n -= 1
+        self.s1 -= x
+        self.s2 -= x * x
+
+    def replace(self, old, new):
+        self.remove(old)
+        self.add(new)
+
+    @property
+    def mean(self):
+        return self.s1 / self.n if self.n else 0.0
+
+    @property
+    def std(self):
+        if self.n <= 1:
+            return float("nan")
+        return math.sqrt((self.n * self.s2 - self.s1 * self.s1) / (self.n * (self.n - 1)))
+
+    # notebook zscore 와 같게: 표준편차가 0/NaN 이면 0 (x 는 값 하나 또는 배열)
+    def z(self, x):
+        x = np.asarray(x, dtype="float64")
+        sd = self.std
+        if sd == 0 or math.isnan(sd):
+            return np.zeros_like(x)
+        return (x - self.mean) / sd
+
+
+# =========================
+# 증분 일별 집계 (종목 하나)
+# =========================
+# 하루치 새 글만 update() 로 넣으면
+#   - 해당 날짜 집계만 더하고 (새 행 수만큼)
+#   - 지표별 IntWindowStats(정수 Σx, Σx²)는 바뀐 날의 값만 교체 (날짜 수만큼)
+# 과거 전체를 다시 읽지 않는다. z-score / OI 는 저장된 일별 값과 현재 통계로 바로 계산.
+# start 를 주면 notebook 처럼 start 부터(end 도 주면 end 까지) 0 으로 채우고 기간 밖 글은 버린다.
+# (start 없이 시작하면 첫 글 날짜부터라 z-score 가 notebook 과 달라짐)
+#   oi = DailyOI(start="2025-01-14")
+#   oi.update(today_posts)
+#   oi.row("2026-01-15")  /  oi.frame()
+class DailyOI:
+    def __init__(self, start=None, end=None, weights: dict = None):
+        self.start = pd.Timestamp(start).date() if start is not None else None
+        self.end = pd.Timestamp(end).date() if end is not None else None
+        self.weights = dict(weights or OI_WEIGHTS)
+        self.days = {}          # date -> np.int64[4] (METRICS 순서)
+        self.stats = {m: IntWindowStats() for m in METRICS}
+        self.first = self.last = None
+        self._extend_range()
+
+    def __len__(self):
+        return len(self.days)
+
+    def _extend_range(self):
+        for d in (self.start, self.end):
+            if d is not None:
+                self._extend(d)
+
+    def _add_day(self, d):
+        v = np.zeros(len(METRICS), dtype="int64")
+        self.days[d] = v
+        for m in METRICS:
+            self.stats[m].add(0)
+        return v
+
+    # 빈 날을 0 으로 채워 d 까지 연속 구간 유지
+    def _extend(self, d):
+        if self.first is None:
+            self.first = self.last = d
+            self._add_day(d)
+            return
+        while d > self.last:
+            self.last += timedelta(days=1)
+            self._add_day(self.last)
+        while d < self.first:
+            self.first -= timedelta(days=1)
+            self._add_day(self.first)
+
+    def _in_range(self, d):
+        return (self.start is None or d >= self.start) and (self.end is None or d <= self.end)
+
+    # 새 게시글을 반영하고 바뀐 날짜 목록을 돌려줌
+    def update(self, posts: pd.DataFrame, date_col="날짜", crawled_at=None):
+        return self.add_counts(daily_counts(posts, date_col, crawled_at))
+
+    # 이미 날짜별로 합친 값(daily_counts 결과)을 더함
+    def add_counts(self, counts: pd.DataFrame):
+        touched = []
+        for ts, row in zip(counts.index, counts[METRICS].to_numpy("int64")):
+            d = pd.Timestamp(ts).date()
+            if not self._in_range(d):
+                continue
+            self._extend(d)
+            v = self.days[d]
+            for i, m in enumerate(METRICS):
+                self.stats[m].replace(v[i], v[i] + row[i])
+            v += row
+            touched.append(d)
+        return touched
+
+    def z(self, metric, x):
+        return self.stats[metric].z(x)
+
+    # 날짜 하나의 집계 + z + OI (O(1))
+    def row(self, d) -> dict:
+        d = pd.Timestamp(d).date()
+        v = self.days[d]
+        out = {"날짜": d.isoformat()}
+        out.update({m: int(v[i]) for i, m in enumerate(METRICS)})
+        oi = 0.0
+        for zc in Z_COLUMNS:
+            m = zc[:-2]
+            out[zc] = float(self.z(m, v[METRICS.index(m)]))
+            oi += self.weights[m] * out[zc]
+        out[OI_COLUMN] = oi
+        return out
+
+    # add_overheat_index(daily_aggregate(...)) 와 같은 모양의 전체 테이블
+    def frame(self) -> pd.DataFrame:
+        if not self.days:
+            return pd.DataFrame(columns=["날짜"] + METRICS + Z_COLUMNS + [OI_COLUMN])
+        dates = sorted(self.days)
+        vals = np.stack([self.days[d] for d in dates])
+        df = pd.DataFrame(vals, columns=METRICS)
+        df.insert(0, "날짜", [d.isoformat() for d in dates])
+        df[OI_COLUMN] = 0.0
+        for zc in Z_COLUMNS:
+            m = zc[:-2]
+            df[zc] = self.z(m, df[m].to_numpy())
+            df[OI_COLUMN] += self.weights[m] * df[zc]
+        return df[["날짜"] + METRICS + Z_COLUMNS + [OI_COLUMN]]
+
+    def to_dict(self) -> dict:
+        dates = sorted(self.days)
+        return {
+            "start": self.start.isoformat() if self.start else None,
+            "end": self.end.isoformat() if self.end else None,
+            "weights": self.weights,
+            "dates": [d.isoformat() for d in dates],
+            "values": [self.days[d].tolist() for d in dates],
+            "stats": {m: [s.n, s.s1, s.s2] for m, s in self.stats.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, state: dict) -> "DailyOI":
+        self = cls(weights=state["weights"])
+        self.start = date.fromisoformat(state["start"]) if state["start"] else None
+        self.end = date.fromisoformat(state["end"]) if state["end"] else None
+        for d, v in zip(state["dates"], state["values"]):
+            self.days[date.fromisoformat(d)] = np.asarray(v, dtype="int64")
+        if self.days:
+            self.first, self.last = min(self.days), max(self.days)
+        stats = state.get("stats") or {}
+        if all(isinstance(x, int) for m in METRICS for x in stats.get(m, [None])):
+            self.stats = {m: IntWindowStats(*stats[m]) for m in METRICS}
+        else:
+            # 예전 상태 파일(Welford n/mean/m2) → 저장된 일별 값으로 다시 계산
+            self.stats = {m: IntWindowStats() for m in METRICS}
+            for v in self.days.values():
+                for i, m in enumerate(METRICS):
+                    self.stats[m].add(v[i])
+        self._extend_range()
+        return self
+
+
+# =========================
+# 여러 종목/커뮤니티 상태를 파일 하나로
+# =========================
+#   inc = IncrementalOI.load("../data/oi_state.json", start="2025-01-14")
+#   inc.update(new_posts, community="fmkorea", stock="삼성")
+#   inc.save()
+class IncrementalOI:
+    def __init__(self, path: str = None, start=None, end=None, weights: dict = None):
+        self.path = path
+        self.start, self.end, self.weights = start, end, weights
+        self.states = {}        # (community, stock) -> DailyOI
+
+    def get(self, community: str, stock: str) -> DailyOI:
+        key = (community, stock)
+        if key not in self.states:
+            self.states[key] = DailyOI(self.start, self.end, self.weights)
+        return self.states[key]
+
+    def update(self, posts: pd.DataFrame, community: str, stock: str, date_col="날짜"):
+        return self.get(community, stock).update(posts, date_col)
+
+    def frame(self) -> pd.DataFrame:
+        parts = []
+        for (community, stock), st in self.states.items():
+            df = st.frame()
+            df.insert(0, "stock", stock)
+            df.insert(0, "community", community)
+            parts.append(df)
+        return pd.concat(parts, ignore_index=True) if parts else pd.DataFrame()
+
+    def save(self, path: str = None):
+        path = path or self.path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        state = [{"community": c, "stock": s, **st.to_dict()} for (c, s), st in self.states.items()]
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str, start=None, end=None, weights: dict = None) -> "IncrementalOI":
+        self = cls(path, start, end, weights)
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                for st in json.load(f):
+                    self.states[(st["community"], st["stock"])] = DailyOI.from_dict(st)
+        return self
+
+
+# =========================
+# 전체 종목 × 커뮤니티 OI 를 한 번에 (long format)
+# =========================
+# 노트북은 종목마다 파일을 골라 daily_aggregate → add_overheat_index → 종목별 CSV,
+# 커뮤니티(FmKorea/DC/Blind)마다 노트북이 따로 있었다.
+# 통합 게시글 테이블(PostStore.read()) 하나를 받아
+#   groupby(community, stock, 날짜) 합계 → (키 × 기간 전체 날짜) 로 reindex(빈 날 0)
+#   → 키별 평균/표준편차 transform 으로 z → OI
+# 한 번에 계산한다. 종목/커뮤니티가 늘면 결과 행만 늘어난다.
+#   posts = PostStore("../data/posts").read(columns=["날짜", "조회", "추천", "댓글수", "community", "stock"])
+#   oi = compute_oi(posts, start="2025-01-14", end="2026-01-14")
+def compute_oi(posts: pd.DataFrame, start=None, end=None, weights: dict = None,
+               keys=("community", "stock"), date_col="날짜", crawled_at=None) -> pd.DataFrame:
+    keys = list(keys)
+    weights = weights or OI_WEIGHTS
+    out_cols = keys + ["날짜"] + METRICS + Z_COLUMNS + [OI_COLUMN]
+
+    d = pd.DataFrame({k: posts[k].astype(str).to_numpy() for k in keys})
+    d["날짜"] = parse_kor_dates(posts[date_col], crawled_at).dt.normalize().to_numpy()
+    d["게시글수"] = 1
+    for src, m in SOURCE_COLUMNS.items():
+        d[m] = parse_counts(posts[src]) if src in posts.columns else 0
+    d = d.dropna(subset=["날짜"])
+    start = pd.Timestamp(start) if start is not None else d["날짜"].min()
+    end = pd.Timestamp(end) if end is not None else d["날짜"].max()
+    d = d[(d["날짜"] >= start) & (d["날짜"] <= end)]
+    if d.empty:
+        return pd.DataFrame(columns=out_cols)
+
+    g = d.groupby(keys + ["날짜"], sort=True)[METRICS].sum()
+    groups = g.index.droplevel("날짜").unique().to_frame(index=False)
+    days = pd.date_range(start, end, freq="D")
+    full = pd.MultiIndex.from_arrays(
+        [np.repeat(groups[k].to_numpy(), len(days)) for k in keys] + [np.tile(days, len(groups))],
+        names=keys + ["날짜"])
+    g = g.reindex(full, fill_value=0).astype("int64")
+
+    by = g.groupby(level=keys, sort=False)
+    mu, sd = by.transform("mean"), by.transform("std")
+    z = ((g - mu) / sd).where((sd != 0) & sd.notna(), 0.0)
+
+    out = g.reset_index()
+    out["날짜"] = out["날짜"].dt.strftime("%Y-%m-%d")
+    out[OI_COLUMN] = 0.0
+    for zc in Z_COLUMNS:
+        m = zc[:-2]
+        out[zc] = z[m].to_numpy()
+        out[OI_COLUMN] += weights[m] * out[zc]
+    return out[out_cols]
+
+
+# long 테이블 → 파일(.parquet/.csv) 그리고/또는 AnalyticsDB daily 테이블
+def write_oi(oi: pd.DataFrame, path: str = None, db=None):
+    if path:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        if path.endswith(".parquet"):
+            oi.to_parquet(path, index=False)
+        else:
+            oi.to_csv(path, index=False, encoding="utf-8-sig")
+    if db is not None:
+        for (community, stock), part in oi.groupby(["community", "stock"], sort=False):
+            db.upsert("daily", part.drop(columns=["community", "stock"]), community=community, stock=stock)
+
+
+# =========================
+# 인과적(causal) z-score / OI : 그날까지의 데이터만 사용
+# =========================
+# zscore() / compute_oi 는 기간 전체 평균/표준편차를 쓰므로 과거 날짜의 OI 가 미래 값에 따라 바뀐다
+# (백테스트에 그대로 쓰면 미래 정보 누수).
+# 여기서는 날짜 t 의 z 를 [t-window+1, t] (window=None 이면 처음 ~ t) 값만으로 계산한다.
+#   - 하루 push 할 때마다 IntWindowStats 에 더하고, 창 밖으로 나간 값은 remove → O(1), 오차 누적 없음
+#   - 같은 날짜를 다시 push 하면(장중 재집계) 그날 값만 교체
+#   - 날짜가 건너뛰면 빈 날은 0 으로 채움 (daily_aggregate 와 같음)
+#   - min_periods 개 미만이면 z = 0
+# 과거 전체(run)와 매일 갱신(push)이 같은 코드를 탄다.
+#   cz = CausalOI(window=60)
+#   hist = cz.run(daily)                 # DailyOI.frame() / compute_oi 한 종목 분량
+#   today = cz.push("2026-01-15", {"게시글수": 120, "조회수": 50000, "댓글수": 800, "좋아요수": 90})
+class CausalOI:
+    def __init__(self, window: int = None, weights: dict = None, min_periods: int = 2):
+        if window is not None and window < 2:
+            raise ValueError("window 는 2 이상이어야 합니다")
+        self.window = window
+        self.weights = dict(weights or OI_WEIGHTS)
+        self.min_periods = min_periods
+        self.values = deque()           # 창 안의 (date, np.int64[4])
+        self.stats = {m: IntWindowStats() for m in METRICS}
+        self.last = None
+
+    def _append(self, d, v):
+        self.values.append((d, v))
+        for i, m in enumerate(METRICS):
+            self.stats[m].add(v[i])
+        if self.window is not None and len(self.values) > self.window:
+            _, old = self.values.popleft()
+            for i, m in enumerate(METRICS):
+                self.stats[m].remove(old[i])
+
+    def _row(self, d, v) -> dict:
+        out = {"날짜": d.isoformat()}
+        out.update({m: int(v[i]) for i, m in enumerate(METRICS)})
+        n = len(self.values)
+        oi = 0.0
+        for zc in Z_COLUMNS:
+            m = zc[:-2]
+            z = float(self.stats[m].z(v[METRICS.index(m)])) if n >= self.min_periods else 0.0
+            out[zc] = z
+            oi += self.weights[m] * z
+        out[OI_COLUMN] = oi
+        return out
+
+    def push(self, d, values) -> dict:
+        d = pd.Timestamp(d).date()
+        v = np.asarray([values[m] for m in METRICS] if isinstance(values, dict) else values, dtype="int64")
+        if self.last is not None and d < self.last:
+            raise ValueError(f"과거 날짜는 넣을 수 없습니다: {d} < {self.last}")
+        if d == self.last:
+            _, old = self.values[-1]
+            for i, m in enumerate(METRICS):
+                self.stats[m].replace(old[i], v[i])
+            self.values[-1] = (d, v)
+            return self._row(d, v)
+        if self.last is not None:
+            gap = self.last + timedelta(days=1)
+            while gap < d:
+                self._append(gap, np.zeros(len(METRICS), dtype="int64"))
+                gap += timedelta(days=1)
+        self._append(d, v)
+        self.last = d
+        return self._row(d, v)
+
+    # 날짜 + METRICS 컬럼을 가진 일별 테이블 → 같은 행 순서의 causal z / OI 테이블
+    def run(self, daily: pd.DataFrame, date_col="날짜") -> pd.DataFrame:
+        daily = daily.sort_values(date_col)
+        rows = [self.push(d, v) for d, v in zip(daily[date_col], daily[METRICS].to_numpy("int64"))]
+        return pd.DataFrame(rows, columns=["날짜"] + METRICS + Z_COLUMNS + [OI_COLUMN])
+
+    def to_dict(self) -> dict:
+        return {
+            "window": self.window, "weights": self.weights, "min_periods": self.min_periods,
+            "last": self.last.isoformat() if self.last else None,
+            "values": [[d.isoformat(), v.tolist()] for d, v in self.values],
+        }
+
+    @classmethod
+    def from_dict(cls, state: dict) -> "CausalOI":
+        self = cls(state["window"], state["weights"], state["min_periods"])
+        self.values = deque((date.fromisoformat(d), np.asarray(v, dtype="int64")) for d, v in state["values"])
+        # 통계는 창 안 값으로 다시 만든다 (정수 합이라 저장 전과 똑같음)
+        for _, v in self.values:
+            for i, m in enumerate(METRICS):
+                self.stats[m].add(v[i])
+        self.last = date.fromisoformat(state["last"]) if state["last"] else None
+        return self
+
+
+# compute_oi 결과(long) → 키별 causal z / OI (같은 컬럼 구성)
+def causal_oi(oi: pd.DataFrame, window: int = None, weights: dict = None, min_periods: int = 2,
+              keys=("community", "stock")) -> pd.DataFrame:
+    keys = list(keys)
+    parts = []
+    for key, g in oi.groupby(keys, sort=False):
+        df = CausalOI(window, weights, min_periods).run(g)
+        for k, val in zip(keys, key if isinstance(key, tuple) else (key,)):
+            df[k] = val
+        parts.append(df)
+    cols = keys + ["날짜"] + METRICS + Z_COLUMNS + [OI_COLUMN]
+    return pd.concat(parts, ignore_index=True)[cols] if parts else pd.DataFrame(columns=cols)
+
+
+def main():
+    from .analytics import get_db
+    from .posts import PostStore
+
+    ap = argparse.ArgumentParser(description="PostStore 전체 → (community, stock, 날짜) 과열지수 long 테이블")
+    ap.add_argument("posts_root")
+    ap.add_argument("--out", default=None, help=".parquet 또는 .csv")
+    ap.add_argument("--db", action="store_true", help="AnalyticsDB daily 테이블에도 저장")
+    ap.add_argument("--start", default=None)
+    ap.add_argument("--end", default=None)
+    args = ap.parse_args()
+
+    posts = PostStore(args.posts_root).read(
+        start=args.start and pd.Timestamp(args.start).date(), end=args.end and pd.Timestamp(args.end).date(),
+        columns=["날짜", "조회", "추천", "댓글수", "community", "stock"])
+    oi = compute_oi(posts, args.start, args.end)
+    write_oi(oi, args.out, get_db() if args.db else None)
+    print(f"[완료] {oi.groupby(['community', 'stock']).ngroups}개 (community, stock), {len(oi):,}행")
+
+
+if __name__ == "__main__":
+    main()
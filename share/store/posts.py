@@ -0,0 +1,232 @@
+import os
+import uuid
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+from .clean import clean_posts, file_crawled_at
+
+# =========================
+# 게시글 저장소 스키마
+# =========================
+# FmKorea CSV(1.csv ~ 5.csv, fm_hynix_normal.csv) 컬럼 이름을 기준으로 통일한다.
+# - 조회/추천/댓글수 : int32
+# - 탭/source        : 카테고리 (dictionary)
+# - 날짜             : timestamp (초 단위, 시각이 없으면 00:00:00)
+# 파티션: community=<사이트>/stock=<종목>/date=<YYYY-MM-DD>
+STORE_COLUMNS = ["탭", "제목", "글쓴이", "날짜", "조회", "추천", "댓글수", "post_url", "source", "content"]
+COUNT_COLUMNS = ["조회", "추천", "댓글수"]
+PARTITION_COLUMNS = ["community", "stock", "date"]
+
+SCHEMA = pa.schema([
+    ("탭", pa.dictionary(pa.int32(), pa.string())),
+    ("제목", pa.string()),
+    ("글쓴이", pa.string()),
+    ("날짜", pa.timestamp("s")),
+    ("조회", pa.int32()),
+    ("추천", pa.int32()),
+    ("댓글수", pa.int32()),
+    ("post_url", pa.string()),
+    ("source", pa.dictionary(pa.int32(), pa.string())),
+    ("content", pa.string()),
+])
+PARTITIONING = ds.partitioning(
+    pa.schema([("community", pa.string()), ("stock", pa.string()), ("date", pa.string())]),
+    flavor="hive",
+)
+
+# 사이트/파일마다 다른 컬럼 이름 → 저장소 컬럼
+RENAME = {
+    # 공통 엔진 (share.crawler.POST_COLUMNS)
+    "category": "탭", "title": "제목", "author": "글쓴이", "date": "날짜",
+    "views": "조회", "likes": "추천", "comments": "댓글수", "keyword": "source",
+    # DC (dc.COLUMNS)
+    "subject": "탭", "view_count": "조회", "recommend_count": "추천",
+    # Blind (blind.COLUMNS)
+    "url": "post_url",
+    # FmKorea 상세 JSONL (fmkorea_hynix_hot_posts.jsonl)
+    "votes": "추천", "comment_count": "댓글수",
+}
+
+
+# 어떤 모양의 게시글 DataFrame 이든 STORE_COLUMNS + 정해진 dtype 으로
+# 날짜는 clean.parse_kor_dates: FmKorea "17:27", DC "01.14"/"25.01.14", Blind "3시간"/"어제" 같은
+# 원본 표기는 crawled_at(수집 시각 값 또는 컬럼 이름, 없으면 crawled_at 컬럼 → 지금) 기준으로 해석
+# 그래도 못 읽은 행은 파티션을 정할 수 없으므로 버리고 몇 행인지 출력한다
+def to_store_frame(df: pd.DataFrame, source: str = None, crawled_at=None) -> pd.DataFrame:
+    df = df.copy()
+    if crawled_at is None and "crawled_at" in df.columns:
+        crawled_at = "crawled_at"
+    if isinstance(crawled_at, str) and crawled_at in df.columns:
+        crawled_at = df[crawled_at]
+    # 상세 JSONL 의 comments 는 댓글 목록(list) → 개수는 comment_count 에 있음
+    if "comment_count" in df.columns:
+        df = df.drop(columns=["comments"], errors="ignore")
+    df = df.drop(columns=["comment_list"], errors="ignore")
+    df = df.rename(columns={k: v for k, v in RENAME.items() if k in df.columns and v not in df.columns})
+
+    for c in STORE_COLUMNS:
+        if c not in df.columns:
+            df[c] = source if c == "source" and source else ""
+    df = df[STORE_COLUMNS]
+
+    raw_dates = df["날짜"]
+    df = clean_posts(df, "날짜", COUNT_COLUMNS, crawled_at)
+    for c in ["제목", "글쓴이", "post_url", "content"]:
+        df[c] = df[c].fillna("").astype(str)
+    for c in ["탭", "source"]:
+        df[c] = df[c].fillna("").astype(str).astype("category")
+    bad = df["날짜"].isna()
+    if bad.any():
+        print(f"[날짜 해석 실패] {int(bad.sum())}행 제외 (예: {raw_dates[bad].head(3).tolist()})")
+    return df[~bad].reset_index(drop=True)
+
+
+# =========================
+# community/stock/date 파티션 Parquet 공통 부분 (게시글 / 댓글 저장소가 같이 씀)
+# =========================
+class HiveStore:
+    schema = None            # 파티션 컬럼을 뺀 데이터 스키마
+    columns = None
+    key = None               # 같은 파티션 안에서 중복 판정 컬럼
+
+    def __init__(self, root: str):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+
+    def _full_schema(self):
+        return pa.unify_schemas([self.schema, PARTITIONING.schema])
+
+    def _dataset(self):
+        return ds.dataset(self.root, format="parquet", partitioning=PARTITIONING,
+                          schema=self._full_schema())
+
+    @staticmethod
+    def _filter(community=None, stock=None, start=None, end=None):
+        f = None
+
+        def add(e):
+            return e if f is None else f & e
+
+        if community is not None:
+            f = add(ds.field("community") == community)
+        if stock is not None:
+            f = add(ds.field("stock") == stock)
+        # date 는 파티션 컬럼 → 범위 밖 디렉터리는 아예 열지 않음
+        if start is not None:
+            f = add(ds.field("date") >= pd.Timestamp(start).strftime("%Y-%m-%d"))
+        if end is not None:
+            f = add(ds.field("date") <= pd.Timestamp(end).strftime("%Y-%m-%d"))
+        return f
+
+    # df: self.columns + "date"(YYYY-MM-DD) 를 가진 정규화된 프레임
+    # 건드리는 파티션의 기존 행과 합쳐 key 기준 마지막 값만 남기고 다시 씀
+    def _write_partitions(self, df: pd.DataFrame, community: str, stock: str) -> int:
+        if df.empty:
+            return 0
+        dates = sorted(df["date"].unique())
+
+        old = self.read(community, stock, start=dates[0], end=dates[-1], columns=self.columns + ["date"])
+        old = old[old["date"].isin(dates)]
+        if not old.empty:
+            df = pd.concat([old, df], ignore_index=True)
+        df = df.drop_duplicates(subset=self.key, keep="last")
+        df["community"] = community
+        df["stock"] = stock
+
+        table = pa.Table.from_pandas(df[self.columns + PARTITION_COLUMNS], preserve_index=False)
+        table = table.cast(self._full_schema())
+        ds.write_dataset(
+            table, self.root, format="parquet", partitioning=PARTITIONING,
+            basename_template=f"part-{uuid.uuid4().hex[:12]}-{{i}}.parquet",
+            existing_data_behavior="delete_matching",
+        )
+        return len(df)
+
+    def read(self, community=None, stock=None, start=None, end=None, columns=None) -> pd.DataFrame:
+        dset = self._dataset()
+        table = dset.to_table(columns=columns, filter=self._filter(community, stock, start, end))
+        return table.to_pandas()
+
+    # 파티션 목록 (community, stock, date) — 파일을 열지 않고 경로만 본다
+    def partitions(self, community=None, stock=None) -> pd.DataFrame:
+        rows = []
+        for frag in self._dataset().get_fragments(filter=self._filter(community, stock)):
+            rows.append(ds.get_partition_keys(frag.partition_expression))
+        return pd.DataFrame(rows, columns=PARTITION_COLUMNS).drop_duplicates().sort_values(
+            PARTITION_COLUMNS).reset_index(drop=True)
+
+
+# =========================
+# 파티션 Parquet 게시글 저장소
+# =========================
+# CSV/JSONL 을 통째로 다시 읽는 대신, 필요한 사이트/종목/기간/컬럼만 읽는다.
+#
+#   store = PostStore("../data/posts")
+#   store.import_csv("../data/fm_hynix_normal.csv", "fmkorea", "하이닉스")
+#   with store.sink("fmkorea", "하이닉스") as sink:           # 크롤러에서 바로 저장
+#       crawl_one(session, url_base, "하이닉스", 1, 100, sink=sink)
+#   df = store.read("fmkorea", "하이닉스", start=date(2025, 1, 14), end=date(2026, 1, 14),
+#                   columns=["날짜", "조회", "추천", "댓글수"])
+#
+# 같은 (community, stock, date) 파티션에 다시 쓰면 기존 행과 합쳐 post_url 기준 최신 값만 남긴다
+# (같은 기간을 다시 크롤링해도 중복이 쌓이지 않음).
+class PostStore(HiveStore):
+    schema = SCHEMA
+    columns = STORE_COLUMNS
+    key = ["post_url"]
+
+    # crawled_at: 상대 날짜("17:27", "3시간")의 기준 시각 (to_store_frame 참고)
+    def write(self, df: pd.DataFrame, community: str, stock: str, source: str = None, crawled_at=None) -> int:
+        df = to_store_frame(df, source, crawled_at)
+        df["date"] = df["날짜"].dt.strftime("%Y-%m-%d")
+        return self._write_partitions(df, community, stock)
+
+    # ---------- 기존 파일 가져오기 ----------
+    # crawled_at 을 안 주면 파일 수정 시각을 수집 시각으로 본다
+    def import_csv(self, path: str, community: str, stock: str, source: str = None, crawled_at=None) -> int:
+        return self.write(pd.read_csv(path, encoding="utf-8-sig", dtype=str), community, stock, source,
+                          crawled_at or file_crawled_at(path))
+
+    def import_jsonl(self, path: str, community: str, stock: str, source: str = None, crawled_at=None) -> int:
+        return self.write(pd.read_json(path, lines=True, dtype=False), community, stock, source,
+                          crawled_at or file_crawled_at(path))
+
+    # 크롤러 sink= 로 넘기는 버퍼 (share.crawler.sink.RowSink 와 같은 write_many/flush/close)
+    def sink(self, community: str, stock: str, flush_rows=5_000, source: str = None):
+        return PostStoreSink(self, community, stock, flush_rows, source)
+
+
+class PostStoreSink:
+    def __init__(self, store: PostStore, community: str, stock: str, flush_rows=5_000, source=None):
+        self.store = store
+        self.community = community
+        self.stock = stock
+        self.flush_rows = flush_rows
+        self.source = source
+        self.n_rows = 0
+        self._buf = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def write(self, row: dict):
+        self.write_many([row])
+
+    def write_many(self, rows):
+        self._buf.extend(rows)
+        self.n_rows += len(rows)
+        if len(self._buf) >= self.flush_rows:
+            self.flush()
+
+    def flush(self):
+        if self._buf:
+            self.store.write(pd.DataFrame(self._buf), self.community, self.stock, self.source)
+            self._buf = []
+
+    def close(self):
+        self.flush()
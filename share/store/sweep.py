@@ -0,0 +1,112 @@
+import itertools
+import re
+
+import numpy as np
+import pandas as pd
+
+from .oi import OI_COLUMN, Z_COLUMNS
+
+# =========================
+# OI 가중치 스윕
+# =========================
+# notebook 은 W_VIEWS/W_POSTS/W_COMMENTS/W_LIKES 를 고정해 두고, 대시보드는 가중치마다 CSV
+# (samsung_view_1.csv, samsung_post_1.csv, ...) 를 따로 만들어 읽었다.
+# OI 는 z-score 의 선형 결합이므로 가중치 K 개를 한 번에 계산할 수 있다.
+#   Z (날짜 × 4, Z_COLUMNS 순서)  @  W.T (4 × K)  →  OI (날짜 × K)
+# 다음 날 수익률/거래량 변화와의 상관도 z 공분산(4×4)과 가중치 행렬의 곱으로 한 번에 구한다.
+#   W = weight_grid(step=0.05)                        # 합이 1 인 1,771 개
+#   rank = rank_weights(daily_oi, db.ohlcv("005930", start, end), W)
+#   rank.head()
+WEIGHT_METRICS = [c[:-2] for c in Z_COLUMNS]          # 조회수, 게시글수, 댓글수, 좋아요수
+WEIGHT_ALIASES = {"view": "조회수", "post": "게시글수", "comment": "댓글수", "like": "좋아요수"}
+
+
+# 합이 1 이고 step 간격인 모든 가중치 (단체 격자), (K × 4)
+def weight_grid(step: float = 0.05) -> np.ndarray:
+    n = int(round(1 / step))
+    rows = [c for c in itertools.product(range(n + 1), repeat=len(WEIGHT_METRICS) - 1) if sum(c) <= n]
+    grid = np.array([list(c) + [n - sum(c)] for c in rows], dtype="float64") / n
+    return grid
+
+
+# {"조회수": 0.25, ...} / "view_1" / "view0.5_comment0.5" → 길이 4 배열 (WEIGHT_METRICS 순서)
+def weight_vector(w) -> np.ndarray:
+    if isinstance(w, str):
+        parts = re.findall(r"([a-z]+)_?([\d.]+)", w)
+        if not parts:
+            raise ValueError(f"가중치 이름을 해석할 수 없습니다: {w}")
+        w = {WEIGHT_ALIASES[k]: float(v) for k, v in parts}
+    if isinstance(w, dict):
+        return np.array([float(w.get(m, 0.0)) for m in WEIGHT_METRICS])
+    return np.asarray(w, dtype="float64")
+
+
+def weight_name(w) -> str:
+    inv = {v: k for k, v in WEIGHT_ALIASES.items()}
+    return "_".join(f"{inv[m]}{x:g}" for m, x in zip(WEIGHT_METRICS, weight_vector(w)) if x)
+
+
+def z_matrix(daily: pd.DataFrame) -> np.ndarray:
+    return daily[Z_COLUMNS].to_numpy("float64")
+
+
+# 가중치 여러 개 → OI 행렬 (날짜 × K)
+def sweep_oi(daily: pd.DataFrame, weights) -> np.ndarray:
+    W = np.atleast_2d(np.asarray(weights, dtype="float64"))
+    return z_matrix(daily) @ W.T
+
+
+# 대시보드용: 가중치 하나만 바꿔 과열지수_OI 를 다시 계산한 일별 테이블
+def reweight(daily: pd.DataFrame, w) -> pd.DataFrame:
+    out = daily.copy()
+    out[OI_COLUMN] = z_matrix(daily) @ weight_vector(w)
+    return out
+
+
+# 날짜별 다음 거래일 수익률 / 거래량 로그 변화 (주말·휴일 OI 는 그다음 거래일에 붙음)
+def next_day_targets(dates, ohlcv: pd.DataFrame) -> pd.DataFrame:
+    px = ohlcv.copy()
+    px["Date"] = pd.to_datetime(px["Date"]).dt.normalize()
+    px = px.sort_values("Date").drop_duplicates("Date").reset_index(drop=True)
+    ret = px["Close"].pct_change().to_numpy()
+    vol = np.log(px["Volume"].astype("float64").where(px["Volume"] > 0)).diff().to_numpy()
+
+    d = pd.to_datetime(pd.Series(dates)).dt.normalize().to_numpy()
+    i = np.searchsorted(px["Date"].to_numpy(), d, side="right")      # t 보다 뒤인 첫 거래일
+    ok = i < len(px)
+    out = pd.DataFrame({"next_return": np.nan, "next_volume": np.nan}, index=range(len(d)))
+    out.loc[ok, "next_return"] = ret[i[ok]]
+    out.loc[ok, "next_volume"] = vol[i[ok]]
+    return out
+
+
+# 가중치마다 (Z @ w) 와 y 의 피어슨 상관 (y 가 NaN 인 날은 제외)
+# OI 가 Z 의 선형 결합이라 corr = w·cov(Z, y) / sqrt(wᵀ cov(Z) w · var(y))
+# → (날짜 × K) OI 행렬을 만들지 않고 4×4 공분산만으로 계산
+def _corr_weights(Z: np.ndarray, W: np.ndarray, y: np.ndarray) -> np.ndarray:
+    m = ~np.isnan(y) & ~np.isnan(Z).any(axis=1)
+    Z, y = Z[m], y[m]
+    if len(y) < 3:
+        return np.full(len(W), np.nan)
+    Zc = Z - Z.mean(axis=0)
+    yc = y - y.mean()
+    num = W @ (Zc.T @ yc)
+    den = np.sqrt(np.einsum("ki,ij,kj->k", W, Zc.T @ Zc, W) * (yc @ yc))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(den > 0, num / den, np.nan)
+
+
+# 가중치 K 개 전부 → 다음 날 수익률/거래량 상관 순위표
+#   sort_by: "next_return" | "next_volume", absolute=True 면 |상관| 기준
+def rank_weights(daily: pd.DataFrame, ohlcv: pd.DataFrame, weights=None, sort_by="next_volume",
+                 absolute=True) -> pd.DataFrame:
+    W = weight_grid() if weights is None else np.atleast_2d(np.asarray(weights, dtype="float64"))
+    Z = z_matrix(daily)
+    tgt = next_day_targets(daily["날짜"], ohlcv)
+
+    out = pd.DataFrame(W, columns=[f"w_{m}" for m in WEIGHT_METRICS])
+    for c in tgt.columns:
+        out[f"corr_{c}"] = _corr_weights(Z, W, tgt[c].to_numpy("float64"))
+    out["n"] = int((~np.isnan(tgt["next_return"].to_numpy())).sum())
+    key = out[f"corr_{sort_by}"].abs() if absolute else out[f"corr_{sort_by}"]
+    return out.loc[key.sort_values(ascending=False, na_position="last").index].reset_index(drop=True)
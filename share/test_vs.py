@@ -1,9 +1,12 @@
 import os
+import sys
 import pandas as pd
 import streamlit as st
-import FinanceDataReader as fdr
 from streamlit_lightweight_charts import renderLightweightCharts
 
+sys.path.append("..")
+from share.store import get_db
+
 st.set_page_config(layout="wide")
 
 # =========================
@@ -40,14 +43,18 @@ ticker = STOCKS[stock_name]
 # =========================
 @st.cache_data
 def load_price(ticker, start, end):
-    df = fdr.DataReader(ticker, str(start), str(end)).reset_index()
-    return df
+    return get_db().ohlcv(ticker, start, end)
 
+# 종목 구분이 없는 전체 지수 파일이라 파일 이름을 stock 키로 사용
+# sync_csv 는 캐시 밖에서 매번 확인하고, CSV 수정시각(version)을 캐시 키에 넣음
 @st.cache_data
+def load_fg(key, start, end, version):
+    return get_db().fng("FmKorea", key, start, end)
+
 def load_fg_csv(path, start, end):
-    df = pd.read_csv(path, encoding="utf-8-sig")
-    df["date"] = pd.to_datetime(df["date"])
-    return df[(df["date"].dt.date >= start) & (df["date"].dt.date <= end)]
+    key = os.path.basename(path)
+    get_db().sync_csv(path, "fng", community="FmKorea", stock=key)
+    return load_fg(key, start, end, os.path.getmtime(path))
 
 # =========================
 # Series Builders
@@ -1,13 +1,16 @@
 
 import os
+import sys
 import pandas as pd
 import numpy as np
 import streamlit as st
-import FinanceDataReader as fdr
 import plotly.express as px
 from streamlit_lightweight_charts import renderLightweightCharts
 from datetime import timedelta
 
+sys.path.append("..")
+from share.store import get_db
+
 # =========================
 # Page Config
 # =========================
@@ -87,25 +90,29 @@ METRIC_COLOR = {
 }
 
 # =========================
-# Data Loaders
+# Data Loaders (공용 분석 DB: CSV 는 바뀌었을 때만 다시 읽음)
 # =========================
+# sync_csv 는 캐시 함수 밖에서 매번 부르고(수정시각 확인만),
+# 캐시 함수에는 CSV 수정시각(version)을 넘겨서 CSV 가 바뀌면 캐시도 새로 조회
+def sync_source(path, table, community, stock):
+    get_db().sync_csv(path, table, community=community, stock=stock)
+    return os.path.getmtime(path)
+
 @st.cache_data
 def load_price(ticker, start, end):
-    df = fdr.DataReader(ticker, str(start - timedelta(days=14)), str(end))
-    return df.reset_index()
+    return get_db().ohlcv(ticker, start - timedelta(days=14), end)
 
 @st.cache_data
-def load_community(path, start, end):
-    df = pd.read_csv(path, encoding="utf-8-sig")
-    df["날짜"] = pd.to_datetime(df["날짜"]).dt.date
-    return df[(df["날짜"] >= start) & (df["날짜"] <= end)]
+def load_community(community, stock, start, end, version):
+    df = get_db().daily(community, stock, start, end)
+    df["날짜"] = df["날짜"].dt.date
+    return df
 
 @st.cache_data
-def load_fng(path, start, end):
-    df = pd.read_csv(path)
-    df["날짜"] = pd.to_datetime(df["date"]).dt.date
-    df = df.rename(columns={"fng_index": "공포-탐욕지수"})
-    return df[(df["날짜"] >= start) & (df["날짜"] <= end)]
+def load_fng(community, stock, start, end, version):
+    df = get_db().fng(community, stock, start, end)
+    df["날짜"] = df["date"].dt.date
+    return df.rename(columns={"fng_index": "공포-탐욕지수"})
 
 # =========================
 # Lightweight Chart Helpers
@@ -206,11 +213,13 @@ ticker = STOCK_INFO[stock_name]
 comm_path = DATA_PATH[community][stock_name]
 
 price_df = load_price(ticker, start, end)
-comm_df = load_community(comm_path, start, end)
+comm_df = load_community(community, stock_name, start, end,
+                         sync_source(comm_path, "daily", community, stock_name))
 
 # 공포–탐욕 지수 병합
 if "공포-탐욕지수" in selected_metrics:
-    fng_df = load_fng(FNG_PATH[community][stock_name], start, end)
+    fng_version = sync_source(FNG_PATH[community][stock_name], "fng", community, stock_name)
+    fng_df = load_fng(community, stock_name, start, end, fng_version)
     comm_df = pd.merge(
         comm_df,
         fng_df[["날짜", "공포-탐욕지수"]],
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# 앱들과 같은 방식으로 저장소 루트를 경로에 추가 (from share.crawler import ...)
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
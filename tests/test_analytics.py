@@ -0,0 +1,69 @@
+import os
+
+import pandas as pd
+
+from share.store.analytics import AnalyticsDB
+
+
+def _write(path, views, mtime):
+    pd.DataFrame({"날짜": ["2025-01-14", "2025-01-15", "2025-01-16"], "조회수": views}).to_csv(
+        path, index=False, encoding="utf-8-sig")
+    os.utime(path, (mtime, mtime))
+
+
+# CSV 가 바뀌면(수정시각/크기) 다시 넣고, 안 바뀌면 CSV 를 열지 않음
+def test_sync_csv_picks_up_changes(tmp_path):
+    db = AnalyticsDB(":memory:")
+    path = str(tmp_path / "daily.csv")
+    _write(path, [1, 2, 3], 1_000_000)
+    assert db.sync_csv(path, "daily", community="FmKorea", stock="삼성전자")
+    assert not db.sync_csv(path, "daily", community="FmKorea", stock="삼성전자")
+
+    _write(path, [10, 20, 30], 2_000_000)
+    assert db.sync_csv(path, "daily", community="FmKorea", stock="삼성전자")
+    df = db.daily("FmKorea", "삼성전자", "2025-01-15", "2025-01-16")
+    assert df["조회수"].tolist() == [20, 30]
+    assert db.daily("FmKorea", "삼성전자", columns=["날짜"])["날짜"].dt.strftime("%Y-%m-%d").tolist() == [
+        "2025-01-14", "2025-01-15", "2025-01-16"]
+
+
+# CSV 를 다시 만들면 그 키의 행을 통째로 바꿈: 빠진 날짜/컬럼은 남지 않음
+def test_sync_csv_replaces_slice(tmp_path):
+    db = AnalyticsDB(":memory:")
+    path = str(tmp_path / "daily.csv")
+    pd.DataFrame({"날짜": ["2025-01-14", "2025-01-15", "2025-01-16"], "조회수": [1, 2, 3], "old": [7, 8, 9]}).to_csv(
+        path, index=False, encoding="utf-8-sig")
+    os.utime(path, (1_000_000, 1_000_000))
+    db.sync_csv(path, "daily", community="FmKorea", stock="삼성전자")
+    db.upsert("daily", pd.DataFrame({"날짜": ["2025-01-14"], "조회수": [5]}), community="DCInside", stock="삼성전자")
+
+    _write(path, [10, 20, 30], 2_000_000)
+    pd.read_csv(path).iloc[:2].to_csv(path, index=False, encoding="utf-8-sig")
+    os.utime(path, (2_000_000, 2_000_000))
+    assert db.sync_csv(path, "daily", community="FmKorea", stock="삼성전자")
+
+    df = db.daily("FmKorea", "삼성전자")
+    assert df["날짜"].dt.strftime("%Y-%m-%d").tolist() == ["2025-01-14", "2025-01-15"]
+    assert df["조회수"].tolist() == [10, 20]
+    assert "old" not in df.columns
+    assert db.daily("DCInside", "삼성전자")["조회수"].tolist() == [5]
+
+
+# 다른 CSV 가 이미 맡은 (table, 키) 로는 동기화하지 않음 (서로 덮어쓰지 않게)
+def test_sync_csv_rejects_second_file_for_same_key(tmp_path):
+    import pytest
+
+    db = AnalyticsDB(":memory:")
+    a, b = str(tmp_path / "a.csv"), str(tmp_path / "b.csv")
+    _write(a, [1, 2, 3], 1_000_000)
+    _write(b, [4, 5, 6], 1_000_000)
+    db.sync_csv(a, "daily", community="FmKorea", stock="삼성전자")
+    with pytest.raises(ValueError):
+        db.sync_csv(b, "daily", community="FmKorea", stock="삼성전자")
+    assert db.daily("FmKorea", "삼성전자")["조회수"].tolist() == [1, 2, 3]
+
+    # 다른 키면 괜찮고, 맡던 파일이 없어지면 넘겨받음
+    assert db.sync_csv(b, "daily", community="FmKorea", stock="b")
+    os.remove(a)
+    assert db.sync_csv(b, "daily", community="FmKorea", stock="삼성전자")
+    assert db.daily("FmKorea", "삼성전자")["조회수"].tolist() == [4, 5, 6]
@@ -0,0 +1,55 @@
+from datetime import date, datetime
+
+import pytest
+import requests
+
+from share.crawler import JsonlSink, read_sink
+from share.crawler.blind import BlindListCollector, collect_list_http, parse_article_cards
+from share.crawler.bench import _GrowingDom
+from share.crawler.mockserver import MockSite, serve
+
+NOW = datetime(2026, 1, 14, 23, 59)
+
+
+def _expected(site, n, start_date, end_date):
+    recs = parse_article_cards(site.blind_cards(0, n), NOW)
+    return [r for r in recs if start_date <= date.fromisoformat(r["date"]) <= end_date]
+
+
+# 가상 스크롤: 지나간 카드가 DOM 에서 빠져도 URL 로 구분하므로 빠짐/중복 없음
+@pytest.mark.parametrize("keep", [None, 40, 20])
+def test_collect_new_tracks_cards_by_url(keep):
+    site = MockSite(posts_per_day=40)
+    start_d, end_d = date(2025, 1, 1), NOW.date()
+    dom = _GrowingDom(site, batch=20, keep=keep)
+    col = BlindListCollector(start_d, end_d, NOW)
+    for _ in range(10):
+        dom.scroll()
+        col.collect_new(dom)
+        col.collect_new(dom)            # 새 카드가 없으면 아무것도 안 함
+    assert col.posts == _expected(site, 200, start_d, end_d)
+    assert col.n_cards == 200
+
+
+def test_collect_list_http_against_mock_server():
+    site = MockSite(n_pages=6, rows_per_page=20, posts_per_day=25)
+    start_d, end_d = date(2026, 1, 12), date(2026, 1, 13)
+    with serve(site) as base:
+        with requests.Session() as s:
+            posts = collect_list_http(s, base + "/kr/search/삼성?page={page}", start_d, end_d,
+                                      sleep_sec=0, now=NOW, verbose=False)
+    assert posts == _expected(site, 120, start_d, end_d)
+    # 1/12 이전 글이 나온 4페이지에서 멈춤 (목록 끝까지 가지 않음)
+    assert posts and site.n_requests == 4
+
+
+def test_collect_list_http_sink(tmp_path):
+    site = MockSite(n_pages=3, rows_per_page=20, posts_per_day=10)
+    start_d, end_d = date(2025, 1, 1), NOW.date()
+    with serve(site) as base:
+        with requests.Session() as s, JsonlSink(str(tmp_path / "blind")) as sink:
+            out = collect_list_http(s, base + "/kr/search/삼성?page={page}", start_d, end_d,
+                                    sleep_sec=0, now=NOW, verbose=False, sink=sink)
+    assert out == []
+    df = read_sink(str(tmp_path / "blind"))
+    assert df.to_dict("records") == _expected(site, 60, start_d, end_d)
@@ -0,0 +1,54 @@
+from share.nlp.cache import TokenCache
+
+
+def _count(cache):
+    return cache.conn.execute("SELECT COUNT(*) FROM tokens").fetchone()[0]
+
+
+def _items(cache, texts):
+    return [(cache.key(t), t.split()) for t in texts]
+
+
+# 행 수는 열 때 한 번만 세고 넣기/덮어쓰기/지우기로 맞춘 값이 실제 COUNT(*) 와 같음
+def test_len_tracks_inserts_and_eviction(tmp_path):
+    path = str(tmp_path / "token_cache.sqlite")
+    with TokenCache(path, "cfg", max_entries=50) as c:
+        c.put_many(_items(c, [f"글 {i}" for i in range(30)]))
+        c.flush()
+        assert len(c) == _count(c) == 30
+
+        # 이미 있는 키 + 새 키: 새 키만 더하고 기존 토큰은 덮어씀
+        c.put_many([(c.key("글 0"), ["바뀜"])] + _items(c, [f"새 {i}" for i in range(10)]))
+        assert len(c) == _count(c) == 40
+        assert c.get_many([c.key("글 0")])[c.key("글 0")] == ["바뀜"]
+        c.flush()
+
+        # 한도를 넘으면 가장 오래 안 쓴 것부터 한도까지만 지움
+        c.get_many([c.key("새 0")])
+        c.put_many(_items(c, [f"더 {i}" for i in range(25)]))
+        c.flush()
+        assert len(c) == _count(c) == 50
+        assert c.key("새 0") in c.get_many([c.key("새 0")])
+
+    with TokenCache(path, "cfg", max_entries=50) as c:
+        assert len(c) == 50
+    with TokenCache(path, "cfg2", max_entries=50) as c:
+        assert len(c) == _count(c) == 0
+
+
+# 밖에서 만든 Kiwi 만 넘기면 사용자 사전을 알 수 없으므로 거부 (캐시 키가 틀어짐)
+def test_external_kiwi_requires_user_words():
+    import pytest
+
+    from share.nlp import KiwiTokenizer
+
+    with pytest.raises(ValueError):
+        KiwiTokenizer(kiwi=object())
+
+    pytest.importorskip("kiwipiepy")
+    from share.nlp import build_kiwi
+
+    words = [("가즈아", "NNP", 0)]
+    tk = KiwiTokenizer(kiwi=build_kiwi(words), user_words=words)
+    assert tk.config_key() == KiwiTokenizer(user_words=words).config_key()
+    assert tk.config_key() != KiwiTokenizer().config_key()
@@ -0,0 +1,68 @@
+import pytest
+import requests
+
+from share.crawler import CrawlState, JsonlSink, crawl_incremental_blind, crawl_incremental_dc, read_sink
+from share.crawler.checkpoint import incremental_pages
+from share.crawler.mockserver import MockSite, serve
+
+
+# 목록 페이지 fetch 를 감싸서 crash_at 페이지에서 예외 (429 / Ctrl-C 흉내)
+def _crashing(fetch, crash_at):
+    def fetch_page(page):
+        if page == crash_at:
+            raise requests.HTTPError("429 Too Many Requests")
+        return fetch(page)
+    return fetch_page
+
+
+def _fake_pages(n_pages, rows=5):
+    def fetch(page):
+        if page > n_pages:
+            return None
+        return [{"post_url": f"u{page}-{i}", "page": page} for i in range(rows)]
+    return fetch
+
+
+def test_sink_resume_keeps_every_row(tmp_path):
+    state = CrawlState(str(tmp_path / "state.sqlite"))
+    fetch = _fake_pages(6)
+    with pytest.raises(requests.HTTPError):
+        with JsonlSink(str(tmp_path / "out"), prefix="run1", flush_rows=10_000) as sink:
+            incremental_pages(_crashing(fetch, 4), state, "t", "kw", sink=sink, verbose=False)
+    assert state.get_cursor("t", "kw")["page"] == 3
+    assert len(read_sink(str(tmp_path / "out"))) == 15
+
+    with JsonlSink(str(tmp_path / "out"), prefix="run2") as sink:
+        incremental_pages(fetch, state, "t", "kw", sink=sink, verbose=False)
+    df = read_sink(str(tmp_path / "out"))
+    assert len(df) == 30
+    assert df["post_url"].is_unique
+    assert state.seen_count("t") == 30
+
+
+def test_without_sink_commits_only_after_finish(tmp_path):
+    state = CrawlState(str(tmp_path / "state.sqlite"))
+    fetch = _fake_pages(6)
+    with pytest.raises(requests.HTTPError):
+        incremental_pages(_crashing(fetch, 4), state, "t", "kw", verbose=False)
+    assert state.seen_count("t") == 0
+    assert state.get_cursor("t", "kw") is None
+
+    rows = incremental_pages(fetch, state, "t", "kw", verbose=False)
+    assert len(rows) == 30
+    assert state.seen_count("t") == 30
+    # 다음 실행: 1페이지가 전부 본 글 → 바로 중단
+    assert incremental_pages(fetch, state, "t", "kw", verbose=False) == []
+
+
+@pytest.mark.parametrize("crawl,keyword", [(crawl_incremental_dc, "kospi"), (crawl_incremental_blind, "삼성")])
+def test_dc_blind_incremental(tmp_path, crawl, keyword):
+    site = MockSite(n_pages=4, rows_per_page=10)
+    state = CrawlState(str(tmp_path / "state.sqlite"))
+    with serve(site) as base:
+        with JsonlSink(str(tmp_path / "out")) as sink:
+            crawl(keyword, state, base_url=base, sleep_sec=0, verbose=False, sink=sink)
+        assert crawl(keyword, state, base_url=base, sleep_sec=0, verbose=False) == []
+    df = read_sink(str(tmp_path / "out"))
+    assert len(df) == 40
+    assert df["post_url"].is_unique
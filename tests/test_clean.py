@@ -0,0 +1,68 @@
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from share.store import clean_posts, daily_counts, parse_counts, parse_kor_dates
+
+NOW = datetime(2026, 1, 14, 23, 59)
+
+
+# parse_kor_dates 주석의 표기 표 그대로
+def test_parse_kor_dates_formats():
+    cases = {
+        "17:27": "2026-01-14 17:27",
+        "5분": "2026-01-14 23:54",
+        "3시간": "2026-01-14 20:59",
+        "3시간 전": "2026-01-14 20:59",
+        "2일": "2026-01-12 23:59",
+        "방금": "2026-01-14 23:59",
+        "어제": "2026-01-13 23:59",
+        "그제": "2026-01-12 23:59",
+        "2025.01.14": "2025-01-14",
+        "2025-01-14 11:07": "2025-01-14 11:07",
+        "2025-01-14 11:07:05": "2025-01-14 11:07:05",
+        "25.01.14": "2025-01-14",
+        "01.14": "2026-01-14",
+        "01.13": "2026-01-13",
+        "12.30": "2025-12-30",           # 수집일보다 뒤 → 전년도
+        "작성시간 3시간": "2026-01-14 20:59",
+    }
+    got = parse_kor_dates(pd.Series(list(cases)), NOW)
+    assert got.tolist() == [pd.Timestamp(v) for v in cases.values()]
+
+
+def test_parse_kor_dates_unparsed_and_row_reference():
+    got = parse_kor_dates(pd.Series(["", "abc", None, "13.45", "02.30"]), NOW)
+    assert got.isna().all()
+
+    # 행별 수집 시각: 같은 "01.14" 도 수집일이 1월 10일이면 전년도
+    s = pd.Series(["01.14", "01.14", "17:27"])
+    crawled = pd.Series(pd.to_datetime(["2026-01-14 12:00", "2026-01-10 12:00", "2026-01-10 12:00"]))
+    assert parse_kor_dates(s, crawled).tolist() == [
+        pd.Timestamp("2026-01-14"), pd.Timestamp("2025-01-14"), pd.Timestamp("2026-01-10 17:27")]
+
+
+def test_parse_counts():
+    s = pd.Series(["15,720", "조회 수 1,234", "-", None, "7"])
+    assert parse_counts(s).tolist() == [15720, 1234, 0, 0, 7]
+    assert parse_counts(pd.Series([1, 2, np.nan])).tolist() == [1, 2, 0]
+
+
+# DC 목록 원본(gall_date / gall_count 문자열) → 정제 → 일별 집계
+def test_clean_posts_dc_raw():
+    dc = pd.DataFrame({
+        "date": ["17:27", "01.13", "25.12.31", "01.13"],
+        "view_count": ["1,024", "15", "-", "3"],
+        "recommend_count": ["0", "2", "1", "0"],
+        "crawled_at": [NOW] * 4,
+    })
+    out = clean_posts(dc, date_col="date", count_cols=["view_count", "recommend_count"], crawled_at="crawled_at")
+    assert out["view_count"].tolist() == [1024, 15, 0, 3]
+    assert out["date"].dt.strftime("%Y-%m-%d").tolist() == ["2026-01-14", "2026-01-13", "2025-12-31", "2026-01-13"]
+
+    counts = daily_counts(dc.rename(columns={"date": "날짜", "view_count": "조회", "recommend_count": "추천"}),
+                          crawled_at=NOW)
+    assert counts.index.strftime("%Y-%m-%d").tolist() == ["2025-12-31", "2026-01-13", "2026-01-14"]
+    assert counts["게시글수"].tolist() == [1, 2, 1]
+    assert counts["조회수"].tolist() == [0, 18, 1024]
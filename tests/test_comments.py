@@ -0,0 +1,48 @@
+import pandas as pd
+
+from share.store.comments import flatten_comments
+
+
+def _post(url, date, n):
+    return {"post_url": url, "date": date,
+            "comments": [{"nickname": f"n{i}", "comment": f"c{i}", "like": i} for i in range(n)]}
+
+
+def test_empty_or_bad_keys_are_dropped():
+    posts = pd.DataFrame([
+        _post("https://www.fmkorea.com/101", "", 2),
+        _post("https://www.fmkorea.com/102", "날짜없음", 2),
+        _post("https://www.fmkorea.com/abc", "2025-11-01", 2),
+        _post("https://www.fmkorea.com/103", "2025-11-01", 3),
+    ])
+    cm = flatten_comments(posts)
+    assert cm["post_id"].tolist() == [103, 103, 103]
+    assert cm["comment_no"].tolist() == [0, 1, 2]
+
+
+def test_only_bad_posts():
+    cm = flatten_comments(pd.DataFrame([_post("https://www.fmkorea.com/101", "", 2)]))
+    assert cm.empty
+
+
+def test_duplicate_post_is_counted_once():
+    posts = pd.DataFrame([
+        _post("https://www.fmkorea.com/101", "2025-11-01", 2),
+        _post("https://www.fmkorea.com/102", "2025-11-01", 1),
+        _post("https://www.fmkorea.com/101", "2025-11-01", 3),
+    ])
+    cm = flatten_comments(posts)
+    assert len(cm) == 4
+    assert cm.groupby("post_id")["comment_no"].max().to_dict() == {101: 2, 102: 0}
+    assert not cm.duplicated(["post_id", "comment_no"]).any()
+
+
+# 날짜 표기가 섞여도 (FmKorea "2025.11.01", 엔진 "2025-11-01", 상대 "17:27") 댓글이 빠지지 않음
+def test_mixed_date_formats():
+    posts = pd.DataFrame([
+        _post("https://www.fmkorea.com/101", "2025.11.01", 2),
+        _post("https://www.fmkorea.com/102", "2025-11-01 10:30:00", 1),
+        _post("https://www.fmkorea.com/103", "17:27", 1),
+    ])
+    cm = flatten_comments(posts, crawled_at="2025-11-02 23:00")
+    assert cm["date"].tolist() == ["2025-11-01"] * 3 + ["2025-11-02"]
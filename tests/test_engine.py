@@ -0,0 +1,54 @@
+from share.crawler import Crawler, DedupRegistry, FmKoreaAdapter
+from share.crawler.mockserver import MockSite, serve
+
+
+# 같은 호출 안의 중복 글은 한 번만 요청하고, 반환은 입력과 같은 길이·순서
+def test_crawl_details_keeps_duplicates_in_place():
+    site = MockSite(n_pages=2, rows_per_page=5, comments_per_post=2)
+    with serve(site) as base:
+        fm = FmKoreaAdapter(base)
+        crawler = Crawler(sleep_sec=0, verbose=False, registry=DedupRegistry())
+        posts = crawler.crawl_list(fm, "하이닉스", 1, 1)
+        given = posts + posts[:3]
+        n_list = site.n_requests
+        got = crawler.crawl_details(fm, given, workers=2)
+
+    assert site.n_requests - n_list == len(posts)
+    assert [p["post_url"] for p in got] == [p["post_url"] for p in given]
+    assert all(p["content"] for p in got)
+    assert got[len(posts):] == got[:3]
+
+
+# 이전 실행에서 상세를 가져온 글은 요청 없이 입력 그대로 돌려줌
+def test_crawl_details_returns_done_posts_unchanged(tmp_path):
+    path = str(tmp_path / "dedup.sqlite")
+    site = MockSite(n_pages=2, rows_per_page=6, comments_per_post=2)
+    with serve(site) as base:
+        fm = FmKoreaAdapter(base)
+        with DedupRegistry(path) as reg:
+            crawler = Crawler(sleep_sec=0, verbose=False, registry=reg)
+            posts = crawler.crawl_list(fm, "하이닉스", 1, 1)
+            crawler.crawl_details(fm, posts[:4], workers=2)
+
+        with DedupRegistry(path) as reg:
+            crawler = Crawler(sleep_sec=0, verbose=False, registry=reg)
+            n_before = site.n_requests
+            got = crawler.crawl_details(fm, posts, workers=2)
+
+    assert site.n_requests - n_before == len(posts) - 4
+    assert got[:4] == posts[:4]
+    assert all(p["content"] for p in got[4:])
+
+
+
+# 검색 URL 은 노트북과 같은 파라미터: 일반 검색은 category 포함, 인기글은 없음
+def test_fmkorea_list_url_matches_notebooks():
+    fm = FmKoreaAdapter()
+    assert fm.list_url("삼성전자", 3) == (
+        "https://www.fmkorea.com/search.php?mid=stock&category=2997203870"
+        "&search_keyword=%EC%82%BC%EC%84%B1%EC%A0%84%EC%9E%90&search_target=title_content&listStyle=list&page=3")
+
+    pop = FmKoreaAdapter(sort="pop").list_url("삼성전자", 1)
+    assert "category=" not in pop and pop.endswith("&sort_index=pop&order_type=desc")
+    assert "category=" not in FmKoreaAdapter(category="").list_url("삼성전자", 1)
+    assert "&category=123&" in FmKoreaAdapter(sort="pop", category="123").list_url("삼성전자", 1)
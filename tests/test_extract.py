@@ -0,0 +1,57 @@
+import os
+from datetime import datetime
+
+import pytest
+
+from share.crawler import blind, dc
+from share.crawler.fmkorea import parse_list_page, parse_post_detail_html
+from share.crawler.mockserver import MockSite
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+BACKENDS = ["lxml", "selectolax"]
+
+PARSERS = {
+    "fmkorea_list": lambda h, b: parse_list_page(h, "하닉", today="2026-01-14", backend=b),
+    "fmkorea_detail": lambda h, b: parse_post_detail_html(h, "https://www.fmkorea.com/1", today="2026-01-14",
+                                                          backend=b),
+    "dc_list": lambda h, b: dc.parse_gall_list(h, backend=b),
+    "blind_cards": lambda h, b: blind.parse_article_cards(h, now=datetime(2026, 1, 14, 23, 59), backend=b),
+}
+
+
+def _fixture(kind):
+    with open(os.path.join(FIXTURES, f"{kind}.html"), encoding="utf-8") as f:
+        return f.read()
+
+
+# 저장해 둔 페이지: 백엔드마다 bs4 와 같은 레코드
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("kind", list(PARSERS))
+def test_fixture_parity(kind, backend):
+    html = _fixture(kind)
+    parse = PARSERS[kind]
+    expected = parse(html, "bs4")
+    assert expected
+    assert parse(html, backend) == expected
+
+
+# MockSite 가 만든 여러 페이지 (목록 끝 / 빈 페이지 포함)
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_mocksite_parity(backend):
+    site = MockSite(n_pages=3, rows_per_page=10, comments_per_post=7)
+    pages = {
+        "fmkorea_list": [site.fmkorea_list(p) for p in range(0, 5)],
+        "fmkorea_detail": [site.fmkorea_post(9_000_000_000 - i) for i in range(3)],
+        "dc_list": [site.dc_list(p) for p in range(0, 5)],
+        "blind_cards": [site.blind_cards(k, 25) for k in (0, 200, 5000)] + [site.blind_cards(0, 0)],
+    }
+    for kind, htmls in pages.items():
+        parse = PARSERS[kind]
+        for h in htmls:
+            assert parse(h, backend) == parse(h, "bs4"), kind
+
+
+def test_no_table_is_end_of_list():
+    html = "<html><body><p>검색 결과가 없습니다</p></body></html>"
+    for b in ["bs4"] + BACKENDS:
+        assert parse_list_page(html, "하닉", backend=b) is None
@@ -0,0 +1,27 @@
+import re
+
+from share.crawler.metrics import CrawlMetrics
+
+
+# 텍스트 형식: family 하나의 줄은 한 묶음이고 # TYPE 이 그 바로 앞에 한 번
+def test_prometheus_families_are_grouped():
+    m = CrawlMetrics()
+    for site, kw in [("fmkorea", "하이닉스"), ("dc", "kospi"), ("fmkorea", "삼전")]:
+        m.observe_request(site, kw, 0.12, 1000, 200)
+        m.observe_request(site, kw, 0.5, 0, 429, retries=1)
+        m.observe_parse(site, kw, 0.01, 20)
+
+    lines = m.prometheus().strip().split("\n")
+    families = []
+    for line in lines:
+        if line.startswith("# TYPE "):
+            families.append(line.split()[2])
+            continue
+        name = re.match(r"[a-z_]+", line).group()
+        fam = name if name == families[-1] else re.sub(r"_(bucket|sum|count)$", "", name)
+        assert fam == families[-1], line
+    assert len(families) == len(set(families)) == 7
+    assert lines[0] == "# TYPE crawler_request_latency_seconds histogram"
+
+    rows = [line for line in lines if line.startswith("crawler_rows_total")]
+    assert [re.search(r'site="(\w+)"', r).group(1) for r in rows] == ["dc", "fmkorea", "fmkorea"]
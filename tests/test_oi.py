@@ -0,0 +1,180 @@
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from share.store.bench import _daily, naive_causal_oi
+from share.store.oi import METRICS, OI_COLUMN, Z_COLUMNS, CausalOI, DailyOI, causal_oi
+
+COLS = Z_COLUMNS + [OI_COLUMN]
+
+
+def _close(got, expected):
+    for col in COLS:
+        np.testing.assert_allclose(got[col].to_numpy("float64"), expected[col].to_numpy("float64"),
+                                   rtol=1e-9, atol=1e-9, err_msg=col)
+
+
+@pytest.mark.parametrize("window", [None, 2, 7, 60])
+def test_causal_matches_naive(window):
+    daily = _daily(200, seed=3)
+    _close(CausalOI(window).run(daily), naive_causal_oi(daily, window))
+
+
+# 앞부분 run → to_dict/from_dict → 나머지 하루씩 push 해도 한 번에 run 한 것과 같아야 함
+@pytest.mark.parametrize("window", [None, 30])
+def test_causal_run_restore_push(window):
+    daily = _daily(120, seed=4)
+    half = 70
+    cz = CausalOI(window)
+    head = cz.run(daily.iloc[:half])
+    cz = CausalOI.from_dict(cz.to_dict())
+    tail = [cz.push(d, r) for d, r in zip(daily["날짜"].iloc[half:], daily[METRICS].iloc[half:].to_dict("records"))]
+    live = pd.concat([head, pd.DataFrame(tail)], ignore_index=True)
+    _close(live, naive_causal_oi(daily, window))
+
+
+def test_causal_push_rejects_past_date():
+    cz = CausalOI(7)
+    cz.push("2025-01-02", dict.fromkeys(METRICS, 1))
+    with pytest.raises(ValueError):
+        cz.push("2025-01-01", dict.fromkeys(METRICS, 1))
+
+
+# 그룹별 causal_oi = 그룹마다 따로 naive 재계산
+def test_causal_oi_groups():
+    parts = []
+    for i, (community, stock) in enumerate([("fmkorea", "하이닉스"), ("dc", "삼성전자")]):
+        parts.append(_daily(90, seed=10 + i).assign(community=community, stock=stock))
+    oi = pd.concat(parts, ignore_index=True)
+    got = causal_oi(oi, window=20)
+    for (community, stock), g in oi.groupby(["community", "stock"]):
+        sel = got[(got["community"] == community) & (got["stock"] == stock)].reset_index(drop=True)
+        _close(sel, naive_causal_oi(g.reset_index(drop=True), 20))
+
+
+# 창을 오래 밀어도 오차가 쌓이지 않음: 같은 값 두 개인 창의 z 는 정확히 0
+def test_causal_rolling_no_drift():
+    rng = np.random.default_rng(0)
+    cz = CausalOI(2)
+    day = pd.Timestamp("2020-01-01")
+    for i in range(5000):
+        x = int(rng.integers(0, 10_000_000))
+        cz.push(day, dict.fromkeys(METRICS, x))
+        row = cz.push(day + pd.Timedelta(days=1), dict.fromkeys(METRICS, x))
+        day += pd.Timedelta(days=2)
+    assert all(row[zc] == 0.0 for zc in Z_COLUMNS)
+
+
+# ---------- DailyOI vs notebook (fmkorea_normalization.ipynb) ----------
+START, END = date(2025, 1, 14), date(2026, 1, 14)
+
+
+def _to_int_series(s):
+    s = s.astype(str).str.replace(",", "", regex=False)
+    return s.str.extract(r"(\d+)")[0].fillna("0").astype(int)
+
+
+def _zscore(s):
+    sd = s.std(ddof=1)
+    if sd == 0 or np.isnan(sd):
+        return pd.Series(np.zeros(len(s)), index=s.index)
+    return (s - s.mean()) / sd
+
+
+# notebook 의 add_overheat_index(daily_aggregate(csv)) 를 DataFrame 입력으로
+def _notebook_oi(posts, start_date, end_date):
+    df = posts.rename(columns={"날짜": "date", "제목": "title", "조회": "views", "추천": "likes", "댓글수": "comments"})
+    df["date_dt"] = pd.to_datetime(df["date"], errors="coerce").dt.date
+    df = df.dropna(subset=["date_dt"])
+    df = df[(df["date_dt"] >= start_date) & (df["date_dt"] <= end_date)]
+    for col in ["views", "likes", "comments"]:
+        df[col] = _to_int_series(df[col])
+    daily = df.groupby("date_dt", as_index=False).agg(
+        posts=("title", "size"), views=("views", "sum"), comments=("comments", "sum"), likes=("likes", "sum"))
+    full = pd.DataFrame({"date_dt": pd.date_range(start_date, end_date, freq="D").date})
+    daily = full.merge(daily, on="date_dt", how="left").fillna(0)
+    d = pd.DataFrame({
+        "날짜": pd.to_datetime(daily["date_dt"]).dt.strftime("%Y-%m-%d"),
+        "게시글수": daily["posts"].astype(int), "조회수": daily["views"].astype(int),
+        "댓글수": daily["comments"].astype(int), "좋아요수": daily["likes"].astype(int),
+    })
+    for m in ["조회수", "게시글수", "댓글수", "좋아요수"]:
+        d[m + "_z"] = _zscore(d[m])
+    d["과열지수_OI"] = 0.25 * d["조회수_z"] + 0.25 * d["게시글수_z"] + 0.30 * d["댓글수_z"] + 0.20 * d["좋아요수_z"]
+    return d
+
+
+def _posts(first, last, n=5000, seed=0):
+    rng = np.random.default_rng(seed)
+    days = pd.Timestamp(first) + pd.to_timedelta(rng.integers(0, (last - first).days + 1, n), unit="D")
+    days = days[days.dayofweek < 5]          # 글 없는 날
+    n = len(days)
+    return pd.DataFrame({
+        "제목": "t", "날짜": days.strftime("%Y-%m-%d"),
+        "조회": [f"{x:,}" for x in rng.integers(0, 50_000, n)],
+        "추천": rng.integers(0, 30, n), "댓글수": rng.integers(0, 40, n),
+    }).sort_values("날짜")
+
+
+def _same_frame(got, expected):
+    assert got["날짜"].tolist() == expected["날짜"].tolist()
+    for col in METRICS:
+        assert got[col].tolist() == expected[col].tolist(), col
+    _close(got, expected)
+
+
+# start 만 줘도 첫 글 날짜가 아니라 start 부터 0 으로 채움 (notebook 의 START_DATE)
+def test_daily_oi_start_only_matches_notebook():
+    posts = _posts(date(2025, 3, 2), END)
+    oi = DailyOI(start=START)
+    for _, g in posts.groupby("날짜"):
+        oi.update(g)
+    assert oi.frame()["날짜"].iloc[0] == START.isoformat()
+    _same_frame(oi.frame(), _notebook_oi(posts, START, END))
+
+
+def test_daily_oi_start_end_matches_notebook():
+    posts = _posts(date(2024, 12, 1), date(2025, 11, 30), seed=1)
+    oi = DailyOI(START, END)
+    oi.update(posts)
+    _same_frame(oi.frame(), _notebook_oi(posts, START, END))
+
+    restored = DailyOI.from_dict(oi.to_dict())
+    _same_frame(restored.frame(), _notebook_oi(posts, START, END))
+
+
+# 모든 날이 같은 값으로 끝나면 (표준편차 0) notebook 처럼 z = 0 정확히 — 여러 번 교체해도 오차가 안 쌓임
+def test_daily_oi_constant_series_after_many_updates():
+    import json
+
+    oi = DailyOI("2025-01-01", "2025-01-10")
+    days = pd.date_range("2025-01-01", "2025-01-10")
+    rng = np.random.default_rng(0)
+    for _ in range(200):
+        oi.add_counts(pd.DataFrame({"게시글수": 1, "조회수": 12_345, "댓글수": 7, "좋아요수": 3}, index=days))
+        # 중간에 일부 날짜만 먼저 올라가 분산이 생겼다가 다시 맞춰지는 경우
+        pick = days[rng.random(len(days)) < 0.3]
+        extra = pd.DataFrame({"게시글수": 0, "조회수": 987_654_321, "댓글수": 0, "좋아요수": 0}, index=pick)
+        oi.add_counts(extra)
+        oi.add_counts(pd.DataFrame({"게시글수": 0, "조회수": 987_654_321, "댓글수": 0, "좋아요수": 0},
+                                   index=days.difference(pick)))
+
+    df = oi.frame()
+    assert (df[Z_COLUMNS + [OI_COLUMN]].to_numpy() == 0).all()
+    assert oi.row("2025-01-05")["조회수_z"] == 0.0
+
+    restored = DailyOI.from_dict(json.loads(json.dumps(oi.to_dict())))
+    assert restored.to_dict() == oi.to_dict()
+    assert (restored.frame()[Z_COLUMNS].to_numpy() == 0).all()
+
+
+# 예전 상태 파일(Welford n/mean/m2)도 일별 값으로 통계를 다시 만들어 읽음
+def test_daily_oi_from_legacy_state():
+    posts = _posts(date(2025, 2, 1), date(2025, 6, 30), n=500, seed=3)
+    oi = DailyOI(START, date(2025, 6, 30))
+    oi.update(posts)
+    state = oi.to_dict()
+    state["stats"] = {m: [s.n, s.mean, 0.5] for m, s in oi.stats.items()}
+    _same_frame(DailyOI.from_dict(state).frame(), oi.frame())
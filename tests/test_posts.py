@@ -0,0 +1,53 @@
+from datetime import date, datetime
+
+import pandas as pd
+
+from share.store import PostStore, to_store_frame
+
+NOW = datetime(2026, 1, 14, 23, 59)
+
+
+def _dates(df):
+    return df["날짜"].dt.strftime("%Y-%m-%d %H:%M").tolist()
+
+
+# FmKorea CSV / DC 목록 원본 / Blind 카드 / 공통 엔진 표기가 섞여도 행을 잃지 않음
+def test_to_store_frame_mixed_site_dates():
+    fm = pd.DataFrame({"날짜": ["2025.01.14", "2025.01.13", "2025-01-12 11:07", "17:27", "2025.01.10"],
+                       "조회": ["1,024", "5", "0", "12", "7"], "post_url": list("abcde")})
+    out = to_store_frame(fm, crawled_at=NOW)
+    assert _dates(out) == ["2025-01-14 00:00", "2025-01-13 00:00", "2025-01-12 11:07",
+                           "2026-01-14 17:27", "2025-01-10 00:00"]
+    assert out["조회"].tolist() == [1024, 5, 0, 12, 7]
+
+    dc = pd.DataFrame({"date": ["17:27", "01.13", "25.01.14", "12.30"], "view_count": ["1,000", "2", "-", "4"],
+                       "post_url": list("fghi")})
+    out = to_store_frame(dc, crawled_at=NOW)
+    assert _dates(out) == ["2026-01-14 17:27", "2026-01-13 00:00", "2025-01-14 00:00", "2025-12-30 00:00"]
+    assert out["조회"].tolist() == [1000, 2, 0, 4]
+
+    blind = pd.DataFrame({"date": ["3시간", "어제", "2025.01.10", "25.01.09"], "url": list("jklm"),
+                          "crawled_at": [NOW] * 4})
+    assert _dates(to_store_frame(blind)) == ["2026-01-14 20:59", "2026-01-13 23:59",
+                                             "2025-01-10 00:00", "2025-01-09 00:00"]
+
+    engine = pd.DataFrame({"date": ["2025-01-14 11:07:00", "2025-01-13", "2025.01.12"], "post_url": list("nop")})
+    assert len(to_store_frame(engine, crawled_at=NOW)) == 3
+
+
+def test_to_store_frame_reports_dropped_rows(capsys):
+    out = to_store_frame(pd.DataFrame({"날짜": ["2025.01.14", "", "모름"], "post_url": list("abc")}),
+                         crawled_at=NOW)
+    assert out["post_url"].tolist() == ["a"]
+    assert "2행 제외" in capsys.readouterr().out
+
+
+# 파일 가져오기: 상대 표기는 crawled_at(기본은 파일 수정 시각) 기준 파티션으로
+def test_import_csv_uses_crawl_time(tmp_path):
+    path = tmp_path / "dc.csv"
+    pd.DataFrame({"date": ["17:27", "01.13"], "post_url": ["a", "b"]}).to_csv(path, index=False)
+    store = PostStore(str(tmp_path / "posts"))
+    assert store.import_csv(str(path), "DCInside", "삼성전자", crawled_at=NOW) == 2
+    got = store.read("DCInside", "삼성전자", start=date(2026, 1, 1))
+    assert sorted(got["post_url"]) == ["a", "b"]
+    assert sorted(store.partitions()["date"]) == ["2026-01-13", "2026-01-14"]
@@ -0,0 +1,50 @@
+from share.crawler import AutoThrottle, CrawlScheduler, Crawler, FmKoreaAdapter, SessionPool, ThrottledCrawler
+from share.crawler.mockserver import MockSite, serve
+
+KEYWORDS = ["하이닉스", "하닉", "삼성전자"]
+
+
+def _expected(pages):
+    with serve(MockSite(n_pages=pages)) as base:
+        fm = FmKoreaAdapter(base)
+        crawler = Crawler(sleep_sec=0, verbose=False)
+        return {("fmkorea", kw): crawler.crawl_list(fm, kw, 1, pages + 1) for kw in KEYWORDS}
+
+
+def _scheduler(workers=6, max_attempts=5):
+    throttle = AutoThrottle(start_delay=0.01, max_delay=0.5, max_concurrency=workers)
+    crawler = ThrottledCrawler(throttle, SessionPool(retries=0, retry_statuses=()), verbose=False)
+    return CrawlScheduler(crawler, workers=workers, max_attempts=max_attempts), throttle
+
+
+# 초당 한도를 넘기면 429 를 주는 서버: 429 를 받고도 결과는 빠짐없이
+def test_scheduler_complete_under_rate_limit():
+    pages = 8
+    expected = _expected(pages)
+    site = MockSite(n_pages=pages, rate_limit=10)
+    with serve(site) as base:
+        fm = FmKoreaAdapter(base)
+        sched, throttle = _scheduler(max_attempts=50)
+        for kw in KEYWORDS:
+            sched.add(fm, kw, 1, pages + 1)
+        results, failed = sched.run()
+
+    assert site.n_throttled > 0
+    assert sum(h["throttled"] for h in throttle.summary().values()) == site.n_throttled
+    assert failed == []
+    assert results == expected
+
+
+# max_attempts 를 넘긴 페이지는 실패 목록으로 돌려줌
+def test_scheduler_reports_failed_pages():
+    site = MockSite(n_pages=3, error_rate=1.0)
+    with serve(site) as base:
+        fm = FmKoreaAdapter(base)
+        sched, _ = _scheduler(workers=2, max_attempts=2)
+        for kw in KEYWORDS:
+            sched.add(fm, kw, 1, 4)
+        results, failed = sched.run()
+
+    assert sorted(failed) == sorted(("fmkorea", kw, 1, 500) for kw in KEYWORDS)
+    assert all(posts == [] for posts in results.values())
+    assert site.n_errors == 2 * len(KEYWORDS)
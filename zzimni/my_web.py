@@ -1,9 +1,12 @@
 import os
+import sys
 import pandas as pd
 import streamlit as st
-import FinanceDataReader as fdr
 from streamlit_lightweight_charts import renderLightweightCharts
 
+sys.path.append("..")
+from share.store import get_db
+
 # =========================
 # 기본 설정
 # =========================
@@ -29,19 +32,23 @@ oi_dir = st.sidebar.text_input(
 )
 
 # =========================
-# 종목 설정
+# 종목 설정 (stock: 공용 분석 DB 의 종목 키, 대시보드끼리 같은 이름)
 # =========================
+COMMUNITY = "DCInside"
 STOCKS = {
     "삼성전자": {
         "ticker": "005930",
+        "stock": "삼성전자",
         "csv": "삼성전자_일별집계_OI_2025-01-14_2026-01-14.csv",
     },
     "하이닉스": {
         "ticker": "000660",
+        "stock": "SK하이닉스",
         "csv": "하이닉스_일별집계_OI_2025-01-14_2026-01-14.csv",
     },
     "현대차": {
         "ticker": "005380",
+        "stock": "현대차",
         "csv": "현대차_일별집계_OI_2025-01-14_2026-01-14.csv",
     },
 }
@@ -86,18 +93,12 @@ selected_metrics = st.sidebar.multiselect(
 # =========================
 @st.cache_data
 def load_price_data(ticker, start_date, end_date):
-    df = fdr.DataReader(ticker, str(start_date), str(end_date)).reset_index()
-    return df
+    return get_db().ohlcv(ticker, start_date, end_date)
 
+# 기간 조회는 공용 분석 DB 에서. version(CSV 수정시각)이 캐시 키에 들어가서 CSV 가 바뀌면 다시 조회
 @st.cache_data
-def load_oi_csv(csv_path, start_date, end_date):
-    df = pd.read_csv(csv_path, encoding="utf-8-sig")
-    df["날짜"] = pd.to_datetime(df["날짜"])
-    df = df[
-        (df["날짜"].dt.date >= start_date) &
-        (df["날짜"].dt.date <= end_date)
-    ].sort_values("날짜")
-    return df
+def load_oi(stock, start_date, end_date, version):
+    return get_db().daily(COMMUNITY, stock, start_date, end_date)
 
 # =========================
 # 시리즈 생성
@@ -190,8 +191,11 @@ if not os.path.exists(csv_path):
     st.error(f"CSV 파일을 찾을 수 없습니다: {csv_path}")
     st.stop()
 
+# CSV 가 바뀌었을 때만 DB 로 다시 넣음 (캐시 함수 밖에서 매번 확인)
+get_db().sync_csv(csv_path, "daily", community=COMMUNITY, stock=stock["stock"])
+
 price_df = load_price_data(stock["ticker"], start, end)
-oi_df = load_oi_csv(csv_path, start, end)
+oi_df = load_oi(stock["stock"], start, end, os.path.getmtime(csv_path))
 
 oi_series = build_oi_series(oi_df, selected_metrics)
 